@@ -1,23 +1,23 @@
 import requests
 from bs4 import BeautifulSoup
 import time
+import os
+import sys
+
+# 공용 HTTP 모듈(chap05/crawler_http.py) 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'chap05'))
+from crawler_http import fetch_text
 
 def crawl_naver_blog_titles(query_url):
     """
     네이버 블로그 검색 결과에서 제목을 크롤링하는 함수
     """
     try:
-        # 헤더 설정 (봇 차단 방지)
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        # 요청 보내기
-        response = requests.get(query_url, headers=headers)
-        response.raise_for_status()  # HTTP 오류 확인
+        # 요청 보내기 (HTTP 오류 확인 포함)
+        html = fetch_text(query_url)
         
         # BeautifulSoup으로 HTML 파싱
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(html, 'html.parser')
         
         # 블로그 제목 요소 찾기
         blog_titles = []
@@ -8,6 +8,11 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout
 from PyQt5.QtCore import QThread, pyqtSignal, Qt
 from PyQt5.QtGui import QFont, QIcon
 import urllib.parse
+import os
+
+# 공용 HTTP 모듈(chap05/crawler_http.py) 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'chap05'))
+from crawler_http import fetch_text
 
 class ScrapingWorker(QThread):
     """크롤링 작업을 별도 스레드에서 실행하는 클래스"""
@@ -44,19 +49,13 @@ class ScrapingWorker(QThread):
     def crawl_naver_blog_titles(self, query_url):
         """네이버 블로그 검색 결과에서 제목을 크롤링하는 함수"""
         try:
-            # 헤더 설정 (봇 차단 방지)
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
             self.progress.emit("HTML 데이터를 분석하는 중...")
             
-            # 요청 보내기
-            response = requests.get(query_url, headers=headers)
-            response.raise_for_status()
+            # 요청 보내기 (공용 세션으로 연결 재사용)
+            html = fetch_text(query_url)
             
             # BeautifulSoup으로 HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(html, 'html.parser')
             
             # 블로그 제목 요소 찾기
             blog_titles = []
@@ -3,7 +3,7 @@
 
 a = Analysis(
     ['네이버블로그기사크롤링_GUI.py'],
-    pathex=[],
+    pathex=['../chap05'],
     binaries=[],
     datas=[],
     hiddenimports=[],
@@ -1,18 +1,37 @@
 import requests
-from bs4 import BeautifulSoup
 import time
 import urllib.parse
+import os
+import sys
 
-def crawl_clien_market(search_keyword="", max_pages=10):
-    """클리앙 중고장터의 매물 제목을 크롤링하는 함수"""
+# 공용 HTTP 모듈(chap05/crawler_http.py) 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'chap05'))
+from crawler_http import fetch_text
+from listing_dedup import ListingDeduper
+from listing_parse import listings_frame, parse_listings
+from seen_index import IncrementalCrawl, SeenPostIndex, listing_scope
+
+def crawl_clien_market(search_keyword="", max_pages=10, dedup_by_post_id=False, incremental=False, seen_index=None,
+                       as_frame=False):
+    """
+    클리앙 중고장터의 매물 제목을 크롤링하는 함수
+    
+    dedup_by_post_id=True이면 제목 대신 게시글 번호로 중복을 판단합니다.
+    (같은 제목으로 다시 올린 다른 글도 따로 수집)
+    incremental=True이면 지난 크롤링 이후 새로 올라온 매물만 반환하고,
+    이미 본 매물이 나온 페이지에서 멈춥니다. (본 게시글 번호는 seen_index에 저장)
+    
+    매물마다 제목, 페이지와 함께 게시글 번호, 링크, 분류, 작성자, 작성일시, 조회수를 수집합니다.
+    as_frame=True이면 dict 목록 대신 가격(원)까지 타입별 컬럼으로 정리한 DataFrame을 반환합니다.
+    """
     
     base_url = "https://www.clien.net/service/board/sold"
     all_titles = []
-    
-    # 헤더 설정 (웹사이트에서 차단을 방지하기 위해)
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+    seen = ListingDeduper(by_post_id=dedup_by_post_id)
+    crawl = None
+    if incremental:
+        crawl = IncrementalCrawl(seen_index or SeenPostIndex(), listing_scope('sold', search_keyword))
+    failed_pages = []
     
     print(f"{'검색어: ' + search_keyword if search_keyword else '전체 매물'} 크롤링 시작...")
     print(f"총 {max_pages}페이지를 크롤링합니다.")
@@ -35,46 +54,51 @@ def crawl_clien_market(search_keyword="", max_pages=10):
             
             print(f"페이지 {page} 크롤링 중...")
             
-            # 웹페이지 요청
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 매물 제목 요소 찾기
-            titles = soup.find_all('span', class_='subject_fixed')
+            # 웹페이지 요청 (공용 세션으로 연결 재사용)
+            html = fetch_text(url)
             
-            if not titles:
-                # 다른 클래스명으로 시도
-                titles = soup.find_all('a', class_='list_subject')
+            # HTML 파싱 (매물 행마다 제목, 게시글 번호, 링크, 작성자 등을 한 번에 추출)
+            listings = parse_listings(html, page)
             
-            if not titles:
-                # 또 다른 클래스명으로 시도
-                titles = soup.select('td.post_subject a')
+            if crawl is not None:
+                new_ids, reached_seen = crawl.check_page([listing['post_id'] for listing in listings])
             
             page_titles = []
-            for title in titles:
-                title_text = title.get_text(strip=True)
-                if title_text and title_text not in [t['title'] for t in all_titles]:
-                    page_titles.append({
-                        'title': title_text,
-                        'page': page
-                    })
+            for listing in listings:
+                post_id = listing['post_id']
+                # 증분 모드: 지난 크롤링에서 이미 본 매물 제외
+                if crawl is not None and post_id is not None and post_id not in new_ids:
+                    continue
+                # 이미 수집한 매물인지 set으로 바로 확인 (페이지가 밀려 다시 나온 매물 제외)
+                if seen.add(listing['title'], listing['url']):
+                    page_titles.append(listing)
             
             all_titles.extend(page_titles)
             print(f"페이지 {page}: {len(page_titles)}개 매물 발견")
             
+            if crawl is not None and reached_seen:
+                print("이미 본 매물까지 도달했습니다. 다음 페이지는 크롤링하지 않습니다.")
+                break
+            
             # 페이지 간 요청 간격 (서버 부하 방지)
             time.sleep(1)
             
         except requests.RequestException as e:
             print(f"페이지 {page} 요청 중 오류 발생: {e}")
+            failed_pages.append(page)
             continue
         except Exception as e:
             print(f"페이지 {page} 크롤링 중 오류 발생: {e}")
+            failed_pages.append(page)
             continue
     
+    if crawl is not None:
+        # 실패한 페이지가 있으면 기록하지 않음 (다음 크롤링에서 빠진 구간을 다시 읽음)
+        if failed_pages:
+            print(f"실패한 페이지({', '.join(map(str, failed_pages))})가 있어 본 매물 기록을 갱신하지 않습니다.")
+        else:
+            print(f"새 매물 {crawl.commit()}개를 본 매물로 기록했습니다.")
+    
     # 결과 출력
     print("\n" + "=" * 60)
     print(f"크롤링 완료! 총 {len(all_titles)}개 매물 발견")
@@ -83,6 +107,8 @@ def crawl_clien_market(search_keyword="", max_pages=10):
     for i, item in enumerate(all_titles, 1):
         print(f"{i:3d}. [{item['page']}페이지] {item['title']}")
     
+    if as_frame:
+        return listings_frame(all_titles)
     return all_titles
 
 def save_to_file(titles, search_keyword="", filename=None):
@@ -139,20 +165,25 @@ def get_search_input():
         except ValueError:
             print("올바른 숫자를 입력해주세요.")
     
-    return search_keyword, pages
+    # 증분 크롤링 여부
+    incremental = input("지난번 이후 새 매물만 가져올까요? (y/n, 기본값: n): ").strip().lower() in ['y', 'yes', '예']
+    
+    return search_keyword, pages, incremental
 
 if __name__ == "__main__":
     try:
         # 사용자 입력 받기
-        search_keyword, max_pages = get_search_input()
+        search_keyword, max_pages, incremental = get_search_input()
         
         print(f"\n크롤링을 시작합니다...")
         if search_keyword:
             print(f"검색어: '{search_keyword}'")
         print(f"페이지 수: {max_pages}")
+        if incremental:
+            print("새 매물만 가져옵니다.")
         
         # 크롤링 실행
-        titles = crawl_clien_market(search_keyword, max_pages)
+        titles = crawl_clien_market(search_keyword, max_pages, incremental=incremental)
         
         if titles:
             # 파일로 저장할지 선택
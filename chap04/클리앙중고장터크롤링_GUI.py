@@ -1,7 +1,6 @@
 import sys
-import requests
-from bs4 import BeautifulSoup
-import time
+import queue
+import threading
 import urllib.parse
 import pandas as pd
 from datetime import datetime
@@ -10,93 +9,195 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout
                              QProgressBar, QSpinBox, QCheckBox, QMessageBox, QTextEdit)
 from PyQt5.QtCore import QThread, pyqtSignal, Qt
 from PyQt5.QtGui import QFont
+import os
+
+# 공용 HTTP 모듈(chap05/crawler_http.py) 경로 추가
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'chap05'))
+from crawler_http import CancelToken, RequestCancelled, TokenBucket, fetch_text
+from listing_dedup import ListingDeduper
+from listing_parse import listings_frame, parse_listings
+from seen_index import IncrementalCrawl, SeenPostIndex, listing_scope
+
+# Excel 매물목록 시트에 넣을 컬럼 (listings_frame 컬럼 → 시트 제목)
+EXCEL_COLUMNS = {
+    'title': '매물 제목',
+    'price': '가격(원)',
+    'category': '분류',
+    'author': '작성자',
+    'posted_at': '작성일시',
+    'views': '조회수',
+    'page': '페이지',
+    'post_id': '게시글 번호',
+    'url': '링크',
+}
+
+# 동시에 요청하는 작업자 수와 파싱을 기다리는 페이지 큐 크기
+FETCH_WORKERS = 3
+PAGE_QUEUE_SIZE = 4
 
 class CrawlerThread(QThread):
-    """크롤링을 백그라운드에서 실행하는 스레드"""
+    """
+    크롤링을 백그라운드에서 실행하는 스레드
+    
+    요청 작업자 스레드(FETCH_WORKERS개)가 페이지를 받아 크기가 정해진 큐에 넣고,
+    이 스레드는 큐에서 꺼낸 페이지를 페이지 순서대로 파싱해서 페이지마다 result_ready로 보냅니다.
+    stop()을 호출하면 진행 중인 요청을 바로 취소하고 남은 페이지는 요청하지 않습니다.
+    """
     progress_updated = pyqtSignal(str)  # 진행상황 업데이트 신호
-    result_ready = pyqtSignal(list)     # 결과 준비 완료 신호
+    result_ready = pyqtSignal(list)     # 페이지별 결과(새로 추가된 매물) 신호
     finished_crawling = pyqtSignal()    # 크롤링 완료 신호
     
-    def __init__(self, search_keyword="", max_pages=10):
+    def __init__(self, search_keyword="", max_pages=10, incremental=False):
         super().__init__()
         self.search_keyword = search_keyword
         self.max_pages = max_pages
+        self.incremental = incremental
         self.is_running = True
+        self.cancel = CancelToken()
+    
+    def page_url(self, page):
+        """페이지 URL 구성"""
+        base_url = "https://www.clien.net/service/board/sold"
+        if self.search_keyword:
+            params = {
+                'sk': 'title',
+                'sv': self.search_keyword,
+                'po': str(page)
+            }
+            return base_url + "?" + urllib.parse.urlencode(params)
+        return f"{base_url}?po={page}"
+    
+    def fetch_worker(self, next_page, rate_limiter, pages):
+        """요청 작업자: 페이지 번호를 하나씩 가져와 요청하고 (페이지, HTML, 오류)를 큐에 넣음"""
+        while not self.cancel.cancelled:
+            page = next_page()
+            if page is None:
+                return
+            
+            try:
+                item = (page, fetch_text(self.page_url(page), rate_limiter=rate_limiter, cancel=self.cancel), None)
+            except RequestCancelled:
+                return
+            except Exception as e:
+                item = (page, None, e)
+            
+            # 파싱이 밀려 큐가 가득 차면 자리가 날 때까지 대기 (취소되면 버림)
+            while not self.cancel.cancelled:
+                try:
+                    pages.put(item, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
     
     def run(self):
         """크롤링 실행"""
-        base_url = "https://www.clien.net/service/board/sold"
-        all_titles = []
+        seen = ListingDeduper()
+        failed_pages = []
+        found_count = 0
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        # 증분 모드: 지난 크롤링 이후 새 매물만 수집하고 이미 본 매물이 나오면 멈춤
+        seen_index = None
+        crawl = None
+        if self.incremental:
+            seen_index = SeenPostIndex()
+            crawl = IncrementalCrawl(seen_index, listing_scope('sold', self.search_keyword))
         
         self.progress_updated.emit(f"{'검색어: ' + self.search_keyword if self.search_keyword else '전체 매물'} 크롤링 시작...")
         
-        for page in range(1, self.max_pages + 1):
-            if not self.is_running:
-                break
-                
+        # 요청 작업자들이 페이지 번호를 순서대로 나눠 가짐
+        page_numbers = iter(range(1, self.max_pages + 1))
+        page_lock = threading.Lock()
+        
+        def next_page():
+            with page_lock:
+                return next(page_numbers, None)
+        
+        # 서버 부하 방지 (모든 작업자를 합쳐 초당 1페이지)
+        rate_limiter = TokenBucket(rate=1.0)
+        pages = queue.Queue(maxsize=PAGE_QUEUE_SIZE)
+        workers = [threading.Thread(target=self.fetch_worker, args=(next_page, rate_limiter, pages), daemon=True)
+                   for _ in range(min(FETCH_WORKERS, self.max_pages))]
+        for worker in workers:
+            worker.start()
+        
+        # 파싱 작업자(이 스레드): 도착 순서와 관계없이 페이지 순서대로 처리
+        waiting = {}
+        expected = 1
+        while expected <= self.max_pages and not self.cancel.cancelled:
             try:
-                # URL 구성
-                if self.search_keyword:
-                    params = {
-                        'sk': 'title',
-                        'sv': self.search_keyword,
-                        'po': str(page)
-                    }
-                    url = base_url + "?" + urllib.parse.urlencode(params)
-                else:
-                    url = f"{base_url}?po={page}"
-                
-                self.progress_updated.emit(f"페이지 {page}/{self.max_pages} 크롤링 중...")
+                page, html, error = pages.get(timeout=0.1)
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers) and pages.empty():
+                    break
+                continue
+            waiting[page] = (html, error)
+            
+            while expected in waiting and not self.cancel.cancelled:
+                html, error = waiting.pop(expected)
+                page = expected
+                expected += 1
                 
-                response = requests.get(url, headers=headers)
-                response.raise_for_status()
+                if error is not None:
+                    self.progress_updated.emit(f"페이지 {page} 오류: {str(error)}")
+                    failed_pages.append(page)
+                    continue
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                try:
+                    # 매물 행마다 제목, 게시글 번호, 링크, 작성자 등을 한 번에 추출
+                    listings = parse_listings(html, page)
+                except Exception as e:
+                    self.progress_updated.emit(f"페이지 {page} 오류: {str(e)}")
+                    failed_pages.append(page)
+                    continue
                 
-                # 여러 방법으로 제목 요소 찾기
-                titles = soup.find_all('span', class_='subject_fixed')
-                if not titles:
-                    titles = soup.find_all('a', class_='list_subject')
-                if not titles:
-                    titles = soup.select('td.post_subject a')
-                if not titles:
-                    # 추가 시도
-                    titles = soup.select('a[href*="/service/board/sold/"]')
+                if crawl is not None:
+                    new_ids, reached_seen = crawl.check_page([listing['post_id'] for listing in listings])
                 
                 page_titles = []
-                for title in titles:
-                    title_text = title.get_text(strip=True)
-                    if title_text and title_text not in [t['title'] for t in all_titles]:
-                        page_titles.append({
-                            'title': title_text,
-                            'page': page
-                        })
+                for listing in listings:
+                    post_id = listing['post_id']
+                    # 증분 모드: 지난 크롤링에서 이미 본 매물 제외
+                    if crawl is not None and post_id is not None and post_id not in new_ids:
+                        continue
+                    # 이미 수집한 매물인지 set으로 바로 확인 (페이지가 밀려 다시 나온 매물 제외)
+                    if seen.add(listing['title'], listing['url']):
+                        page_titles.append(listing)
                 
-                all_titles.extend(page_titles)
-                self.progress_updated.emit(f"페이지 {page}: {len(page_titles)}개 매물 발견")
+                found_count += len(page_titles)
+                self.progress_updated.emit(f"페이지 {page}/{self.max_pages}: {len(page_titles)}개 {'새 ' if crawl is not None else ''}매물 발견")
+                # 페이지가 끝날 때마다 바로 화면에 추가
+                if page_titles:
+                    self.result_ready.emit(page_titles)
                 
-                time.sleep(1)  # 서버 부하 방지
-                
-            except Exception as e:
-                self.progress_updated.emit(f"페이지 {page} 오류: {str(e)}")
-                continue
+                if crawl is not None and reached_seen:
+                    self.progress_updated.emit("이미 본 매물까지 도달했습니다. 다음 페이지는 크롤링하지 않습니다.")
+                    self.cancel.cancel()
+        
+        # 남은 요청 취소 (작업자 스레드는 취소를 확인하고 스스로 끝남)
+        self.cancel.cancel()
+        
+        if crawl is not None:
+            # 중지했거나 실패한 페이지가 있으면 기록하지 않음 (다음 크롤링에서 빠진 구간을 다시 읽음)
+            if not self.is_running or failed_pages:
+                self.progress_updated.emit("크롤링이 끝까지 진행되지 않아 본 매물 기록을 갱신하지 않습니다.")
+            else:
+                self.progress_updated.emit(f"새 매물 {crawl.commit()}개를 본 매물로 기록했습니다.")
+            seen_index.close()
         
-        self.result_ready.emit(all_titles)
+        self.progress_updated.emit(f"총 {found_count}개 매물 수집")
         self.finished_crawling.emit()
     
     def stop(self):
-        """크롤링 중지"""
+        """크롤링 중지 (진행 중인 요청도 바로 취소)"""
         self.is_running = False
+        self.cancel.cancel()
 
 class ClienMarketGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.crawler_thread = None
         self.results = []
+        self.results_frame = None  # 가격/작성일시 등을 타입별 컬럼으로 정리한 결과
         self.init_ui()
     
     def init_ui(self):
@@ -139,6 +240,11 @@ class ClienMarketGUI(QMainWindow):
         self.page_spinbox.setValue(10)
         search_layout.addWidget(self.page_spinbox)
         
+        # 증분 크롤링 (지난번 이후 새 매물만)
+        self.incremental_checkbox = QCheckBox('새 매물만')
+        self.incremental_checkbox.setToolTip('지난 크롤링 이후 새로 올라온 매물만 가져오고, 이미 본 매물이 나오면 멈춥니다.')
+        search_layout.addWidget(self.incremental_checkbox)
+        
         # 검색 버튼
         self.search_button = QPushButton('검색 시작')
         self.search_button.clicked.connect(self.start_crawling)
@@ -203,16 +309,18 @@ class ClienMarketGUI(QMainWindow):
         self.result_list.clear()
         self.progress_text.clear()
         self.result_count_label.setText('총 0개 매물')
+        self.results = []
+        self.results_frame = None
         
         # 크롤링 스레드 시작
-        self.crawler_thread = CrawlerThread(search_keyword, max_pages)
+        self.crawler_thread = CrawlerThread(search_keyword, max_pages, self.incremental_checkbox.isChecked())
         self.crawler_thread.progress_updated.connect(self.update_progress)
         self.crawler_thread.result_ready.connect(self.display_results)
         self.crawler_thread.finished_crawling.connect(self.crawling_finished)
         self.crawler_thread.start()
     
     def stop_crawling(self):
-        """크롤링 중지"""
+        """크롤링 중지 (진행 중인 요청은 취소되므로 바로 끝남)"""
         if self.crawler_thread:
             self.crawler_thread.stop()
             self.crawler_thread.wait()
@@ -226,24 +334,25 @@ class ClienMarketGUI(QMainWindow):
         scrollbar.setValue(scrollbar.maximum())
     
     def display_results(self, results):
-        """결과 표시"""
-        self.results = results
-        self.result_list.clear()
+        """페이지별 결과를 목록 끝에 추가"""
+        start = len(self.results) + 1
+        self.results.extend(results)
         
-        for i, item in enumerate(results, 1):
-            list_item = f"{i:3d}. [{item['page']}페이지] {item['title']}"
-            self.result_list.addItem(list_item)
+        self.result_list.addItems([f"{i:3d}. [{item['page']}페이지] {item['title']}"
+                                   for i, item in enumerate(results, start)])
         
-        self.result_count_label.setText(f'총 {len(results)}개 매물')
-        # 결과가 있으면 저장 버튼들 활성화
-        if results:
-            self.save_txt_button.setEnabled(True)
-            self.save_excel_button.setEnabled(True)
+        new_text = '새 ' if self.crawler_thread is not None and self.crawler_thread.incremental else ''
+        self.result_count_label.setText(f'총 {len(self.results)}개 {new_text}매물')
     
     def crawling_finished(self):
         """크롤링 완료 처리"""
         self.search_button.setEnabled(True)
         self.stop_button.setEnabled(False)
+        # 결과가 있으면 타입별 컬럼으로 정리하고 저장 버튼들 활성화
+        self.results_frame = listings_frame(self.results)
+        if self.results:
+            self.save_txt_button.setEnabled(True)
+            self.save_excel_button.setEnabled(True)
         self.update_progress("크롤링 완료!")
     
     def save_results_txt(self):
@@ -283,17 +392,10 @@ class ClienMarketGUI(QMainWindow):
             return
         
         try:
-            # 데이터프레임 생성
-            data = []
-            for i, item in enumerate(self.results, 1):
-                data.append({
-                    '번호': i,
-                    '매물 제목': item['title'],
-                    '페이지': item['page'],
-                    '크롤링 일시': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
-            
-            df = pd.DataFrame(data)
+            # 데이터프레임 생성 (파싱 단계에서 정리한 컬럼을 그대로 사용)
+            df = self.results_frame.rename(columns=EXCEL_COLUMNS)[list(EXCEL_COLUMNS.values())]
+            df.insert(0, '번호', range(1, len(df) + 1))
+            df['크롤링 일시'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             
             # 검색어에 따른 파일명 생성
             search_keyword = self.search_input.text().strip()
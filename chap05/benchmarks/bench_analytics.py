@@ -0,0 +1,89 @@
+"""
+스냅샷 분석 시간 비교 (전체 이력 다시 계산 vs 새 스냅샷만 반영)
+
+임시 저장소에 종목 200개 × --snapshots개 합성 스냅샷을 저장한 뒤,
+SnapshotAnalytics를 처음부터 계산하는 시간과 스냅샷 하나가 추가됐을 때
+update()로 이어서 계산하는 시간을 비교합니다. 두 결과가 같은지도 확인합니다.
+
+실행: python benchmarks/bench_analytics.py [--snapshots 2000] [--stocks 200]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from snapshot_analytics import SnapshotAnalytics
+from snapshot_store import SnapshotStore
+
+
+class SyntheticMarket:
+    """스냅샷마다 절반 정도의 종목 가격이 바뀌는 합성 시세"""
+    def __init__(self, stocks, seed=0):
+        self.rng = np.random.default_rng(seed)
+        self.names = [f"종목{i:04d}" for i in range(stocks)]
+        self.prices = self.rng.integers(10_000, 300_000, stocks).astype('float64')
+
+    def snapshot(self):
+        changed = self.rng.random(len(self.names)) < 0.5
+        moved = np.round(self.prices * (1 + self.rng.normal(0, 0.01, len(self.names))))
+        self.prices = np.where(changed, moved, self.prices)
+        return pd.DataFrame({
+            '종목명': self.names,
+            '현재가': self.prices.astype('int64'),
+            '거래대금': self.rng.integers(100, 500_000, len(self.names)),
+            '시가총액': self.rng.integers(1_000, 4_000_000, len(self.names)),
+        })
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스냅샷 분석 전체 계산 vs 증분 업데이트')
+    parser.add_argument('--snapshots', type=int, default=2000, help='미리 저장할 스냅샷 수')
+    parser.add_argument('--stocks', type=int, default=200, help='종목 수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = SnapshotStore(os.path.join(directory, 'snapshots.sqlite3'))
+        market = SyntheticMarket(args.stocks)
+        started_at = datetime(2026, 1, 2, 9, 0)
+        for i in range(args.snapshots):
+            store.append(market.snapshot(), captured_at=started_at + timedelta(minutes=i))
+        print(f"저장소: 스냅샷 {args.snapshots:,}개, {store.count():,}행")
+
+        analytics = SnapshotAnalytics(store)
+        start = time.perf_counter()
+        analytics.update()
+        analytics.summary()
+        print(f"처음 계산: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+        update_times = []
+        full_times = []
+        for i in range(5):
+            store.append(market.snapshot(), captured_at=started_at + timedelta(minutes=args.snapshots + i))
+
+            start = time.perf_counter()
+            analytics.update()
+            incremental = analytics.summary()
+            update_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            full = SnapshotAnalytics(store)
+            full.update()
+            recomputed = full.summary()
+            full_times.append(time.perf_counter() - start)
+
+            pd.testing.assert_frame_equal(incremental, recomputed)
+
+        print(f"새 스냅샷 반영 (중앙값): 증분 update() {np.median(update_times) * 1000:.1f}ms, "
+              f"전체 다시 계산 {np.median(full_times) * 1000:.1f}ms (결과 동일)")
+        print(f"\n{analytics.movers_text()}")
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
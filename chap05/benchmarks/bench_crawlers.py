@@ -0,0 +1,279 @@
+"""
+크롤러 벤치마크 모음 (기록된 응답 재생, 네트워크 없이 실행)
+
+replay.py의 재생 서버로 실제 크롤러 함수를 그대로 실행하고
+케이스별로 pages/sec, 페이지당 요청/파싱 시간(ms), 최대 RSS(MB)를 JSON으로 출력합니다.
+최대 RSS를 케이스별로 따로 재기 위해 케이스마다 별도 프로세스로 실행합니다.
+
+  kospi_entry     crawl_kospi200_entry_stocks()           편입종목 1페이지
+  kospi_multi     crawl_multiple_pages(10)                편입종목 10페이지
+  clien_market    crawl_clien_market('', 5)               클리앙 중고장터 5페이지
+  naver_blog      crawl_naver_blog_titles(NAVER_BLOG_URL) 블로그 검색 1페이지
+
+parse_ms_per_page는 전체 시간에서 요청(fetch_text) 시간을 뺀 나머지
+(파싱, 정규화, 결과 출력/저장 포함)를 페이지 수로 나눈 값입니다.
+clien_market의 페이지 간 time.sleep(1)은 --keep-sleep을 주지 않으면 건너뜁니다.
+
+실행:
+  python benchmarks/bench_crawlers.py [--repeat 5] [--out result.json]
+  python benchmarks/bench_crawlers.py --compare before.json after.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+CHAP05_DIR = os.path.dirname(BENCH_DIR)
+CHAP04_DIR = os.path.join(os.path.dirname(CHAP05_DIR), 'chap04')
+
+sys.path.insert(0, CHAP05_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+CASES = ['kospi_entry', 'kospi_multi', 'clien_market', 'naver_blog']
+
+# 비교할 때 값이 클수록 좋은 지표
+HIGHER_IS_BETTER = {'pages_per_sec'}
+COMPARE_METRICS = ['pages_per_sec', 'fetch_ms_per_page', 'parse_ms_per_page', 'peak_rss_mb']
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB, 측정할 수 없으면 None)"""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        info = psutil.Process().memory_info()
+        return round(getattr(info, 'peak_wset', info.rss) / 1024 / 1024, 1)
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 bytes, 리눅스는 KB 단위
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+class FetchTimer:
+    """모듈의 fetch_text를 감싸서 요청 횟수, 시간, 받은 글자 수를 기록"""
+    def __init__(self, module):
+        self.module = module
+        self.original = module.fetch_text
+        self.calls = 0
+        self.seconds = 0.0
+        self.chars = 0
+        module.fetch_text = self
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            text = self.original(*args, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.calls += 1
+        self.chars += len(text)
+        return text
+
+    def reset(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.chars = 0
+
+
+class _NoSleep:
+    """time 모듈 대신 넣어서 sleep만 건너뛰는 객체"""
+    def __init__(self, module):
+        self._module = module
+
+    def sleep(self, seconds):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+
+def prepare_case(name, keep_sleep=False):
+    """케이스 이름으로 (실행 함수, FetchTimer)를 준비"""
+    if name in ('kospi_entry', 'kospi_multi'):
+        import kospi200_engine
+        from kospi200_accurate_crawler import crawl_kospi200_entry_stocks, crawl_multiple_pages
+
+        timer = FetchTimer(kospi200_engine)
+        if name == 'kospi_entry':
+            return crawl_kospi200_entry_stocks, timer
+        return lambda: crawl_multiple_pages(10, rate_limit=1000, burst=1), timer
+
+    sys.path.insert(0, CHAP04_DIR)
+    if name == 'clien_market':
+        import 클리앙중고장터크롤링 as clien
+
+        timer = FetchTimer(clien)
+        if not keep_sleep:
+            clien.time = _NoSleep(clien.time)
+        return lambda: clien.crawl_clien_market('', 5), timer
+
+    if name == 'naver_blog':
+        import 네이버블로그기사크롤링 as blog
+        from replay import NAVER_BLOG_URL
+
+        timer = FetchTimer(blog)
+        return lambda: blog.crawl_naver_blog_titles(NAVER_BLOG_URL), timer
+
+    raise ValueError(f"알 수 없는 케이스: {name}")
+
+
+def count_rows(result):
+    """DataFrame/list 결과의 행 수"""
+    return 0 if result is None else len(result)
+
+
+def run_case(name, repeat=5, keep_sleep=False):
+    """현재 프로세스에서 케이스 하나를 repeat번 실행하고 지표 dict를 반환"""
+    from replay import install, start_replay_server
+
+    server = start_replay_server()
+    install(server)
+    func, timer = prepare_case(name, keep_sleep)
+
+    # 첫 실행(임포트, 연결 생성)은 측정에서 제외
+    with contextlib.redirect_stdout(io.StringIO()):
+        func()
+
+    wall_times, fetch_times = [], []
+    pages = rows = chars = 0
+    for _ in range(repeat):
+        timer.reset()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = func()
+            wall_times.append(time.perf_counter() - start)
+        fetch_times.append(timer.seconds)
+        pages, rows, chars = timer.calls, count_rows(result), timer.chars
+
+    server.shutdown()
+
+    wall = statistics.median(wall_times)
+    fetch = statistics.median(fetch_times)
+    return {
+        'case': name,
+        'repeat': repeat,
+        'pages': pages,
+        'rows': rows,
+        'chars_per_page': round(chars / pages) if pages else 0,
+        'wall_ms': round(wall * 1000, 2),
+        'pages_per_sec': round(pages / wall, 1) if wall else None,
+        'fetch_ms_per_page': round(fetch / pages * 1000, 3) if pages else None,
+        'parse_ms_per_page': round((wall - fetch) / pages * 1000, 3) if pages else None,
+        'peak_rss_mb': peak_rss_mb(),
+        'sleep_skipped': name == 'clien_market' and not keep_sleep,
+        'missing_urls': sorted(set(server.misses)),
+    }
+
+
+def run_suite(cases, repeat=5, keep_sleep=False):
+    """케이스마다 별도 프로세스로 실행해서 결과 JSON(dict)을 만드는 함수"""
+    results = []
+    # 크롤러가 저장하는 CSV가 저장소에 쌓이지 않도록 임시 폴더에서 실행
+    with tempfile.TemporaryDirectory() as work_dir:
+        for name in cases:
+            command = [sys.executable, os.path.abspath(__file__), '--case', name, '--repeat', str(repeat)]
+            if keep_sleep:
+                command.append('--keep-sleep')
+            completed = subprocess.run(command, cwd=work_dir, capture_output=True, text=True, encoding='utf-8')
+            if completed.returncode != 0:
+                print(f"{name} 실패:\n{completed.stderr}", file=sys.stderr)
+                continue
+            results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def git_commit():
+    """현재 git 커밋 해시 (git이 없으면 None)"""
+    try:
+        completed = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR,
+                                   capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def print_table(suite):
+    """결과를 표로 출력"""
+    print(f"커밋: {suite['git_commit']}  Python {suite['python']}  {suite['platform']}")
+    print(f"{'케이스':<14}{'페이지':>6}{'행':>6}{'pages/s':>10}{'요청 ms':>10}{'파싱 ms':>10}{'RSS MB':>9}")
+    print("-" * 65)
+    for r in suite['results']:
+        print(f"{r['case']:<14}{r['pages']:>6}{r['rows']:>6}{r['pages_per_sec']:>10}"
+              f"{r['fetch_ms_per_page']:>10}{r['parse_ms_per_page']:>10}{r['peak_rss_mb']!s:>9}")
+        if r['missing_urls']:
+            print(f"  기록되지 않은 URL {len(r['missing_urls'])}개 (replay.py record로 기록): {r['missing_urls'][0]}")
+
+
+def compare(before_path, after_path):
+    """두 결과 JSON을 케이스별로 비교해서 출력"""
+    with open(before_path, encoding='utf-8') as f:
+        before = {r['case']: r for r in json.load(f)['results']}
+    with open(after_path, encoding='utf-8') as f:
+        after = {r['case']: r for r in json.load(f)['results']}
+
+    print(f"{'케이스':<14}{'지표':<20}{'이전':>12}{'이후':>12}{'변화':>10}")
+    print("-" * 68)
+    for case in after:
+        if case not in before:
+            continue
+        for metric in COMPARE_METRICS:
+            old, new = before[case].get(metric), after[case].get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            better = change > 0 if metric in HIGHER_IS_BETTER else change < 0
+            mark = '개선' if better and abs(change) >= 5 else ('저하' if abs(change) >= 5 else '')
+            print(f"{case:<14}{metric:<20}{old:>12}{new:>12}{change:>+9.1f}% {mark}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기록된 응답으로 크롤러 벤치마크')
+    parser.add_argument('--repeat', type=int, default=5, help='케이스별 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=CASES)
+    parser.add_argument('--keep-sleep', action='store_true', help='클리앙 크롤러의 페이지 간 대기 유지')
+    parser.add_argument('--out', help='결과 JSON 파일 경로 (없으면 표만 출력)')
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'), help='두 결과 JSON 비교')
+    parser.add_argument('--case', choices=CASES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    if args.case:
+        # run_suite가 띄운 하위 프로세스: 케이스 하나의 결과를 JSON 한 줄로 출력
+        print(json.dumps(run_case(args.case, args.repeat, args.keep_sleep), ensure_ascii=False))
+        return
+
+    suite = run_suite(args.cases, args.repeat, args.keep_sleep)
+    print_table(suite)
+
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(suite, f, ensure_ascii=False, indent=2)
+        print(f"\n결과가 {args.out} 파일로 저장되었습니다.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+매물 중복 제거 시간 비교 (이전 제목 목록을 매번 만드는 방식 vs ListingDeduper)
+
+크롤러가 쓰던 `title not in [t['title'] for t in all_titles]` 방식은 매물 수의 제곱에 비례하고,
+ListingDeduper(set)는 매물 수에 비례합니다. 합성 매물(약 10%는 다음 페이지에 다시 나온 중복)로
+매물 수를 늘려 가며 시간과 매물당 시간을 비교합니다.
+이전 방식은 --max-list개까지만 측정합니다 (그 이상은 너무 오래 걸림).
+
+실행: python benchmarks/bench_dedup.py [--sizes 1000 10000 50000 100000] [--max-list 20000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from listing_dedup import ListingDeduper
+
+ITEMS = ['아이폰 15 프로', '갤럭시 S24 울트라', '맥북 에어 M2', '에어팟 프로 2세대', '아이패드 미니 6',
+         '닌텐도 스위치 OLED', 'RTX 4070', '소니 WH-1000XM5', 'LG 그램 16', '애플워치 9']
+
+
+def make_listings(count, duplicate_ratio=0.1, seed=0):
+    """(제목, 링크) 목록 (duplicate_ratio만큼은 앞에 나온 매물이 다시 나옴)"""
+    rng = np.random.default_rng(seed)
+    listings = []
+    post_id = 19_000_000
+    for _ in range(count):
+        if listings and rng.random() < duplicate_ratio:
+            listings.append(listings[int(rng.integers(max(0, len(listings) - 30), len(listings)))])
+            continue
+        post_id -= 1
+        title = f"{ITEMS[int(rng.integers(len(ITEMS)))]} {int(rng.integers(1, 200))}만원 #{post_id}"
+        listings.append((title, f"/service/board/sold/{post_id}?od=T31&po=0"))
+    return listings
+
+
+def dedup_list(listings):
+    """크롤러가 쓰던 방식: 매물마다 지금까지의 제목 목록을 다시 만들어 비교"""
+    all_titles = []
+    for title, _ in listings:
+        if title and title not in [t['title'] for t in all_titles]:
+            all_titles.append({'title': title})
+    return len(all_titles)
+
+
+def dedup_set(listings, by_post_id=False):
+    seen = ListingDeduper(by_post_id=by_post_id)
+    kept = 0
+    for title, href in listings:
+        if title and seen.add(title, href):
+            kept += 1
+    return kept
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='매물 중복 제거 시간 비교')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 5_000, 10_000, 20_000, 50_000, 100_000])
+    parser.add_argument('--max-list', type=int, default=20_000, help='이전 방식을 측정할 최대 매물 수')
+    args = parser.parse_args()
+
+    print(f"{'매물 수':>9}{'남은 매물':>10}{'목록 비교 ms':>14}{'set ms':>10}{'set(게시글 번호) ms':>20}{'set µs/매물':>13}")
+    print("-" * 78)
+    for size in args.sizes:
+        listings = make_listings(size)
+        kept, set_seconds = timed(dedup_set, listings)
+        kept_by_id, id_seconds = timed(dedup_set, listings, True)
+        assert kept == kept_by_id
+
+        if size <= args.max_list:
+            list_kept, list_seconds = timed(dedup_list, listings)
+            assert list_kept == kept
+            list_text = f"{list_seconds * 1000:,.1f}"
+        else:
+            list_text = '-'
+
+        print(f"{size:>9,}{kept:>10,}{list_text:>14}{set_seconds * 1000:>10.1f}{id_seconds * 1000:>20.1f}"
+              f"{set_seconds / size * 1e6:>13.2f}")
+
+
+if __name__ == '__main__':
+    main()
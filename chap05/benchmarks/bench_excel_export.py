@@ -0,0 +1,119 @@
+"""
+엑셀 저장 방식 비교 (예전 save_to_excel vs excel_export.export_excel)
+
+예전 방식: pandas.ExcelWriter(openpyxl)로 저장한 뒤 모든 셀을 다시 돌면서 컬럼 너비 계산
+새 방식: write-only 스트리밍 저장 + DataFrame에서 컬럼 너비를 한 번에 계산
+
+실행: python benchmarks/bench_excel_export.py [--rows 100000] [--memory]
+(--memory: tracemalloc으로 최대 메모리도 측정, 측정 부담 때문에 시간은 따로 잰 값을 사용)
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.styles import Alignment, Font, PatternFill
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from excel_export import export_excel, make_summary
+
+
+def make_frame(rows):
+    """크롤링 결과와 같은 컬럼 구성의 합성 데이터"""
+    rng = np.random.default_rng(0)
+    names = pd.Series([f"종목{i % 2000:04d}" for i in range(rows)]).astype('category')
+    return pd.DataFrame({
+        '페이지': np.arange(rows) // 10 + 1,
+        '종목명': names,
+        '현재가': rng.integers(1_000, 900_000, rows),
+        '전일비': rng.integers(-5_000, 5_000, rows),
+        '등락률': rng.normal(0, 2, rows).round(2),
+        '거래량': rng.integers(0, 10_000_000, rows),
+        '거래대금': rng.integers(0, 1_000_000, rows),
+        '시가총액': rng.integers(0, 4_000_000, rows),
+    })
+
+
+def legacy_export(df, filename):
+    """예전 save_to_excel()의 저장 과정"""
+    with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+        df.to_excel(writer, sheet_name='코스피200_편입종목', index=False)
+        worksheet = writer.sheets['코스피200_편입종목']
+        for column in worksheet.columns:
+            max_length = 0
+            column_letter = column[0].column_letter
+            for cell in column:
+                if len(str(cell.value)) > max_length:
+                    max_length = len(str(cell.value))
+            worksheet.column_dimensions[column_letter].width = min(max_length + 2, 50)
+
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        header_alignment = Alignment(horizontal="center", vertical="center")
+        for cell in worksheet[1]:
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_alignment
+
+        make_summary(df, datetime.now()).to_excel(writer, sheet_name='요약정보', index=False)
+
+
+def streaming_export(df, filename):
+    export_excel(df, filename, sheet_name='코스피200_편입종목', summary=make_summary(df, datetime.now()))
+
+
+def measure(func, df, filename, memory=False):
+    """(소요 시간 초, 파이썬 최대 할당 MB 또는 None)"""
+    start = time.perf_counter()
+    func(df, filename)
+    elapsed = time.perf_counter() - start
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        func(df, filename)
+        peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='엑셀 저장 방식 비교')
+    parser.add_argument('--rows', type=int, default=100_000, help='저장할 행 수')
+    parser.add_argument('--memory', action='store_true', help='최대 메모리도 측정 (느림)')
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    print(f"{args.rows:,}행 × {len(df.columns)}컬럼 엑셀 저장")
+    print(f"{'방식':<22}{'시간 s':>10}{'최대 메모리 MB':>16}{'파일 KB':>10}")
+    print("-" * 58)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        results = {}
+        for name, func in [('예전 방식(ExcelWriter)', legacy_export), ('write-only 스트리밍', streaming_export)]:
+            filename = os.path.join(work_dir, f"{len(results)}.xlsx")
+            elapsed, peak = measure(func, df, filename, args.memory)
+            results[name] = (elapsed, filename)
+            peak_text = '-' if peak is None else f"{peak:.1f}"
+            print(f"{name:<22}{elapsed:>10.2f}{peak_text:>16}{os.path.getsize(filename) / 1024:>10.0f}")
+
+        # 두 파일의 내용과 컬럼 너비가 같은지 확인
+        (_, legacy_file), (_, streaming_file) = results.values()
+        legacy_sheet = load_workbook(legacy_file, read_only=True)['코스피200_편입종목']
+        streaming_sheet = load_workbook(streaming_file, read_only=True)['코스피200_편입종목']
+        same_rows = all(a == b for a, b in zip(legacy_sheet.iter_rows(max_row=1000, values_only=True),
+                                                 streaming_sheet.iter_rows(max_row=1000, values_only=True)))
+
+    (legacy_time, _), (streaming_time, _) = results.values()
+    print("-" * 58)
+    print(f"속도 향상: {legacy_time / streaming_time:.1f}배, 앞 1000행 내용 일치: {same_rows}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+결과 저장 형식 비교 (CSV / 압축 CSV / Parquet / Feather)
+
+같은 DataFrame을 형식별로 저장하고 다시 읽어서
+저장 시간, 파일 크기, 읽기 시간, 데이터 일치 여부를 비교합니다.
+
+실행: python benchmarks/bench_export_formats.py [--rows 1000000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from result_export import DEFAULT_EXTENSIONS, load_frame, save_frame
+
+FORMATS = ['csv', 'csv.zst', 'parquet', 'feather']
+
+
+def make_frame(rows):
+    """스냅샷 이력과 같은 컬럼 구성의 합성 데이터"""
+    rng = np.random.default_rng(0)
+    names = pd.Series([f"종목{i % 2000:04d}" for i in range(rows)]).astype('category')
+    return pd.DataFrame({
+        '종목명': names,
+        '현재가': rng.integers(1_000, 900_000, rows),
+        '전일비': rng.integers(-5_000, 5_000, rows),
+        '등락률': rng.normal(0, 2, rows).round(2),
+        '거래량': rng.integers(0, 10_000_000, rows),
+        '거래대금': rng.integers(0, 1_000_000, rows),
+        '시가총액': rng.integers(0, 4_000_000, rows),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description='결과 저장 형식 비교')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='저장할 행 수')
+    args = parser.parse_args()
+
+    df = make_frame(args.rows)
+    print(f"{args.rows:,}행 × {len(df.columns)}컬럼")
+    print(f"{'형식':<10}{'저장 ms':>10}{'크기 MB':>10}{'읽기 ms':>10}  일치")
+    print("-" * 50)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for fmt in FORMATS:
+            filename = os.path.join(work_dir, 'result' + DEFAULT_EXTENSIONS[fmt])
+
+            start = time.perf_counter()
+            save_frame(df, filename)
+            save_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            loaded = load_frame(filename)
+            load_ms = (time.perf_counter() - start) * 1000
+
+            same = loaded.astype({'종목명': str}).equals(df.astype({'종목명': str}))
+            size_mb = os.path.getsize(filename) / 1024 / 1024
+            print(f"{fmt:<10}{save_ms:>10.0f}{size_mb:>10.1f}{load_ms:>10.0f}  {same}")
+            del loaded
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+공용 세션(keep-alive) vs 매번 requests.get 비교 벤치마크
+
+로컬 HTTP 서버를 네이버 금융 대신 띄워 놓고 100페이지를 요청하면서
+서버가 받은 TCP 연결 수와 페이지당 소요 시간을 비교합니다.
+
+실행: python benchmarks/bench_http_session.py [--pages 100]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawler_http import DEFAULT_HEADERS, create_session
+
+PAGE_BODY = ('<html><body><table class="type_1">'
+             + '<tr><td>종목</td><td>71,200</td></tr>' * 10
+             + '</table></body></html>').encode('euc-kr')
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """keep-alive를 지원하는 테스트용 응답 핸들러"""
+    protocol_version = 'HTTP/1.1'
+    # 헤더와 본문을 따로 보낼 때 Nagle 알고리즘 지연(약 40ms)이 생기지 않도록 설정
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connection_count += 1
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=euc-kr')
+        self.send_header('Content-Length', str(len(PAGE_BODY)))
+        self.end_headers()
+        self.wfile.write(PAGE_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    """임의의 빈 포트에 테스트 서버를 띄우고 반환"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connection_count = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_case(server, name, get, pages):
+    """한 가지 방식으로 pages번 요청하고 결과를 출력"""
+    with server.lock:
+        server.connection_count = 0
+
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/sise/entryJongmok.naver"
+    start = time.perf_counter()
+    for page in range(1, pages + 1):
+        response = get(f"{base_url}?type=KPI200&page={page}")
+        response.raise_for_status()
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<20} 연결 수: {server.connection_count:>4}  "
+          f"총 {elapsed * 1000:8.1f}ms  페이지당 {elapsed / pages * 1000:6.2f}ms")
+    return server.connection_count, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='공용 세션 연결 재사용 벤치마크')
+    parser.add_argument('--pages', type=int, default=100, help='요청할 페이지 수')
+    args = parser.parse_args()
+
+    server = start_server()
+    print(f"로컬 테스트 서버: http://127.0.0.1:{server.server_address[1]}  ({args.pages}페이지)")
+    print("-" * 70)
+
+    # 기존 방식: 페이지마다 requests.get (매번 새 연결)
+    bare_connections, bare_elapsed = run_case(
+        server, 'requests.get', lambda url: requests.get(url, headers=DEFAULT_HEADERS, timeout=5), args.pages)
+
+    # 공용 세션 방식: 연결 풀에서 재사용
+    session = create_session()
+    pooled_connections, pooled_elapsed = run_case(
+        server, '공용 세션', lambda url: session.get(url, timeout=5), args.pages)
+    session.close()
+
+    print("-" * 70)
+    print(f"절약된 연결(핸드셰이크) 수: {bare_connections - pooled_connections}개 / {args.pages}페이지")
+    print(f"속도 향상: {bare_elapsed / pooled_elapsed:.2f}배 "
+          "(TLS를 사용하는 실제 서버에서는 핸드셰이크 비용만큼 차이가 더 커집니다)")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
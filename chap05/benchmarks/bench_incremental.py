@@ -0,0 +1,89 @@
+"""
+클리앙 중고장터 증분 크롤링 비교 (기록된 응답 재생, 네트워크 없이 실행)
+
+같은 크롤링을 반복할 때 요청한 페이지 수와 시간을 비교합니다.
+
+  전체            crawl_clien_market('', 5)                      매번 5페이지
+  증분(처음)      incremental=True, 본 매물 기록 없음            5페이지 후 기록
+  증분(변경 없음) incremental=True, 다시 실행                    1페이지에서 멈춤
+  증분(새 글 3개) 최신 글 3개의 기록을 지운 뒤 실행              새 글 3개만 반환
+
+페이지 간 time.sleep(1)도 실제 크롤링 비용이므로 기본으로 포함합니다. (--skip-sleep으로 제외)
+본 매물 기록은 임시 파일에 저장하므로 chap05/.crawler_cache의 기록은 바뀌지 않습니다.
+
+실행: python benchmarks/bench_incremental.py [--pages 5] [--skip-sleep]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+CHAP05_DIR = os.path.dirname(BENCH_DIR)
+CHAP04_DIR = os.path.join(os.path.dirname(CHAP05_DIR), 'chap04')
+
+sys.path.insert(0, CHAP05_DIR)
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, CHAP04_DIR)
+
+import crawler_http
+import replay
+from bench_crawlers import _NoSleep
+from seen_index import SeenPostIndex, listing_scope
+
+
+def main():
+    parser = argparse.ArgumentParser(description='클리앙 중고장터 증분 크롤링 비교')
+    parser.add_argument('--pages', type=int, default=5, help='크롤링할 페이지 수 (기록된 페이지 수 이하)')
+    parser.add_argument('--skip-sleep', action='store_true', help='페이지 간 1초 대기를 건너뜀')
+    args = parser.parse_args()
+
+    server = replay.start_replay_server()
+    crawler_http.configure(url_rewriter=replay.replay_rewriter(server.base_url))
+
+    import 클리앙중고장터크롤링 as clien
+    if args.skip_sleep:
+        clien.time = _NoSleep(clien.time)
+
+    # 요청한 페이지 수를 세기 위해 fetch_text를 감쌈
+    requests_made = []
+    fetch_text = clien.fetch_text
+    clien.fetch_text = lambda url, *a, **kw: requests_made.append(url) or fetch_text(url, *a, **kw)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = SeenPostIndex(os.path.join(tmp, 'seen_posts.sqlite3'))
+
+        def run(**kwargs):
+            requests_made.clear()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                listings = clien.crawl_clien_market('', args.pages, seen_index=index, **kwargs)
+            return len(requests_made), len(listings), time.perf_counter() - start
+
+        rows = [('전체', run())]
+        rows.append(('증분(처음)', run(incremental=True)))
+        rows.append(('증분(변경 없음)', run(incremental=True)))
+
+        # 최신 글 3개를 아직 못 본 글로 만들어 새 글이 올라온 상황을 흉내 냄
+        newest = [row[0] for row in index.conn.execute(
+            "SELECT post_id FROM seen_posts WHERE scope = ? ORDER BY CAST(post_id AS INTEGER) DESC LIMIT 3",
+            (listing_scope('sold'),)
+        ).fetchall()]
+        index.conn.execute(f"DELETE FROM seen_posts WHERE post_id IN ({', '.join('?' * len(newest))})", newest)
+        index.conn.commit()
+        rows.append(('증분(새 글 3개)', run(incremental=True)))
+        index.close()
+
+    server.shutdown()
+
+    print(f"{'실행':<14}{'요청 페이지':>10}{'반환 매물':>10}{'시간 s':>10}")
+    print("-" * 46)
+    for name, (pages, listings, seconds) in rows:
+        print(f"{name:<14}{pages:>10}{listings:>10}{seconds:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
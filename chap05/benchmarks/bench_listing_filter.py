@@ -0,0 +1,79 @@
+"""
+매물 가격 범위/키워드 조회 시간 비교 (제목 문자열 반복 vs 타입별 컬럼)
+
+{'title', 'page'}만 남기면 가격 조건마다 모든 제목에서 가격을 다시 찾아야 합니다.
+listings_frame()으로 가격을 한 번 정수 컬럼으로 만들어 두면 조건은 컬럼 비교로 끝납니다.
+합성 매물(bench_dedup.make_listings)로 여러 가격 범위 조회를 반복해 시간을 비교합니다.
+
+실행: python benchmarks/bench_listing_filter.py [--sizes 10000 100000] [--queries 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from bench_dedup import make_listings
+from listing_parse import PRICE_PATTERN, filter_listings, listings_frame
+
+KEYWORDS = ['아이폰', '맥북', 'RTX', None]
+
+
+def price_from_title(title):
+    """제목 하나에서 가격을 찾는 방식 (매 조회마다 모든 제목에 반복)"""
+    match = PRICE_PATTERN.match(title)
+    if match is None:
+        return None
+    if match['won_sign'] or match['won']:
+        return int((match['won_sign'] or match['won']).replace(',', ''))
+    if match['man']:
+        return round(float(match['man']) * 10_000 + int(match['chun'] or 0) * 1_000)
+    return None
+
+
+def query_scan(rows, keyword, low, high):
+    count = 0
+    for row in rows:
+        if keyword and keyword.casefold() not in row['title'].casefold():
+            continue
+        price = price_from_title(row['title'])
+        if price is not None and low <= price <= high:
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='매물 가격 범위 조회 시간 비교')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--queries', type=int, default=20, help='크기별 조회 횟수')
+    args = parser.parse_args()
+
+    print(f"{'매물 수':>9}{'조회 수':>8}{'문자열 반복 ms':>16}{'컬럼 변환 ms':>14}{'컬럼 조회 ms':>14}")
+    print("-" * 61)
+    for size in args.sizes:
+        rows = [{'title': title, 'page': 1, 'url': href} for title, href in make_listings(size, duplicate_ratio=0)]
+        queries = [(KEYWORDS[i % len(KEYWORDS)], 100_000 * (i % 10), 100_000 * (i % 10) + 500_000)
+                   for i in range(args.queries)]
+
+        start = time.perf_counter()
+        scan_counts = [query_scan(rows, *query) for query in queries]
+        scan_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        df = listings_frame(rows)
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        frame_counts = [len(filter_listings(df, keyword, low, high)) for keyword, low, high in queries]
+        frame_seconds = time.perf_counter() - start
+
+        assert scan_counts == frame_counts
+        print(f"{size:>9,}{len(queries):>8}{scan_seconds * 1000:>16,.1f}{build_seconds * 1000:>14,.1f}"
+              f"{frame_seconds * 1000:>14,.1f}")
+
+
+if __name__ == '__main__':
+    main()
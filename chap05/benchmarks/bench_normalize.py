@@ -0,0 +1,107 @@
+"""
+숫자 컬럼 정규화 벤치마크
+
+크롤러가 만드는 형태('71,200', '상승400', '+0.60%')의 합성 100k행 DataFrame으로
+문자열(object) 그대로 둔 경우와 normalize_stock_frame으로 변환한 경우의
+메모리 사용량과 정렬/필터/집계 처리 시간을 비교합니다.
+
+실행: python benchmarks/bench_normalize.py [--rows 100000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawler_normalize import normalize_stock_frame
+
+
+def make_frame(rows, seed=42):
+    """크롤링 직후와 같은 문자열 컬럼으로 합성 DataFrame 생성"""
+    rng = np.random.default_rng(seed)
+    names = np.array([f"종목{i:03d}" for i in range(200)])
+
+    price = rng.integers(1000, 1000000, rows)
+    change = rng.integers(-20000, 20000, rows)
+    rate = rng.normal(0, 2, rows)
+    direction = np.where(change > 0, '상승', np.where(change < 0, '하락', '보합'))
+
+    return pd.DataFrame({
+        '페이지': (np.arange(rows) // 10 + 1).astype(str),
+        '종목명': names[rng.integers(0, len(names), rows)],
+        '현재가': [f"{v:,}" for v in price],
+        '전일비': [f"{d}{abs(v):,}" for d, v in zip(direction, change)],
+        '등락률': [f"{v:+.2f}%" for v in rate],
+        '거래량': [f"{v:,}" for v in rng.integers(1000, 50000000, rows)],
+        '거래대금': [f"{v:,}" for v in rng.integers(10, 2000000, rows)],
+        '시가총액': [f"{v:,}" for v in rng.integers(1000, 4000000, rows)],
+    }).astype(object)
+
+
+def to_int(series):
+    return series.str.replace(',', '', regex=False).astype('int64')
+
+
+def workload_strings(df):
+    """문자열 컬럼: 연산마다 다시 파싱해야 함"""
+    top = df.assign(_price=to_int(df['현재가'])).sort_values('_price', ascending=False).head(20)
+    active = df[to_int(df['거래량']) > 1000000]
+    rates = df['등락률'].str.rstrip('%').astype('float64')
+    by_name = df.assign(_value=to_int(df['거래대금'])).groupby('종목명')['_value'].sum()
+    return len(top), len(active), rates.mean(), len(by_name)
+
+
+def workload_typed(df):
+    """정규화된 컬럼: 바로 연산"""
+    top = df.sort_values('현재가', ascending=False).head(20)
+    active = df[df['거래량'] > 1000000]
+    rates = df['등락률']
+    by_name = df.groupby('종목명', observed=True)['거래대금'].sum()
+    return len(top), len(active), rates.mean(), len(by_name)
+
+
+def timed(func, arg, repeat):
+    result = func(arg)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(arg)
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='숫자 컬럼 정규화 벤치마크')
+    parser.add_argument('--rows', type=int, default=100000, help='합성 데이터 행 수')
+    parser.add_argument('--repeat', type=int, default=5, help='작업 반복 횟수')
+    args = parser.parse_args()
+
+    raw = make_frame(args.rows)
+
+    start = time.perf_counter()
+    typed = normalize_stock_frame(raw)
+    normalize_ms = (time.perf_counter() - start) * 1000
+
+    raw_mb = raw.memory_usage(deep=True).sum() / 1024 / 1024
+    typed_mb = typed.memory_usage(deep=True).sum() / 1024 / 1024
+
+    raw_ms, raw_result = timed(workload_strings, raw, args.repeat)
+    typed_ms, typed_result = timed(workload_typed, typed, args.repeat)
+
+    if raw_result[:2] != typed_result[:2] or abs(raw_result[2] - typed_result[2]) > 1e-9:
+        raise SystemExit("문자열/정규화 결과가 서로 다릅니다.")
+
+    print(f"합성 데이터 {args.rows:,}행")
+    print("-" * 60)
+    print(f"정규화 1회 비용          {normalize_ms:9.1f}ms  ({args.rows / normalize_ms * 1000:,.0f}행/초)")
+    print(f"메모리 (문자열)          {raw_mb:9.1f}MB")
+    print(f"메모리 (정규화)          {typed_mb:9.1f}MB  ({raw_mb / typed_mb:5.1f}배 감소)")
+    print(f"정렬/필터/집계 (문자열)  {raw_ms:9.1f}ms")
+    print(f"정렬/필터/집계 (정규화)  {typed_ms:9.1f}ms  ({raw_ms / typed_ms:5.1f}배)")
+    print("\n[컬럼 dtype]")
+    print(typed.dtypes.to_string())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
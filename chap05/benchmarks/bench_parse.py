@@ -0,0 +1,106 @@
+"""
+시세 테이블 파싱 마이크로 벤치마크
+
+저장된 HTML 픽스처(benchmarks/fixtures)로 기존 방식(페이지 전체를
+html.parser로 파싱 후 find_all/get_text)과 crawler_parse의
+SoupStrainer 경로, lxml XPath 경로를 비교합니다.
+
+실행: python benchmarks/bench_parse.py [--repeat 50]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import crawler_parse
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+HAS_LXML = crawler_parse.HAS_LXML
+
+
+def parse_baseline(html, table_class, min_cells):
+    """기존 크롤러와 같은 방식: 페이지 전체 파싱 후 셀마다 get_text"""
+    soup = BeautifulSoup(html, 'html.parser')
+    table = soup.find('table', {'class': table_class})
+    rows = []
+    for row in table.find_all('tr'):
+        cells = row.find_all(['td', 'th'])
+        if len(cells) >= min_cells:
+            row_data = []
+            for cell in cells:
+                text = cell.get_text(strip=True)
+                if text:
+                    row_data.append(text)
+            rows.append(row_data)
+    return rows
+
+
+def parse_strainer(html, table_class, min_cells):
+    crawler_parse.HAS_LXML = False
+    try:
+        return crawler_parse.find_table_rows(html, (table_class,), min_cells)[1]
+    finally:
+        crawler_parse.HAS_LXML = HAS_LXML
+
+
+def parse_lxml(html, table_class, min_cells):
+    return crawler_parse.find_table_rows(html, (table_class,), min_cells)[1]
+
+
+def measure(func, html, table_class, min_cells, repeat):
+    """repeat번 파싱한 평균 시간(ms)과 결과 행을 반환"""
+    result = func(html, table_class, min_cells)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(html, table_class, min_cells)
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시세 테이블 파싱 벤치마크')
+    parser.add_argument('--repeat', type=int, default=50, help='픽스처별 반복 횟수')
+    args = parser.parse_args()
+
+    cases = [('entryJongmok_KPI200_page*.html', 'type_1', 7),
+             ('sise_market_sum_sosok0_page*.html', 'type_2', 6)]
+
+    engines = [('기존(html.parser 전체)', parse_baseline),
+               ('SoupStrainer', parse_strainer)]
+    if HAS_LXML:
+        engines.append(('lxml XPath', parse_lxml))
+    else:
+        print("lxml이 설치되어 있지 않아 lxml 경로는 건너뜁니다.")
+
+    for pattern, table_class, min_cells in cases:
+        paths = sorted(glob.glob(os.path.join(FIXTURE_DIR, pattern)))
+        if not paths:
+            continue
+
+        pages = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                pages.append(f.read().decode('euc-kr'))
+
+        total_kb = sum(len(html) for html in pages) / 1024
+        print(f"\n[{pattern}] 픽스처 {len(pages)}개, {total_kb:.1f}KB (table.{table_class})")
+        print("-" * 60)
+
+        baseline_ms = None
+        for name, func in engines:
+            elapsed = 0
+            for html in pages:
+                ms, rows = measure(func, html, table_class, min_cells, args.repeat)
+                if rows != parse_baseline(html, table_class, min_cells):
+                    raise SystemExit(f"{name}: 기존 방식과 추출 결과가 다릅니다.")
+                elapsed += ms
+            per_page = elapsed / len(pages)
+            baseline_ms = baseline_ms or per_page
+            print(f"{name:<24} 페이지당 {per_page:7.3f}ms  ({baseline_ms / per_page:5.2f}배)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+종목명 검색 지연 시간 비교 (str.contains 전체 검색 vs StockSearchIndex)
+
+합성 종목명 목록에서 접두어/부분/초성 검색어와 한 글자씩 입력하는 경우의
+검색 시간을 비교합니다. str.contains는 초성 검색을 할 수 없으므로 비교에서 제외합니다.
+
+실행: python benchmarks/bench_search.py [--names 20000] [--rows 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from stock_search import StockSearchIndex
+
+PREFIXES = ['삼성', '현대', 'LG', 'SK', '한화', '롯데', '신한', 'KB', '포스코', '두산', 'CJ', '한국', '대한', '미래']
+SUFFIXES = ['전자', '화학', '바이오', '건설', '에너지', '생명', '증권', '중공업', '물산', '반도체', '제약', '금융지주']
+SYLLABLES = '가나다라마바사아자차카타파하강남동서울산대전광주인천제주'
+
+QUERIES = ['삼성', '전자', '삼성전자', 'ㅅㅅㅈㅈ', 'ㅎㄷ', 'sk하']
+
+
+def make_names(count):
+    """중복 없는 합성 종목명 목록"""
+    rng = np.random.default_rng(0)
+    names = set()
+    while len(names) < count:
+        middle = ''.join(rng.choice(list(SYLLABLES), rng.integers(0, 3)))
+        names.add(f"{rng.choice(PREFIXES)}{middle}{rng.choice(SUFFIXES)}{rng.integers(0, 100) or ''}")
+    return sorted(names)
+
+
+def timed_ms(func, repeat=20):
+    """repeat번 실행한 중앙값 (ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='종목명 검색 지연 시간 비교')
+    parser.add_argument('--names', type=int, default=20_000, help='종목명 수')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='스냅샷 이력 행 수 (mask 측정용)')
+    args = parser.parse_args()
+
+    names = make_names(args.names)
+    series = pd.Series(names)
+
+    start = time.perf_counter()
+    index = StockSearchIndex(names)
+    print(f"종목명 {len(index):,}개 색인: {(time.perf_counter() - start) * 1000:.1f}ms")
+    print(f"{'검색어':<12}{'결과 수':>8}{'str.contains ms':>18}{'인덱스 ms':>12}")
+    print("-" * 50)
+
+    for query in QUERIES:
+        index._last_query = None
+        results = index.search(query)
+
+        def search_fresh():
+            index._last_query = None
+            index.search(query)
+
+        index_ms = timed_ms(search_fresh)
+        if any(char in 'ㄱㄴㄷㄹㅁㅂㅅㅇㅈㅊㅋㅌㅍㅎ' for char in query):
+            contains_text = '(지원 안 함)'
+        else:
+            contains_ms = timed_ms(lambda: series[series.str.contains(query, case=False, regex=False)])
+            contains_text = f"{contains_ms:.3f}"
+        print(f"{query:<12}{len(results):>8}{contains_text:>18}{index_ms:>12.3f}")
+
+    # 한 글자씩 입력하는 경우 (직전 결과 안에서만 확인)
+    typed = '삼성바이오'
+
+    def type_incrementally():
+        index._last_query = None
+        for i in range(1, len(typed) + 1):
+            index.search(typed[:i])
+
+    def contains_incrementally():
+        for i in range(1, len(typed) + 1):
+            series[series.str.contains(typed[:i], case=False, regex=False)]
+
+    print("-" * 50)
+    print(f"'{typed}' 한 글자씩 입력 ({len(typed)}회 검색): "
+          f"str.contains {timed_ms(contains_incrementally):.2f}ms, 인덱스 {timed_ms(type_incrementally):.2f}ms")
+
+    # 스냅샷 이력 전체 행에 대한 필터 마스크 만들기
+    rng = np.random.default_rng(1)
+    history = pd.Series(np.array(names, dtype=object)[rng.integers(0, len(names), args.rows)]).astype('category')
+    contains_mask_ms = timed_ms(lambda: history.astype(str).str.contains('삼성', regex=False).to_numpy(), repeat=3)
+    index_mask_ms = timed_ms(lambda: index.mask(history, '삼성'), repeat=3)
+    print(f"{args.rows:,}행 필터 마스크('삼성'): str.contains {contains_mask_ms:.1f}ms, 인덱스 {index_mask_ms:.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
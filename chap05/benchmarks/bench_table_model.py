@@ -0,0 +1,117 @@
+"""
+QTableWidget(셀마다 QTableWidgetItem) vs DataFrameTableModel 표시 시간 비교
+
+예전 display_data()처럼 iterrows로 셀 객체를 만들고 ResizeToContents를 거는 방식과
+DataFrameTableModel.set_frame() + 표본 행 컬럼 너비 계산 방식을 같은 데이터로 비교합니다.
+QTableWidget 방식은 행 수에 비례해서 느려지므로 --widget-rows까지만 측정합니다.
+
+실행: python benchmarks/bench_table_model.py [--rows 1000000] [--widget-rows 20000]
+(화면이 없는 환경에서는 QT_QPA_PLATFORM=offscreen으로 실행)
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QHeaderView, QTableView, QTableWidget, QTableWidgetItem
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawler_normalize import format_stock_value
+from stock_table_model import DataFrameTableModel, sample_column_widths
+
+
+def make_frame(rows):
+    """스냅샷 이력과 같은 컬럼 구성의 합성 데이터"""
+    rng = np.random.default_rng(0)
+    names = pd.Series([f"종목{i % 2000:04d}" for i in range(rows)]).astype('category')
+    return pd.DataFrame({
+        '종목명': names,
+        '현재가': rng.integers(1_000, 900_000, rows),
+        '전일비': rng.integers(-5_000, 5_000, rows),
+        '등락률': rng.normal(0, 2, rows).round(2),
+        '거래량': rng.integers(0, 10_000_000, rows),
+        '거래대금': rng.integers(0, 1_000_000, rows),
+        '시가총액': rng.integers(0, 4_000_000, rows),
+    })
+
+
+def show_with_widget(app, table, df):
+    """예전 display_data() 방식"""
+    table.setRowCount(len(df))
+    table.setColumnCount(len(df.columns))
+    table.setHorizontalHeaderLabels(df.columns)
+    for i, row in df.iterrows():
+        for j, value in enumerate(row):
+            item = QTableWidgetItem(format_stock_value(df.columns[j], value))
+            item.setTextAlignment(Qt.AlignCenter)
+            table.setItem(i, j, item)
+    header = table.horizontalHeader()
+    for i in range(len(df.columns)):
+        header.setSectionResizeMode(i, QHeaderView.ResizeToContents)
+    app.processEvents()
+
+
+def show_with_model(app, view, model, df):
+    """DataFrameTableModel 방식"""
+    model.set_frame(df)
+    header = view.horizontalHeader()
+    for i, width in enumerate(sample_column_widths(model, view.fontMetrics())):
+        header.resizeSection(i, width)
+    app.processEvents()
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='테이블 표시 방식 비교')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='모델 방식으로 표시할 행 수')
+    parser.add_argument('--widget-rows', type=int, default=20_000, help='QTableWidget 방식으로 표시할 행 수')
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+
+    widget = QTableWidget()
+    widget.resize(800, 600)
+    widget.show()
+
+    model = DataFrameTableModel()
+    view = QTableView()
+    view.setModel(model)
+    view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    view.resize(800, 600)
+    view.show()
+
+    print(f"{'방식':<28}{'행 수':>10}{'표시 ms':>12}")
+    print("-" * 50)
+
+    small = make_frame(args.widget_rows)
+    widget_ms = timed(show_with_widget, app, widget, small)
+    print(f"{'QTableWidget + iterrows':<28}{len(small):>10,}{widget_ms:>12.1f}")
+
+    model_small_ms = timed(show_with_model, app, view, model, small)
+    print(f"{'DataFrameTableModel':<28}{len(small):>10,}{model_small_ms:>12.1f}")
+
+    large = make_frame(args.rows)
+    model_large_ms = timed(show_with_model, app, view, model, large)
+    print(f"{'DataFrameTableModel':<28}{len(large):>10,}{model_large_ms:>12.1f}")
+
+    sort_ms = timed(lambda: (model.sort(1, Qt.DescendingOrder), app.processEvents()))
+    print(f"{'  정렬 (현재가 내림차순)':<28}{len(large):>10,}{sort_ms:>12.1f}")
+
+    mask = large['종목명'].astype(str).str.contains('종목12', regex=False).to_numpy()
+    filter_ms = timed(lambda: (model.set_filter(mask), app.processEvents()))
+    print(f"{'  필터 (종목12)':<28}{model.rowCount():>10,}{filter_ms:>12.1f}")
+
+    print("-" * 50)
+    print(f"같은 {len(small):,}행 기준 {widget_ms / model_small_ms:.0f}배 빠름")
+
+
+if __name__ == '__main__':
+    main()
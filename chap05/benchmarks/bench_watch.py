@@ -0,0 +1,106 @@
+"""
+키워드 감시 비교 (키워드별 검색 크롤링 vs 피드 + Aho-Corasick, 기록된 응답 재생)
+
+1) 요청 수: 키워드마다 crawl_clien_market(keyword, 1)을 돌리면 주기마다 키워드 수만큼 요청합니다.
+   ClienWatcher는 피드에서 지난번에 본 글까지만 읽으므로 평소에는 키워드 수와 관계없이 1페이지입니다.
+   (재생 서버로 첫 주기(피드 기록만 함)를 돌린 뒤, 최신 글 3개를 못 본 글로 만들고 다음 주기의 요청 수를 셈)
+2) 매칭 시간: 제목마다 모든 키워드를 `in`으로 비교하는 방식과 KeywordMatcher를 비교합니다.
+
+실행: python benchmarks/bench_watch.py [--keywords 10 100 1000] [--titles 20000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import crawler_http
+import replay
+from bench_dedup import ITEMS, make_listings
+from clien_watch import FEED_SCOPE, ClienWatcher
+from keyword_matcher import KeywordMatcher
+from listing_dedup import normalize_title
+from seen_index import SeenPostIndex
+
+
+def make_keywords(count):
+    """실제 매물 이름 키워드 + 나머지는 모델명 형태의 합성 키워드"""
+    keywords = list(ITEMS[:count])
+    keywords += [f"모델{i:04d}" for i in range(count - len(keywords))]
+    return keywords
+
+
+def match_naive(keywords, titles):
+    patterns = [(keyword, normalize_title(keyword)) for keyword in keywords]
+    hits = 0
+    for title in titles:
+        text = normalize_title(title)
+        hits += sum(1 for _, pattern in patterns if pattern in text)
+    return hits
+
+
+def match_automaton(keywords, titles):
+    matcher = KeywordMatcher(keywords)
+    return sum(len(matcher.find(title)) for title in titles)
+
+
+def steady_state_requests(keywords, tmp):
+    """첫 주기 뒤 새 글 3개가 올라온 상황에서 한 주기에 요청한 페이지 수"""
+    index = SeenPostIndex(os.path.join(tmp, f"seen_{len(keywords)}.sqlite3"))
+    watcher = ClienWatcher(keywords, sinks=[], seen_index=index, rate_limit=1000, backfill=False,
+                           log=lambda message: None)
+    watcher.poll()
+
+    newest = [row[0] for row in index.conn.execute(
+        "SELECT post_id FROM seen_posts WHERE scope = ? ORDER BY CAST(post_id AS INTEGER) DESC LIMIT 3",
+        (FEED_SCOPE,)
+    ).fetchall()]
+    index.conn.execute(f"DELETE FROM seen_posts WHERE scope = ? AND post_id IN ({', '.join('?' * len(newest))})",
+                       [FEED_SCOPE] + newest)
+    index.conn.commit()
+
+    watcher.poll()
+    requests_made = watcher.last_poll['feed_pages']
+    watcher.close()
+    index.close()
+    return requests_made
+
+
+def main():
+    parser = argparse.ArgumentParser(description='키워드 감시 요청 수/매칭 시간 비교')
+    parser.add_argument('--keywords', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--titles', type=int, default=20_000, help='매칭 시간을 잴 제목 수')
+    args = parser.parse_args()
+
+    server = replay.start_replay_server()
+    crawler_http.configure(url_rewriter=replay.replay_rewriter(server.base_url))
+    titles = [title for title, _ in make_listings(args.titles, duplicate_ratio=0)]
+
+    print(f"{'키워드 수':>9}{'키워드별 요청':>13}{'감시기 요청':>12}{'in 비교 ms':>13}{'Aho-Corasick ms':>17}")
+    print("-" * 64)
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.keywords:
+            keywords = make_keywords(count)
+            watcher_requests = steady_state_requests(keywords, tmp)
+
+            start = time.perf_counter()
+            naive_hits = match_naive(keywords, titles)
+            naive_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            automaton_hits = match_automaton(keywords, titles)
+            automaton_seconds = time.perf_counter() - start
+
+            assert naive_hits == automaton_hits
+            print(f"{count:>9,}{count:>13,}{watcher_requests:>12}{naive_seconds * 1000:>13,.1f}"
+                  f"{automaton_seconds * 1000:>17,.1f}")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+장애 주입 로컬 HTTP 스텁으로 재시도/서킷 브레이커 확인
+
+benchmarks/fixtures의 편입종목 페이지를 돌려주는 로컬 서버를 띄우고,
+페이지마다 처음 몇 번은 503 / 응답 지연(타임아웃) / 연결 끊김을 섞어서 돌려줍니다.
+크롤러 엔진이 재시도로 모든 페이지를 모으는지(flaky),
+사이트 전체 장애에서 서킷 브레이커로 빨리 멈추는지(outage) 확인합니다.
+
+실행: python benchmarks/fault_stub.py [--scenario flaky|outage] [--pages 10] [--concurrency 1]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import crawler_http
+from crawler_http import RetryPolicy
+from kospi200_accurate_crawler import ENTRY_SOURCE, report_page_result
+from kospi200_engine import CrawlerEngine
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# 읽기 타임아웃보다 길게 지연시켜 타임아웃을 일으킴
+READ_TIMEOUT = 0.5
+SLOW_RESPONSE_SECONDS = 1.0
+
+FAULTS = ['503', 'slow', 'reset']
+
+
+class FaultHandler(BaseHTTPRequestHandler):
+    """페이지별 요청 횟수에 따라 장애를 주입하는 핸들러"""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get('page', ['1'])[0])
+
+        with self.server.lock:
+            attempt = self.server.attempts.get(page, 0)
+            self.server.attempts[page] = attempt + 1
+            self.server.request_count += 1
+
+        if self.server.outage or attempt < self.server.fail_first:
+            fault = '503' if self.server.outage else FAULTS[(page + attempt) % len(FAULTS)]
+            self.inject(fault)
+            return
+
+        path = os.path.join(FIXTURE_DIR, f'entryJongmok_KPI200_page{(page - 1) % 10 + 1}.html')
+        with open(path, 'rb') as f:
+            body = f.read()
+        self.send_body(200, body)
+
+    def inject(self, fault):
+        if fault == 'reset':
+            # 응답 없이 연결 끊기 (ConnectionError)
+            self.close_connection = True
+            self.connection.close()
+            return
+        if fault == 'slow':
+            time.sleep(SLOW_RESPONSE_SECONDS)
+        self.send_body(503, b'Service Unavailable')
+
+    def send_body(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=euc-kr')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 타임아웃으로 먼저 연결을 끊은 경우
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(fail_first=2, outage=False):
+    """임의의 빈 포트에 장애 주입 서버를 띄우고 반환"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FaultHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.attempts = {}
+    server.request_count = 0
+    server.fail_first = fail_first
+    server.outage = outage
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='장애 주입 스텁으로 재시도/서킷 브레이커 확인')
+    parser.add_argument('--scenario', choices=['flaky', 'outage'], default='flaky')
+    parser.add_argument('--pages', type=int, default=10, help='크롤링할 페이지 수')
+    parser.add_argument('--concurrency', type=int, default=1, help='동시 요청 수')
+    parser.add_argument('--fail-first', type=int, default=2, help='flaky: 페이지마다 실패시킬 처음 요청 수')
+    args = parser.parse_args()
+
+    server = start_server(args.fail_first, outage=args.scenario == 'outage')
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # 네이버 금융 대신 로컬 스텁으로 요청, 테스트 시간을 줄이기 위해 대기 시간을 짧게 설정
+    crawler_http.configure(
+        timeout=(1, READ_TIMEOUT),
+        retry_policy=RetryPolicy(max_attempts=4, base_delay=0.05, max_delay=0.5),
+        failure_threshold=5,
+        reset_timeout=30.0,
+        url_rewriter=lambda url: url.replace('https://finance.naver.com', base_url),
+    )
+
+    print(f"장애 주입 스텁: {base_url}  (시나리오: {args.scenario})")
+    print("=" * 60)
+
+    # crawl_multiple_pages()와 같은 엔진/페이지 보고를 쓰되 결과 CSV는 저장하지 않음 (파일을 남기지 않도록)
+    engine = CrawlerEngine(rate_limit=1000, burst=args.concurrency, concurrency=args.concurrency)
+    start = time.perf_counter()
+    df = engine.crawl(ENTRY_SOURCE, args.pages, on_page=report_page_result)
+    elapsed = time.perf_counter() - start
+    print(f"[요청] {engine.report.summary_text()}")
+    if engine.failed_pages:
+        print(f"[요청] 수집하지 못한 페이지: {', '.join(map(str, engine.failed_pages))}")
+
+    collected = 0 if df is None else len(df)
+    print("=" * 60)
+    print(f"수집 종목 수: {collected}개 / 기대값 {args.pages * 10}개")
+    print(f"서버가 받은 요청 수: {server.request_count}회, 소요 시간: {elapsed:.2f}초")
+
+    server.shutdown()
+
+    if args.scenario == 'flaky' and collected != args.pages * 10:
+        raise SystemExit("재시도 후에도 누락된 페이지가 있습니다.")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
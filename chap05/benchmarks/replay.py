@@ -0,0 +1,194 @@
+"""
+응답 기록/재생 하네스
+
+실제 사이트(finance.naver.com, www.clien.net, search.naver.com)의 응답을 한 번 기록해 두고,
+이후에는 로컬 HTTP 서버가 기록된 응답을 대신 돌려줍니다.
+기록된 URL과 파일 목록은 fixtures/manifest.json에 저장됩니다.
+crawler_http.configure(url_rewriter=...)로 모든 크롤러의 요청을 재생 서버로 돌립니다.
+  https://www.clien.net/service/board/sold?po=1
+  → http://127.0.0.1:<포트>/www.clien.net/service/board/sold?po=1
+
+실행:
+  python benchmarks/replay.py record [--kospi-pages 10] [--clien-pages 5]   # 실제 사이트에서 기록
+  python benchmarks/replay.py serve [--port 8000]                            # 재생 서버만 실행
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import crawler_http
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+MANIFEST_NAME = 'manifest.json'
+
+KOSPI_ENTRY_URL = 'https://finance.naver.com/sise/entryJongmok.naver?type=KPI200&page={page}'
+MARKET_SUM_URL = 'https://finance.naver.com/sise/sise_market_sum.naver?page={page}&sosok=0'
+CLIEN_SOLD_URL = 'https://www.clien.net/service/board/sold?po={page}'
+# 네이버블로그기사크롤링.py의 main()에서 사용하는 검색 URL
+NAVER_BLOG_URL = ('https://search.naver.com/search.naver?where=nexearch&sm=top_hty&fbm=0&ie=utf8'
+                  '&query=ChatGPT%EC%82%AC%EC%9A%A9%EB%B2%95&ackey=7xsmprgv')
+
+
+def load_manifest(fixture_dir=FIXTURE_DIR):
+    """{원래 URL: {'file', 'content_type'}} 기록 목록을 읽기 (없으면 빈 dict)"""
+    path = os.path.join(fixture_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, fixture_dir=FIXTURE_DIR):
+    """기록 목록을 manifest.json으로 저장"""
+    path = os.path.join(fixture_dir, MANIFEST_NAME)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def fixture_filename(url):
+    """URL로 기록 파일 이름 만들기 (호스트+경로+쿼리에서 파일명에 쓸 수 없는 문자는 _로)"""
+    parsed = urlparse(url)
+    name = f"{parsed.netloc}{parsed.path}"
+    if parsed.query:
+        name += f"_{parsed.query}"
+    return re.sub(r'[^0-9A-Za-z.=-]+', '_', name).strip('_')[:150] + '.html'
+
+
+def record(urls, fixture_dir=FIXTURE_DIR):
+    """
+    실제 사이트에 요청해서 응답 본문을 fixture_dir에 기록하는 함수
+
+    이미 기록된 URL은 새 응답으로 덮어쓰고, 실패한 URL은 건너뜁니다.
+    """
+    os.makedirs(fixture_dir, exist_ok=True)
+    manifest = load_manifest(fixture_dir)
+
+    for url in urls:
+        try:
+            response = crawler_http.fetch(url)
+        except Exception as e:
+            print(f"기록 실패: {url} ({e})")
+            continue
+
+        entry = manifest.get(url) or {'file': fixture_filename(url)}
+        with open(os.path.join(fixture_dir, entry['file']), 'wb') as f:
+            f.write(response.content)
+        entry['content_type'] = response.headers.get('Content-Type', 'text/html')
+        entry.pop('synthetic', None)
+        manifest[url] = entry
+        print(f"기록: {url} → {entry['file']} ({len(response.content):,} bytes)")
+
+    save_manifest(manifest, fixture_dir)
+    return manifest
+
+
+def default_urls(kospi_pages=10, clien_pages=5):
+    """벤치마크에 필요한 기본 URL 목록"""
+    urls = [KOSPI_ENTRY_URL.format(page=page) for page in range(1, kospi_pages + 1)]
+    urls.append(MARKET_SUM_URL.format(page=1))
+    urls.extend(CLIEN_SOLD_URL.format(page=page) for page in range(1, clien_pages + 1))
+    urls.append(NAVER_BLOG_URL)
+    return urls
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """/<호스트>/<경로>?<쿼리> 요청을 기록된 https://<호스트>/<경로>?<쿼리> 응답으로 돌려주는 핸들러"""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = 'https://' + self.path.lstrip('/')
+        entry = self.server.manifest.get(url)
+
+        if entry is None:
+            with self.server.lock:
+                self.server.misses.append(url)
+            self.send_body(404, b'Not recorded', 'text/plain')
+            return
+
+        body = self.server.bodies.get(entry['file'])
+        if body is None:
+            with open(os.path.join(self.server.fixture_dir, entry['file']), 'rb') as f:
+                body = f.read()
+            self.server.bodies[entry['file']] = body
+
+        with self.server.lock:
+            self.server.hits += 1
+            self.server.bytes_sent += len(body)
+        self.send_body(200, body, entry.get('content_type', 'text/html'))
+
+    def send_body(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_replay_server(fixture_dir=FIXTURE_DIR, port=0):
+    """기록된 응답을 돌려주는 로컬 서버를 띄우고 반환 (server.base_url로 주소 확인)"""
+    server = ThreadingHTTPServer(('127.0.0.1', port), ReplayHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.fixture_dir = fixture_dir
+    server.manifest = load_manifest(fixture_dir)
+    server.bodies = {}
+    server.hits = 0
+    server.bytes_sent = 0
+    server.misses = []
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def replay_rewriter(base_url):
+    """https://<호스트>/... 요청을 재생 서버의 /<호스트>/...로 바꾸는 url_rewriter"""
+    prefix = base_url.rstrip('/') + '/'
+    return lambda url: re.sub(r'^https?://', prefix, url, count=1)
+
+
+def install(server):
+    """모든 크롤러의 요청이 재생 서버로 가도록 crawler_http를 설정"""
+    crawler_http.configure(url_rewriter=replay_rewriter(server.base_url))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤러 응답 기록/재생 하네스')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help='실제 사이트에서 응답 기록')
+    record_parser.add_argument('--kospi-pages', type=int, default=10, help='편입종목 페이지 수')
+    record_parser.add_argument('--clien-pages', type=int, default=5, help='클리앙 중고장터 페이지 수')
+    record_parser.add_argument('--url', action='append', default=[], help='추가로 기록할 URL')
+
+    serve_parser = subparsers.add_parser('serve', help='기록된 응답으로 재생 서버 실행')
+    serve_parser.add_argument('--port', type=int, default=8000)
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record(default_urls(args.kospi_pages, args.clien_pages) + args.url)
+        return
+
+    server = start_replay_server(port=args.port)
+    print(f"재생 서버: {server.base_url}  (기록된 URL {len(server.manifest)}개, 종료: Ctrl+C)")
+    for url in server.manifest:
+        print(f"  {replay_rewriter(server.base_url)(url)}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,396 @@
+"""
+클리앙 중고장터 키워드 감시 (알림 데몬)
+
+키워드마다 검색 페이지를 따로 크롤링하지 않고, 전체 매물 목록(피드)에서 새 글만 읽어
+모든 키워드를 Aho-Corasick 매처(keyword_matcher.KeywordMatcher) 하나로 한 번에 찾습니다.
+평소에는 키워드가 100개여도 주기마다 피드 1페이지만 요청합니다.
+
+처음 실행하면(피드 기록이 없으면) 피드 1페이지를 기록만 하고 알림은 보내지 않습니다.
+오래 멈췄다가 다시 시작해서 feed_pages만큼 읽어도 지난번에 본 글에 닿지 못하면
+피드를 최대 backfill_pages페이지 더 읽어 보충합니다. (키워드 수와 관계없이 페이지 수로 제한)
+보충 페이지는 공용 스레드 풀에서 concurrency개씩 요청하고, 모든 요청은 토큰 버킷 하나로 속도를 제한합니다.
+
+알림은 sink로 보냅니다.
+  StdoutSink   표준 출력에 한 줄씩
+  JsonlSink    JSON Lines 파일에 추가
+  WebhookSink  웹훅 본문 (기본은 보내지 않고 표준 에러에 출력만 하는 스텁)
+같은 매물/키워드 알림은 seen_index에 기록해서 다시 보내지 않습니다.
+
+실행 예:
+    python clien_watch.py 아이폰 맥북 RTX --interval 60
+    python clien_watch.py --keywords-file keywords.txt --jsonl alerts.jsonl --once
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+import requests
+
+from crawler_http import FetchReport, TokenBucket, fetch_text, get_session
+from keyword_matcher import KeywordMatcher
+from listing_dedup import normalize_title
+from listing_parse import parse_listings, parse_price
+from seen_index import IncrementalCrawl, SeenPostIndex, listing_scope
+
+BOARD_URL = 'https://www.clien.net/service/board/sold'
+
+# 감시용 피드 기록 범위 (크롤러의 "새 매물만" 기록과 따로 관리)
+FEED_SCOPE = 'watch:sold'
+
+DEFAULT_INTERVAL = 60
+DEFAULT_FEED_PAGES = 5
+DEFAULT_BACKFILL_PAGES = 20
+DEFAULT_CONCURRENCY = 4
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def feed_url(page):
+    return f"{BOARD_URL}?po={page}"
+
+
+def alert_scope(keyword):
+    """키워드별 알림 기록 범위"""
+    return listing_scope('watch-alert', keyword)
+
+
+def alert_key(listing):
+    """
+    알림 기록에 쓰는 매물 키
+
+    게시글 번호가 없으면 게시글 링크, 링크도 없으면 정규화한 제목을 씁니다.
+    (번호 없는 매물도 기록해서 주기마다 다시 알리지 않도록)
+    """
+    if listing.get('post_id') is not None:
+        return listing['post_id']
+    if listing.get('url'):
+        return 'url:' + listing['url']
+    return 'title:' + normalize_title(listing['title'])
+
+
+def format_alert(alert):
+    """알림 한 줄 텍스트"""
+    price = f" ({alert['price']:,}원)" if alert.get('price') is not None else ""
+    return f"[{', '.join(alert['keywords'])}] {alert['title']}{price} {alert.get('url') or ''}".rstrip()
+
+
+def log_stderr(message):
+    print(message, file=sys.stderr)
+
+
+class StdoutSink:
+    """알림을 표준 출력에 한 줄씩 출력"""
+    def emit(self, alert):
+        print(format_alert(alert), flush=True)
+
+    def close(self):
+        pass
+
+
+class JsonlSink:
+    """알림을 JSON Lines 파일에 추가 (한 줄에 알림 하나)"""
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'a', encoding='utf-8')
+
+    def emit(self, alert):
+        self.file.write(json.dumps(alert, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class WebhookSink:
+    """
+    웹훅으로 알림 본문을 POST하는 sink
+
+    dry_run=True(기본)이면 요청을 보내지 않고 보낼 본문을 표준 에러에 출력합니다.
+    보낸(보낼) 본문은 sent에 남습니다.
+    """
+    def __init__(self, url, dry_run=True, timeout=5):
+        self.url = url
+        self.dry_run = dry_run
+        self.timeout = timeout
+        self.sent = []
+
+    def emit(self, alert):
+        payload = {'text': format_alert(alert), 'alert': alert}
+        self.sent.append(payload)
+        if self.dry_run:
+            log_stderr(f"[웹훅 미전송] {self.url} {json.dumps(payload, ensure_ascii=False)}")
+            return
+        try:
+            get_session().post(self.url, json=payload, timeout=self.timeout).raise_for_status()
+        except requests.RequestException as e:
+            log_stderr(f"[웹훅 실패] {self.url}: {e}")
+
+    def close(self):
+        pass
+
+
+class ClienWatcher:
+    """
+    여러 키워드를 감시하는 감시기
+
+    poll()을 한 번 호출하면 피드의 새 글(필요하면 보충 페이지까지)을 확인하고
+    보낸 알림 목록을 반환합니다. run()은 interval초마다 poll()을 반복합니다.
+    마지막 poll()의 요청 수는 last_poll({'feed_pages', 'failed_pages'})에 남습니다.
+    """
+    def __init__(self, keywords, sinks=None, seen_index=None, feed_pages=DEFAULT_FEED_PAGES,
+                 backfill_pages=DEFAULT_BACKFILL_PAGES, rate_limit=1.0, burst=1,
+                 concurrency=DEFAULT_CONCURRENCY, backfill=True, log=log_stderr):
+        self.matcher = KeywordMatcher(keywords)
+        self.sinks = [StdoutSink()] if sinks is None else sinks
+        self.seen_index = seen_index or SeenPostIndex()
+        self.feed_pages = feed_pages
+        self.backfill_pages = backfill_pages
+        self.backfill = backfill
+        self.concurrency = max(1, concurrency)
+        self.log = log
+
+        # 모든 피드 요청이 같이 쓰는 속도 제한과 스레드 풀
+        self.rate_limiter = TokenBucket(rate_limit, burst)
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        self.report = FetchReport()
+
+        self.stop_event = threading.Event()
+        self.last_poll = {'feed_pages': 0, 'failed_pages': 0}
+
+    def fetch_listings(self, url, page):
+        html = fetch_text(url, rate_limiter=self.rate_limiter, report=self.report)
+        return parse_listings(html, page)
+
+    def poll(self):
+        """피드의 새 글을 키워드와 비교하고 알림을 보냄 (반환: 보낸 알림 목록)"""
+        self.last_poll = {'feed_pages': 0, 'failed_pages': 0}
+
+        if self.seen_index.count(FEED_SCOPE) == 0:
+            self.seed_feed()
+            return []
+
+        listings, complete = self.read_feed()
+        if not complete and not self.stop_event.is_set() and not self.last_poll['failed_pages']:
+            self.log(f"피드 {self.last_poll['feed_pages']}페이지를 읽어도 지난번에 본 글에 닿지 못했습니다. 그보다 오래된 글은 알리지 않습니다.")
+
+        candidates = [(listing, self.matcher.find(listing['title'])) for listing in listings]
+        return self.emit_alerts(candidates)
+
+    def seed_feed(self):
+        """처음 실행할 때 피드 1페이지의 글을 본 글로 기록만 함 (지난 매물로 알림을 쏟아내지 않도록)"""
+        try:
+            page_listings = self.fetch_listings(feed_url(1), 1)
+        except requests.RequestException as e:
+            self.log(f"피드 1페이지 요청 실패: {e}")
+            self.last_poll['failed_pages'] += 1
+            return
+
+        self.last_poll['feed_pages'] += 1
+        crawl = IncrementalCrawl(self.seen_index, FEED_SCOPE)
+        crawl.check_page([listing['post_id'] for listing in page_listings])
+        crawl.commit()
+        self.log(f"처음 실행이므로 피드의 글 {len(page_listings)}개를 기록만 하고 알림은 다음 주기부터 보냅니다.")
+
+    def read_feed(self):
+        """
+        피드를 1페이지부터 지난번에 본 글이 나올 때까지 읽고 새 글 목록을 반환
+
+        feed_pages 안에서 닿지 못하면 backfill_pages페이지까지 더 읽습니다.
+        보충 페이지는 공용 스레드 풀에서 concurrency개씩 묶어 요청하고 페이지 순서대로 확인합니다.
+        반환: (새 글 목록, 지난번에 본 글까지 빠짐없이 읽었는지)
+        """
+        crawl = IncrementalCrawl(self.seen_index, FEED_SCOPE)
+        listings = []
+        failed = False
+        max_pages = self.feed_pages + (self.backfill_pages if self.backfill else 0)
+
+        page = 1
+        while page <= max_pages and not crawl.reached_seen and not failed:
+            if self.stop_event.is_set():
+                failed = True
+                break
+            if page == self.feed_pages + 1:
+                self.log(f"피드 {self.feed_pages}페이지에서 지난번에 본 글에 닿지 못해 "
+                         f"최대 {self.backfill_pages}페이지를 더 읽어 보충합니다.")
+
+            # 피드 구간은 한 페이지씩, 보충 구간은 concurrency페이지씩 요청
+            last_page = page if page <= self.feed_pages else min(max_pages, page + self.concurrency - 1)
+            batch = range(page, last_page + 1)
+            futures = [(batch_page, self.executor.submit(self.fetch_listings, feed_url(batch_page), batch_page))
+                       for batch_page in batch]
+            for batch_page, future in futures:
+                if failed or crawl.reached_seen:
+                    future.cancel()
+                    continue
+                try:
+                    page_listings = future.result()
+                except requests.RequestException as e:
+                    self.log(f"피드 {batch_page}페이지 요청 실패: {e}")
+                    self.last_poll['failed_pages'] += 1
+                    failed = True
+                    continue
+
+                self.last_poll['feed_pages'] += 1
+                new_ids, _ = crawl.check_page([listing['post_id'] for listing in page_listings])
+                listings.extend(listing for listing in page_listings
+                                if listing['post_id'] is None or listing['post_id'] in new_ids)
+            page = batch.stop
+
+        # 끝까지 읽지 못했으면 기록하지 않음 (다음 주기에 같은 구간을 다시 읽고, 알림 기록으로 중복은 걸러짐)
+        if not failed:
+            crawl.commit()
+        return listings, crawl.reached_seen and not failed
+
+    def emit_alerts(self, candidates):
+        """아직 알리지 않은 (매물, 키워드)만 매물별로 묶어 sink로 보내고 기록"""
+        by_post = {}
+        for listing, keywords in candidates:
+            if not keywords:
+                continue
+            key = alert_key(listing)
+            if key in by_post:
+                by_post[key][1].update(keywords)
+            else:
+                by_post[key] = (listing, set(keywords))
+
+        # 키워드별로 한 번에 조회해서 이미 알린 매물의 키워드를 뺌
+        keys_by_keyword = {}
+        for key, (listing, keywords) in by_post.items():
+            for keyword in keywords:
+                keys_by_keyword.setdefault(keyword, []).append(key)
+        unseen = {keyword: self.seen_index.unseen(alert_scope(keyword), keys)
+                  for keyword, keys in keys_by_keyword.items()}
+
+        pending = []
+        for key, (listing, keywords) in by_post.items():
+            keywords = {keyword for keyword in keywords if key in unseen[keyword]}
+            if keywords:
+                pending.append((key, listing, sorted(keywords)))
+        if not pending:
+            return []
+
+        prices = parse_price(pd.Series([listing['title'] for _, listing, _ in pending]))
+        alerted_at = datetime.now().strftime(TIME_FORMAT)
+        alerts = []
+        alerted_keys = []
+        for (key, listing, keywords), price in zip(pending, prices):
+            alert = {
+                'keywords': keywords,
+                'post_id': listing['post_id'],
+                'title': listing['title'],
+                'price': None if pd.isna(price) else int(price),
+                'category': listing.get('category'),
+                'author': listing.get('author'),
+                'posted_at': listing.get('posted_at'),
+                'url': listing.get('url'),
+                'alerted_at': alerted_at,
+            }
+            for sink in self.sinks:
+                sink.emit(alert)
+            alerts.append(alert)
+            alerted_keys.append(key)
+
+        for keyword in keys_by_keyword:
+            self.seen_index.add(alert_scope(keyword), [key for key, alert in zip(alerted_keys, alerts)
+                                                       if keyword in alert['keywords']])
+        return alerts
+
+    def run(self, interval=DEFAULT_INTERVAL, cycles=None):
+        """interval초마다 poll()을 반복 (cycles번 후 또는 stop()을 호출하면 끝남)"""
+        cycle = 0
+        while not self.stop_event.is_set():
+            started = time.monotonic()
+            cycle += 1
+            try:
+                alerts = self.poll()
+            except Exception as e:
+                # 한 주기의 예상 못 한 오류(파싱, 저장소, sink 등)로 감시가 멈추지 않도록 기록만 하고 계속
+                self.log(f"[{datetime.now().strftime(TIME_FORMAT)}] 확인 중 오류 (다음 주기에 다시 시도): "
+                         f"{type(e).__name__}: {e}")
+            else:
+                self.log(f"[{datetime.now().strftime(TIME_FORMAT)}] 알림 {len(alerts)}개 · "
+                         f"피드 {self.last_poll['feed_pages']}페이지 요청"
+                         + (f", 실패 {self.last_poll['failed_pages']}페이지" if self.last_poll['failed_pages'] else ""))
+            if cycles is not None and cycle >= cycles:
+                break
+            self.stop_event.wait(max(0.0, interval - (time.monotonic() - started)))
+
+    def stop(self):
+        """진행 중인 주기를 멈추고 run()을 끝냄"""
+        self.stop_event.set()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        for sink in self.sinks:
+            sink.close()
+
+
+def read_keywords(args):
+    """명령줄 키워드와 --keywords-file(한 줄에 하나, #은 주석)의 키워드 목록"""
+    keywords = list(args.keywords)
+    if args.keywords_file:
+        with open(args.keywords_file, encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if line:
+                    keywords.append(line)
+    return keywords
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='클리앙 중고장터 키워드 감시')
+    parser.add_argument('keywords', nargs='*', help='감시할 키워드')
+    parser.add_argument('--keywords-file', default=None, help='키워드 파일 (한 줄에 하나)')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL,
+                        help=f'확인 주기(초) (기본: {DEFAULT_INTERVAL})')
+    parser.add_argument('--once', action='store_true', help='한 번만 확인하고 종료')
+    parser.add_argument('--feed-pages', type=int, default=DEFAULT_FEED_PAGES,
+                        help=f'주기마다 읽을 최대 피드 페이지 수 (기본: {DEFAULT_FEED_PAGES})')
+    parser.add_argument('--backfill-pages', type=int, default=DEFAULT_BACKFILL_PAGES,
+                        help=f'오래 멈췄던 경우 더 읽을 최대 피드 페이지 수 (기본: {DEFAULT_BACKFILL_PAGES})')
+    parser.add_argument('--no-backfill', action='store_true', help='feed-pages까지만 읽음 (보충하지 않음)')
+    parser.add_argument('--rate-limit', type=float, default=1.0, help='전체 초당 요청 수 (기본: 1.0)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'보충 페이지 동시 요청 수 (기본: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--jsonl', default=None, help='알림을 추가할 JSON Lines 파일')
+    parser.add_argument('--webhook', default=None, help='알림을 보낼 웹훅 URL')
+    parser.add_argument('--send-webhook', action='store_true', help='웹훅을 실제로 전송 (기본은 출력만)')
+    parser.add_argument('--quiet', action='store_true', help='진행 메시지를 출력하지 않음')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    keywords = read_keywords(args)
+    if not keywords:
+        print("감시할 키워드를 입력하세요.", file=sys.stderr)
+        return 1
+
+    sinks = [StdoutSink()]
+    if args.jsonl:
+        sinks.append(JsonlSink(args.jsonl))
+    if args.webhook:
+        sinks.append(WebhookSink(args.webhook, dry_run=not args.send_webhook))
+
+    watcher = ClienWatcher(keywords, sinks, feed_pages=args.feed_pages, backfill_pages=args.backfill_pages,
+                           rate_limit=args.rate_limit, concurrency=args.concurrency,
+                           backfill=not args.no_backfill, log=(lambda message: None) if args.quiet else log_stderr)
+    if not args.quiet:
+        log_stderr(f"키워드 {len(watcher.matcher)}개 감시 시작 ({'한 번' if args.once else f'{args.interval:g}초마다'})")
+
+    try:
+        watcher.run(args.interval, cycles=1 if args.once else None)
+    except KeyboardInterrupt:
+        log_stderr("감시를 중지합니다.")
+    finally:
+        watcher.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
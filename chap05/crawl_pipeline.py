@@ -0,0 +1,179 @@
+"""
+지수 편입종목 크롤링 파이프라인 (Qt 없이 사용하는 라이브러리 API)
+
+선택한 지수의 모든 페이지를 CrawlerEngine의 스레드 풀 하나로 요청하고,
+페이지가 끝날 때마다 PageResult를 내보내는 제너레이터입니다.
+GUI(kospi200_gui_crawler의 CrawlerThread)와 CLI(kospi200_cli)가 같은 파이프라인을 사용합니다.
+
+    pipeline = CrawlPipeline(['KOSPI200', 'KOSDAQ150'], max_pages=3)
+    for result in pipeline:
+        ...                       # result.frame: 그 페이지의 DataFrame (없으면 None)
+    df = pipeline.result()        # '지수' 컬럼으로 구분한 전체 DataFrame
+
+진행 메시지와 수치는 pipeline.channel(ProgressChannel)에 쌓이므로
+화면 쪽에서 원하는 주기로 drain()해서 표시합니다.
+"""
+from crawl_progress import ProgressChannel
+from crawler_http import CircuitOpenError
+from kospi200_engine import CrawlerEngine, combine_frames, get_source, page_frame, parse_page
+from session_store import page_hash
+
+DEFAULT_INDICES = ['KOSPI200']
+
+# 모든 지수 페이지를 같이 요청하는 작업 스레드 수 (요청 속도는 엔진의 토큰 버킷이 제한)
+DEFAULT_CONCURRENCY = 4
+
+# 모든 지수를 합친 초당 요청 수 (사이트 부담을 줄이려고 순차 크롤링과 같은 속도로 둠)
+# 처리량은 min(concurrency / 응답 시간, rate_limit)이므로 기본값에서는 동시 요청이
+# 응답을 기다리는 시간만 겹쳐 줄 뿐 초당 1페이지를 넘지 않습니다.
+# 더 빠르게 받으려면 rate_limit도 함께 올려야 합니다. (예: concurrency=4, rate_limit=4)
+DEFAULT_RATE_LIMIT = 1.0
+
+
+class PageResult:
+    """
+    페이지 하나의 처리 결과
+
+    frame: 그 페이지 종목 DataFrame ('지수' 컬럼 포함, 종목이 없거나 실패하면 None)
+    error: 요청 실패 시 예외 (성공하면 None)
+    unchanged: 이전 결과와 HTML이 같아서 이전 행을 재사용했는지 여부
+    """
+    def __init__(self, source, page, frame=None, error=None, unchanged=False, nbytes=0):
+        self.source = source
+        self.page = page
+        self.frame = frame
+        self.error = error
+        self.unchanged = unchanged
+        self.nbytes = nbytes
+
+
+class CrawlPipeline:
+    """
+    여러 지수를 한 번에 크롤링하는 파이프라인
+
+    sources: 지수 이름('KOSPI200', 'KOSDAQ150', 'KRX100', 'KOSPI', 'KOSDAQ') 또는 Source 목록
+    max_pages: 지수별 페이지 수 (각 지수의 실제 페이지 수 이하, None이면 전체)
+    known_hashes('지수:페이지' → HTML 해시)와 previous(이전 결과)를 넘기면
+    HTML이 이전과 같은 페이지는 다시 파싱하지 않고 previous의 행을 그대로 씁니다.
+    concurrency는 rate_limit(전체 초당 요청 수)를 넘어서 빨라지지 않습니다. (DEFAULT_RATE_LIMIT 참고)
+    """
+    def __init__(self, sources=None, max_pages=1, cache=None, known_hashes=None, previous=None,
+                 concurrency=DEFAULT_CONCURRENCY, rate_limit=DEFAULT_RATE_LIMIT, burst=1):
+        self.cache = cache
+        self.known_hashes = known_hashes or {}
+        self.previous = previous
+        # 공용 크롤링 엔진 (모든 지수를 합쳐 rate_limit로 요청 제한, 캐시 적중 페이지는 기다리지 않음)
+        self.engine = CrawlerEngine(cache=cache, rate_limit=rate_limit, burst=burst, concurrency=concurrency)
+        self.sources = [get_source(source) for source in (sources or DEFAULT_INDICES)]
+        self.jobs = self.engine.schedule(self.sources, max_pages)
+        self.channel = ProgressChannel(len(self.jobs))
+        self.page_frames = {}
+        self.page_hashes = {}
+        self.unchanged_pages = []
+        self.is_running = True
+
+    def __iter__(self):
+        """요청이 끝나는 순서대로 PageResult를 내보냄 (stop()을 호출하면 남은 요청은 보내지 않음)"""
+        if self.cache is not None:
+            self.cache.reset_stats()
+
+        self.channel.post(f"{', '.join(source.index for source in self.sources)}: 총 {len(self.jobs)}페이지 크롤링 중...")
+
+        # 공용 엔진으로 요청 (연결 재사용, 캐시 사용, 일시 오류는 재시도), 파싱은 이 스레드에서
+        pages = self.engine.iter_pages(self.jobs)
+        try:
+            for source, page, html, error in pages:
+                result = self.process_page(source, page, html, error)
+                yield result
+                if isinstance(error, CircuitOpenError) or not self.is_running:
+                    break
+        finally:
+            pages.close()
+
+        self.post_summary()
+
+    def process_page(self, source, page, html, error):
+        """요청이 끝난 페이지 하나를 PageResult로 처리"""
+        label = f"[{source.index}] {page}페이지"
+
+        if isinstance(error, CircuitOpenError):
+            # 사이트 장애: 남은 페이지는 요청하지 않음
+            self.channel.post(f"{label} 크롤링 중단: {error}")
+            self.channel.page_done()
+            return PageResult(source, page, error=error)
+        if error is not None:
+            self.channel.post(f"{label} 요청 실패: {error}")
+            self.channel.page_done()
+            return PageResult(source, page, error=error)
+
+        nbytes = len(html.encode('utf-8'))
+
+        # 이전과 HTML이 같은 페이지는 파싱하지 않고 이전 결과의 행을 재사용
+        digest = page_hash(html)
+        self.page_hashes[f"{source.index}:{page}"] = digest
+        unchanged_df = self.unchanged_page(source, page, digest)
+        if unchanged_df is not None:
+            self.unchanged_pages.append((source.index, page))
+            self.page_frames[(source.name, page)] = unchanged_df
+            self.channel.page_done(len(unchanged_df), nbytes)
+            self.channel.post(f"{label} 변경 없음: 이전 {len(unchanged_df)}개 종목 사용")
+            return PageResult(source, page, unchanged_df, unchanged=True, nbytes=nbytes)
+
+        page_stock_data = parse_page(source, html, page)
+        self.channel.page_done(len(page_stock_data or ()), nbytes)
+
+        if page_stock_data is None:
+            self.channel.post(f"{label}에서 테이블을 찾을 수 없습니다.")
+            return PageResult(source, page, nbytes=nbytes)
+
+        # 종목별 메시지는 상세 로그에만 표시
+        for stock_info in page_stock_data:
+            self.channel.post(f"종목 추가: {stock_info['종목명']} - {stock_info['현재가']}원", verbose=True)
+
+        if not page_stock_data:
+            self.channel.post(f"{label}에서 종목 데이터를 찾을 수 없습니다.")
+            return PageResult(source, page, nbytes=nbytes)
+
+        page_df = page_frame(source, page_stock_data)
+        self.page_frames[(source.name, page)] = page_df
+        self.channel.post(f"{label}에서 {len(page_stock_data)}개 종목 데이터를 수집했습니다.")
+        return PageResult(source, page, page_df, nbytes=nbytes)
+
+    def unchanged_page(self, source, page, digest):
+        """HTML 해시가 이전과 같으면 이전 결과에서 그 페이지의 행을 반환 (아니면 None)"""
+        if self.previous is None or self.known_hashes.get(f"{source.index}:{page}") != digest:
+            return None
+        if '페이지' not in self.previous.columns or '지수' not in self.previous.columns:
+            return None
+
+        page_df = self.previous[(self.previous['지수'] == source.index) & (self.previous['페이지'] == page)]
+        if page_df.empty:
+            return None
+        return page_df.reset_index(drop=True)
+
+    def post_summary(self):
+        """캐시/요청/재사용 통계를 진행 채널에 기록"""
+        if self.cache is not None:
+            self.channel.post(f"[캐시] {self.cache.stats_text()}")
+
+        self.channel.post(f"[요청] {self.engine.report.summary_text()}")
+        if self.engine.failed_pages:
+            failed = ', '.join(f"{get_source(name).index} {page}" for name, page in self.engine.failed_pages)
+            self.channel.post(f"[요청] 수집하지 못한 페이지: {failed}")
+
+        if self.unchanged_pages:
+            self.channel.post(f"[세션] 변경 없는 페이지 {len(self.unchanged_pages)}개는 다시 파싱하지 않았습니다.")
+
+    def result(self):
+        """지금까지 모은 페이지를 지수 순서, 페이지 순서로 합친 DataFrame (없으면 None)"""
+        return combine_frames(self.sources, self.page_frames)
+
+    def run(self):
+        """끝까지 크롤링하고 result()를 반환"""
+        for _ in self:
+            pass
+        return self.result()
+
+    def stop(self):
+        """남은 페이지 요청 중지 (이미 받은 페이지는 result()에 남음)"""
+        self.is_running = False
@@ -0,0 +1,82 @@
+"""
+크롤링 진행 상황 채널
+
+크롤링 스레드는 메시지와 진행 수치(완료 페이지, 행 수, 받은 바이트)를 채널에 쌓기만 하고,
+화면(GUI 타이머나 CLI)은 정해진 주기로 drain()해서 모인 내용을 한 번에 반영합니다.
+행마다 시그널을 보내지 않으므로 UI 스레드 작업량이 행 수와 관계없이 일정합니다.
+쌓인 메시지는 max_pending개까지만 보관하고 넘치면 오래된 것부터 버립니다.
+"""
+import copy
+import threading
+import time
+from collections import deque
+
+# 화면이 가져가기 전까지 보관할 최대 메시지 수
+MAX_PENDING_MESSAGES = 10000
+
+
+class CrawlProgress:
+    """완료 페이지 수, 수집 행 수, 받은 바이트, 경과/남은 시간"""
+    def __init__(self, total_pages=0):
+        self.total_pages = total_pages
+        self.pages_done = 0
+        self.rows = 0
+        self.bytes = 0
+        self.started_at = time.monotonic()
+
+    def elapsed(self):
+        return time.monotonic() - self.started_at
+
+    def eta_seconds(self):
+        """지금까지 페이지당 평균 시간으로 계산한 남은 시간 (계산할 수 없으면 None)"""
+        if self.pages_done == 0 or self.total_pages <= self.pages_done:
+            return None
+        return self.elapsed() / self.pages_done * (self.total_pages - self.pages_done)
+
+    def summary_text(self):
+        """'3/10 페이지 · 30행 · 24KB · 남은 시간 약 7초' 형태의 요약"""
+        text = f"{self.pages_done}/{self.total_pages} 페이지 · {self.rows:,}행 · {self.bytes / 1024:,.0f}KB"
+        eta = self.eta_seconds()
+        if eta is not None:
+            text += f" · 남은 시간 약 {eta:.0f}초"
+        return text
+
+
+class ProgressChannel:
+    """
+    스레드 사이에서 진행 메시지와 수치를 모아 두는 채널
+
+    post(message, verbose=True)는 상세 로그에만 보일 메시지(종목 추가 등)입니다.
+    """
+    def __init__(self, total_pages=0, max_pending=MAX_PENDING_MESSAGES):
+        self._lock = threading.Lock()
+        self._messages = deque(maxlen=max_pending)
+        self._dropped = 0
+        self.progress = CrawlProgress(total_pages)
+
+    def post(self, message, verbose=False):
+        """메시지 추가 (보관 한도를 넘으면 가장 오래된 메시지를 버림)"""
+        with self._lock:
+            if len(self._messages) == self._messages.maxlen:
+                self._dropped += 1
+            self._messages.append((verbose, message))
+
+    def page_done(self, rows=0, nbytes=0):
+        """페이지 하나 처리 완료 (실패한 페이지도 rows=0으로 호출)"""
+        with self._lock:
+            self.progress.pages_done += 1
+            self.progress.rows += rows
+            self.progress.bytes += nbytes
+
+    def drain(self):
+        """
+        쌓인 메시지를 모두 꺼내고 (메시지 목록, 버려진 메시지 수, 진행 상황 복사본)을 반환
+
+        메시지 목록은 (verbose, message) 튜플입니다.
+        """
+        with self._lock:
+            messages = list(self._messages)
+            self._messages.clear()
+            dropped, self._dropped = self._dropped, 0
+            progress = copy.copy(self.progress)
+        return messages, dropped, progress
@@ -0,0 +1,206 @@
+"""
+크롤러 응답 디스크 캐시
+
+URL+파라미터별로 응답 본문을 SQLite 파일에 저장해 두고,
+TTL이 지나면 ETag/Last-Modified로 조건부 요청(If-None-Match,
+If-Modified-Since)을 보내 바뀌지 않은 페이지는 다시 받지 않습니다.
+전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다.
+"""
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlencode
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.crawler_cache', 'responses.sqlite3')
+
+# 최대 캐시 크기 (바이트)
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# 엔드포인트별 TTL (초) - URL에 키 문자열이 포함되면 해당 TTL 적용
+DEFAULT_TTLS = {
+    'entryJongmok.naver': 60,
+    'sise_market_sum.naver': 60,
+    'sise_index_detail.naver': 60,
+    'sise_index.naver': 60,
+    'clien.net': 300,
+    'search.naver.com': 600,
+}
+DEFAULT_TTL = 60
+
+# 장 마감 후에는 시세가 바뀌지 않으므로 긴 TTL 사용
+OFF_MARKET_TTL = 6 * 60 * 60
+
+KST = timezone(timedelta(hours=9))
+
+
+def is_krx_market_open(now=None):
+    """한국거래소 정규장(평일 09:00~15:30, 한국 시간) 여부"""
+    now = now or datetime.now(KST)
+    if now.tzinfo is not None:
+        now = now.astimezone(KST)
+
+    if now.weekday() >= 5:
+        return False
+
+    minutes = now.hour * 60 + now.minute
+    return 9 * 60 <= minutes <= 15 * 60 + 30
+
+
+def make_cache_key(url, params=None):
+    """URL과 쿼리 파라미터로 캐시 키 생성 (파라미터 순서 무관)"""
+    if not params:
+        return url
+    return url + ('&' if '?' in url else '?') + urlencode(sorted(params.items()))
+
+
+class CacheEntry:
+    """캐시에 저장된 응답 한 건"""
+    def __init__(self, key, body, encoding, etag, last_modified, stored_at):
+        self.key = key
+        self.body = body
+        self.encoding = encoding
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    def text(self, encoding=None):
+        """저장된 본문을 문자열로 디코딩"""
+        return self.body.decode(encoding or self.encoding or 'utf-8', errors='replace')
+
+    def conditional_headers(self):
+        """재검증 요청에 사용할 조건부 헤더"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    SQLite 기반 LRU 응답 캐시
+
+    hits: TTL 안이라 요청 없이 사용한 횟수
+    revalidated: 조건부 요청에 304를 받아 캐시를 재사용한 횟수
+    misses: 본문을 새로 내려받은 횟수
+    """
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES, ttls=None,
+                 default_ttl=DEFAULT_TTL, off_market_ttl=OFF_MARKET_TTL):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.off_market_ttl = off_market_ttl
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                encoding TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+        self.conn.commit()
+
+        self.reset_stats()
+
+    def reset_stats(self):
+        """히트/미스 카운터 초기화 (크롤링 실행마다 호출)"""
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def stats_text(self):
+        """진행 로그에 표시할 캐시 통계 문자열"""
+        return f"캐시 적중 {self.hits}건, 재검증(304) {self.revalidated}건, 새로 받음 {self.misses}건"
+
+    def ttl_for(self, url):
+        """URL에 적용할 TTL (초)"""
+        for pattern, ttl in self.ttls.items():
+            if pattern in url:
+                break
+        else:
+            ttl = self.default_ttl
+
+        if 'finance.naver.com' in url and not is_krx_market_open():
+            return max(ttl, self.off_market_ttl)
+        return ttl
+
+    def lookup(self, key):
+        """캐시 항목 조회 (없으면 None)"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT key, body, encoding, etag, last_modified, stored_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def is_fresh(self, entry, url):
+        """TTL 안에 있는 항목인지 확인"""
+        return time.time() - entry.stored_at < self.ttl_for(url)
+
+    def record_hit(self, key):
+        """TTL 안의 항목을 그대로 사용"""
+        self._touch(key, refresh=False)
+
+    def record_revalidated(self, key):
+        """304 응답을 받은 항목의 TTL을 다시 시작"""
+        self._touch(key, refresh=True)
+
+    def store(self, key, body, encoding=None, etag=None, last_modified=None):
+        """새로 받은 응답을 저장하고 용량을 넘으면 LRU 순서로 정리"""
+        now = time.time()
+        with self.lock:
+            self.misses += 1
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, body, encoding, etag, last_modified, now, now, len(body))
+            )
+            self._evict()
+            self.conn.commit()
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self.lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def _touch(self, key, refresh):
+        now = time.time()
+        with self.lock:
+            if refresh:
+                self.revalidated += 1
+                self.conn.execute("UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+            else:
+                self.hits += 1
+                self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+
+    def _evict(self):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall():
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
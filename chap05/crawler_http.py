@@ -0,0 +1,515 @@
+"""
+크롤러 공용 HTTP 모듈
+
+모든 크롤러가 하나의 keep-alive 세션(연결 풀)을 공유하도록 해서
+페이지마다 TCP/TLS 연결을 새로 맺는 비용을 없앱니다.
+일시적인 오류(타임아웃, 연결 오류, 429/5xx)는 지수 백오프+지터로 재시도하고,
+호스트별 서킷 브레이커로 사이트 장애 시 요청을 바로 중단합니다.
+"""
+import random
+import socket
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from crawler_cache import make_cache_key
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# brotli 패키지가 설치된 경우에만 br 압축을 요청 (urllib3가 해제할 수 있어야 함)
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+DEFAULT_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+}
+
+# (연결 타임아웃, 읽기 타임아웃) 초 단위
+DEFAULT_TIMEOUT = (5, 15)
+
+# 호스트별 최대 연결 수
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+
+# 재시도할 HTTP 상태 코드
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class CircuitOpenError(requests.RequestException):
+    """서킷 브레이커가 열려 있어 요청을 보내지 않았을 때 발생하는 예외"""
+
+
+class RequestCancelled(requests.RequestException):
+    """CancelToken으로 요청을 취소했을 때 발생하는 예외"""
+
+
+def _abort_response(response):
+    """
+    다른 스레드가 본문을 읽고 있는 응답의 소켓을 끊음
+
+    response.close()는 읽고 있는 스레드가 끝날 때까지(읽기 타임아웃까지) 기다리므로
+    소켓을 shutdown해서 읽기가 바로 실패하도록 합니다.
+    """
+    connection = getattr(response.raw, 'connection', None) or getattr(response.raw, '_connection', None)
+    sock = getattr(connection, 'sock', None)
+    if sock is None:
+        response.close()
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+class CancelToken:
+    """
+    진행 중인 요청을 취소하는 신호
+
+    fetch(cancel=...)로 넘기면 요청 전, 재시도 대기, 속도 제한 대기 중에 바로 멈추고,
+    cancel()을 호출하면 본문을 받고 있던 응답의 연결을 닫아 읽기를 바로 끝냅니다.
+    (응답 헤더를 기다리는 중이면 읽기 타임아웃까지 걸릴 수 있음)
+    """
+    def __init__(self):
+        self.event = threading.Event()
+        self.lock = threading.Lock()
+        self.responses = set()
+
+    @property
+    def cancelled(self):
+        return self.event.is_set()
+
+    def cancel(self):
+        self.event.set()
+        with self.lock:
+            responses = list(self.responses)
+        for response in responses:
+            _abort_response(response)
+
+    def wait(self, seconds):
+        """seconds초 동안 기다림 (그 사이 취소되면 바로 True 반환)"""
+        return self.event.wait(seconds)
+
+    def track(self, response):
+        with self.lock:
+            self.responses.add(response)
+        # track 직전에 취소된 경우
+        if self.cancelled:
+            _abort_response(response)
+
+    def untrack(self, response):
+        with self.lock:
+            self.responses.discard(response)
+
+
+class RetryPolicy:
+    """
+    재시도 정책 (지수 백오프 + full jitter)
+
+    max_attempts: 첫 요청을 포함한 최대 시도 횟수
+    n번째 재시도 전 대기 시간: 0 ~ min(max_delay, base_delay * 2**n) 사이 임의값
+    """
+    def __init__(self, max_attempts=4, base_delay=0.5, max_delay=8.0, retry_statuses=RETRY_STATUSES):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = tuple(retry_statuses)
+
+    def is_retryable(self, error):
+        """재시도할 만한 오류인지 확인"""
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code in self.retry_statuses
+        return False
+
+    def delay(self, retry_number, error=None):
+        """retry_number번째(0부터) 재시도 전 대기 시간 (초)"""
+        # 서버가 Retry-After(초)를 알려주면 우선 사용
+        response = getattr(error, 'response', None)
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(self.max_delay, float(retry_after))
+
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** retry_number)))
+
+
+class CircuitBreaker:
+    """
+    호스트별 서킷 브레이커
+
+    연속 실패가 failure_threshold번 쌓이면 열림(open) 상태가 되어 요청을 바로 거부하고,
+    reset_timeout초가 지나면 요청 하나만 시험 삼아 보내서(half-open) 성공하면 닫습니다.
+    """
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_progress = False
+        self.trial_thread = None
+        self.lock = threading.Lock()
+
+    def allow(self):
+        """요청을 보내도 되는지 확인 (안 되면 False)"""
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.reset_timeout or self.trial_in_progress:
+                return False
+            self.trial_in_progress = True
+            self.trial_thread = threading.get_ident()
+            return True
+
+    def release_trial(self):
+        """
+        이 스레드의 시험 요청이 결과 없이 끝났을 때(취소 등) 시험 상태만 풀어 줌
+
+        성공/실패로 세지 않으므로 브레이커는 열린 채로 남고, 다음 요청이 다시 시험할 수 있습니다.
+        다른 스레드의 시험 요청이거나 이미 결과가 기록되었으면 아무것도 하지 않습니다.
+        """
+        with self.lock:
+            if self.trial_in_progress and self.trial_thread == threading.get_ident():
+                self.trial_in_progress = False
+                self.trial_thread = None
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_progress = False
+            self.trial_thread = None
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.trial_in_progress or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.trial_in_progress = False
+            self.trial_thread = None
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+
+class FetchReport:
+    """
+    크롤링 실행 한 번 동안의 재시도/실패 기록
+
+    retries: URL별 재시도 횟수
+    failures: 재시도 후에도 실패한 URL과 마지막 오류
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.retries = {}
+        self.failures = {}
+
+    def record_retry(self, url):
+        with self.lock:
+            self.retries[url] = self.retries.get(url, 0) + 1
+
+    def record_failure(self, url, error):
+        with self.lock:
+            self.failures[url] = error
+
+    def summary_text(self):
+        """진행 로그에 표시할 요약 문자열"""
+        with self.lock:
+            retried_urls = len(self.retries)
+            retry_count = sum(self.retries.values())
+            failed = len(self.failures)
+        return f"재시도 {retry_count}회 ({retried_urls}개 URL), 최종 실패 {failed}개 URL"
+
+    def failure_lines(self):
+        """실패한 URL별 오류 설명 목록"""
+        with self.lock:
+            return [f"{url} - {error}" for url, error in self.failures.items()]
+
+
+_session = None
+_session_lock = threading.Lock()
+_breakers = {}
+_settings = {
+    'timeout': DEFAULT_TIMEOUT,
+    'max_connections_per_host': DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    'retry_policy': RetryPolicy(),
+    'failure_threshold': 5,
+    'reset_timeout': 30.0,
+    'url_rewriter': None,
+}
+
+
+def create_session(max_connections_per_host=DEFAULT_MAX_CONNECTIONS_PER_HOST):
+    """
+    연결 풀이 설정된 새 requests.Session을 만드는 함수
+
+    pool_block=True로 설정해서 호스트별 동시 연결 수가
+    max_connections_per_host를 넘지 않도록 합니다.
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=max_connections_per_host,
+        pool_block=True,
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def configure(timeout=None, max_connections_per_host=None, retry_policy=None,
+              failure_threshold=None, reset_timeout=None, url_rewriter=None):
+    """
+    공용 세션의 타임아웃, 호스트별 연결 수, 재시도/서킷 브레이커 설정을 변경하는 함수
+
+    연결 수가 바뀌면 다음 요청부터 새 세션을 사용합니다.
+    서킷 브레이커 설정을 바꾸면 호스트별 상태도 초기화됩니다.
+    url_rewriter(url -> url)는 로컬 테스트 서버로 요청을 돌릴 때 사용합니다.
+    """
+    global _session
+
+    with _session_lock:
+        if timeout is not None:
+            _settings['timeout'] = timeout
+
+        if retry_policy is not None:
+            _settings['retry_policy'] = retry_policy
+
+        if url_rewriter is not None:
+            _settings['url_rewriter'] = url_rewriter
+
+        if failure_threshold is not None or reset_timeout is not None:
+            if failure_threshold is not None:
+                _settings['failure_threshold'] = failure_threshold
+            if reset_timeout is not None:
+                _settings['reset_timeout'] = reset_timeout
+            _breakers.clear()
+
+        if (max_connections_per_host is not None
+                and max_connections_per_host != _settings['max_connections_per_host']):
+            _settings['max_connections_per_host'] = max_connections_per_host
+            if _session is not None:
+                _session.close()
+                _session = None
+
+
+def get_session():
+    """모든 크롤러가 공유하는 세션을 반환 (처음 호출할 때 생성)"""
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            _session = create_session(_settings['max_connections_per_host'])
+        return _session
+
+
+def get_breaker(host):
+    """호스트별 서킷 브레이커를 반환 (처음 호출할 때 생성)"""
+    with _session_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(_settings['failure_threshold'], _settings['reset_timeout'])
+            _breakers[host] = breaker
+        return breaker
+
+
+def reset_breakers():
+    """모든 호스트의 서킷 브레이커 상태 초기화"""
+    with _session_lock:
+        _breakers.clear()
+
+
+def close_session():
+    """공용 세션의 연결을 모두 닫기"""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def _read_body(response, cancel, url):
+    """cancel에 응답을 등록하고 본문을 끝까지 읽음 (읽는 중에 취소되면 RequestCancelled)"""
+    cancel.track(response)
+    try:
+        response.content
+    except Exception as e:
+        if cancel.cancelled:
+            raise RequestCancelled(f"요청이 취소되었습니다: {url}") from e
+        raise
+    finally:
+        cancel.untrack(response)
+
+
+def fetch(url, params=None, encoding=None, timeout=None, headers=None, rate_limiter=None,
+          retry_policy=None, report=None, cancel=None):
+    """
+    공용 세션으로 GET 요청을 보내고 응답을 반환하는 함수
+
+    rate_limiter(TokenBucket)를 넘기면 매 시도 전에 토큰을 기다립니다.
+    타임아웃/연결 오류/429·5xx는 retry_policy(기본: 모듈 설정)에 따라 재시도하고,
+    report(FetchReport)를 넘기면 재시도와 최종 실패를 기록합니다.
+    HTTP 오류 상태 코드는 requests.HTTPError로, 서킷 브레이커가 열려 있으면
+    CircuitOpenError로 전달됩니다. (둘 다 requests.RequestException)
+    cancel(CancelToken)을 넘기면 취소되는 즉시 RequestCancelled가 발생합니다.
+    """
+    if _settings['url_rewriter'] is not None:
+        url = _settings['url_rewriter'](url)
+
+    policy = retry_policy or _settings['retry_policy']
+    breaker = get_breaker(urlparse(url).netloc)
+
+    for attempt in range(policy.max_attempts):
+        if cancel is not None and cancel.cancelled:
+            raise RequestCancelled(f"요청이 취소되었습니다: {url}")
+
+        if not breaker.allow():
+            error = CircuitOpenError(f"{urlparse(url).netloc} 서킷 브레이커가 열려 있어 요청하지 않았습니다: {url}")
+            if report is not None:
+                report.record_failure(url, error)
+            raise error
+
+        try:
+            if rate_limiter is not None:
+                rate_limiter.acquire(cancel)
+                if cancel is not None and cancel.cancelled:
+                    raise RequestCancelled(f"요청이 취소되었습니다: {url}")
+
+            try:
+                response = get_session().get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=timeout or _settings['timeout'],
+                    stream=cancel is not None,
+                )
+                if cancel is not None:
+                    _read_body(response, cancel, url)
+                response.raise_for_status()
+            except RequestCancelled:
+                raise
+            except requests.RequestException as e:
+                if cancel is not None and cancel.cancelled:
+                    raise RequestCancelled(f"요청이 취소되었습니다: {url}") from e
+
+                retryable = policy.is_retryable(e)
+                if retryable:
+                    breaker.record_failure()
+                else:
+                    # 404 같은 오류는 서버가 정상 응답한 것이므로 장애로 보지 않음
+                    breaker.record_success()
+
+                if not retryable or attempt == policy.max_attempts - 1:
+                    if report is not None:
+                        report.record_failure(url, e)
+                    raise
+
+                if report is not None:
+                    report.record_retry(url)
+                if cancel is not None:
+                    cancel.wait(policy.delay(attempt, e))
+                else:
+                    time.sleep(policy.delay(attempt, e))
+                continue
+
+            breaker.record_success()
+            if encoding:
+                response.encoding = encoding
+            return response
+        finally:
+            # 취소 등으로 결과 없이 끝난 시험 요청(half-open)은 성공/실패로 세지 않고 풀어 줌
+            breaker.release_trial()
+
+
+def fetch_text(url, params=None, encoding=None, timeout=None, headers=None, cache=None, rate_limiter=None,
+               retry_policy=None, report=None, cancel=None):
+    """
+    GET 요청 후 디코딩된 본문 문자열을 반환하는 함수
+
+    cache(crawler_cache.ResponseCache)를 넘기면 TTL 안의 응답은 요청 없이 돌려주고,
+    TTL이 지난 응답은 ETag/Last-Modified로 재검증해서 304면 저장된 본문을 사용합니다.
+    캐시 적중 시에는 rate_limiter 토큰을 쓰지 않습니다.
+    """
+    if cache is None:
+        return fetch(url, params=params, encoding=encoding, timeout=timeout, headers=headers,
+                     rate_limiter=rate_limiter, retry_policy=retry_policy, report=report, cancel=cancel).text
+
+    key = make_cache_key(url, params)
+    entry = cache.lookup(key)
+
+    if entry is not None and cache.is_fresh(entry, key):
+        cache.record_hit(key)
+        return entry.text(encoding)
+
+    request_headers = dict(headers or {})
+    if entry is not None:
+        request_headers.update(entry.conditional_headers())
+
+    response = fetch(url, params=params, encoding=encoding, timeout=timeout, headers=request_headers,
+                     rate_limiter=rate_limiter, retry_policy=retry_policy, report=report, cancel=cancel)
+
+    if response.status_code == 304 and entry is not None:
+        cache.record_revalidated(key)
+        return entry.text(encoding)
+
+    cache.store(
+        key,
+        response.content,
+        encoding=response.encoding or response.apparent_encoding,
+        etag=response.headers.get('ETag'),
+        last_modified=response.headers.get('Last-Modified'),
+    )
+    return response.text
+
+
+class TokenBucket:
+    """
+    호스트별 요청 속도를 제한하는 토큰 버킷
+
+    rate: 초당 충전되는 토큰 수 (초당 허용 요청 수, 0보다 커야 함)
+    burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+    """
+    def __init__(self, rate=1.0, burst=1):
+        if rate <= 0:
+            raise ValueError(f"초당 요청 수(rate)는 0보다 커야 합니다: {rate}")
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, cancel=None):
+        """
+        토큰을 하나 얻을 때까지 대기
+
+        토큰이 없으면 다음 토큰을 미리 예약하고(토큰 수가 음수가 됨) 그 시각까지 기다리므로,
+        여러 스레드가 기다릴 때 먼저 호출한 순서대로 요청합니다. (우선순위 순서 유지)
+        cancel(CancelToken)이 취소되면 기다리지 않고 바로 돌아옵니다.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0
+
+        if wait_time > 0:
+            if cancel is not None:
+                cancel.wait(wait_time)
+            else:
+                time.sleep(wait_time)
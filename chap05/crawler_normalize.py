@@ -0,0 +1,111 @@
+"""
+크롤링 결과 DataFrame 정규화 모듈
+
+'71,200' 같은 천 단위 구분 문자열을 int64/float64 숫자 컬럼으로,
+'+0.60%' 등락률을 float64로, '상승400'/'하락19,000' 전일비를 부호 있는
+정수로 바꾸고, 종목명은 category dtype으로 저장합니다.
+모든 변환은 컬럼 단위(vectorized)로 한 번만 수행합니다.
+"""
+import numbers
+
+import pandas as pd
+
+# 천 단위 구분 기호가 들어간 정수/실수 컬럼
+NUMERIC_COLUMNS = ['순위', '현재가', '거래량', '거래대금', '시가총액', '액면가', '상장주식수',
+                   '외국인비율', 'PER', 'ROE', '페이지']
+
+# 전일비 앞에 붙는 방향 표시 중 음수인 것
+DOWN_WORDS = ('하락', '하한')
+
+# 숫자 앞에서 떼어낼 방향 표시 문자 (상승/하락/보합/상한/하한)
+DIRECTION_CHARS = '상승하락보합한 '
+
+
+def _to_number(series):
+    """
+    쉼표를 제거하고 숫자로 변환 (결측이 없으면 int64, 있으면 float64)
+
+    숫자로 읽을 수 없는 값이 하나라도 있으면 원래 컬럼을 그대로 반환합니다.
+    """
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+
+    cleaned = series.astype('string').str.replace(',', '', regex=False).str.strip()
+    parsed = pd.to_numeric(cleaned, errors='coerce').astype('float64')
+
+    # 컬럼 위치가 어긋나 숫자가 아닌 값이 섞여 있으면 데이터가 사라지지 않도록 원본 유지
+    if (parsed.isna() & cleaned.fillna('').ne('')).any():
+        return series
+
+    if parsed.notna().all() and (parsed % 1 == 0).all():
+        return parsed.astype('int64')
+    return parsed
+
+
+def parse_change(series):
+    """'상승400', '하락19,000', '보합0' 형태의 전일비를 부호 있는 숫자로 변환"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+
+    text = series.astype('string').str.strip()
+    values = _to_number(text.str.lstrip(DIRECTION_CHARS))
+    if not pd.api.types.is_numeric_dtype(values):
+        return series
+
+    down = text.str[:2].isin(DOWN_WORDS).fillna(False).to_numpy()
+    return values.where(~down, -values)
+
+
+def parse_rate(series):
+    """'+0.60%', '-1.78%' 형태의 등락률을 float64(퍼센트 단위)로 변환"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+
+    cleaned = series.astype('string').str.replace('%', '', regex=False).str.replace(',', '', regex=False).str.strip()
+    rates = pd.to_numeric(cleaned, errors='coerce').astype('float64')
+    if (rates.isna() & cleaned.fillna('').ne('')).any():
+        return series
+    return rates
+
+
+def normalize_stock_frame(df):
+    """
+    크롤링 직후의 문자열 DataFrame을 타입이 지정된 DataFrame으로 변환하는 함수
+
+    pd.DataFrame(all_stock_data) 직후에 한 번 호출합니다.
+    이미 변환된 컬럼은 그대로 두므로 여러 번 호출해도 결과가 같습니다.
+    """
+    if df is None or df.empty:
+        return df
+
+    df = df.copy()
+
+    for column in NUMERIC_COLUMNS:
+        if column in df.columns:
+            df[column] = _to_number(df[column])
+
+    if '전일비' in df.columns:
+        df['전일비'] = parse_change(df['전일비'])
+
+    if '등락률' in df.columns:
+        df['등락률'] = parse_rate(df['등락률'])
+
+    if '종목명' in df.columns and not isinstance(df['종목명'].dtype, pd.CategoricalDtype):
+        df['종목명'] = df['종목명'].astype('category')
+
+    return df
+
+
+def format_stock_value(column, value):
+    """화면 표시용 문자열 (천 단위 구분, 등락률 부호/퍼센트 복원)"""
+    if pd.isna(value):
+        return ''
+    if column == '등락률':
+        return f"{value:+.2f}%"
+    if column == '전일비':
+        return f"{value:+,}" if value else '0'
+    if isinstance(value, numbers.Integral):
+        return f"{value:,}"
+    if isinstance(value, numbers.Real):
+        return f"{value:,.0f}" if value % 1 == 0 else f"{value:,.2f}"
+    return str(value)
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""
+네이버 금융 시세 테이블 파싱 모듈
+
+페이지 전체 DOM을 만들지 않고 대상 테이블(table.type_1, table.type_2 등)만
+골라서 한 번에 행을 추출합니다. lxml이 설치되어 있으면 XPath를 사용하고,
+없으면 BeautifulSoup의 SoupStrainer로 테이블 부분만 파싱합니다.
+"""
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# 헤더 행을 판별하는 키워드 (종목 데이터 행에는 나오지 않음)
+HEADER_KEYWORDS = ['종목별', '현재가', '전일비', '등락률']
+
+
+def _class_xpath(table_class):
+    return f"//table[contains(concat(' ', normalize-space(@class), ' '), ' {table_class} ')]"
+
+
+def _rows_from_lxml(table, min_cells):
+    rows = []
+    for tr in table.iter('tr'):
+        cells = list(tr.iter('td', 'th'))
+        if len(cells) < min_cells:
+            continue
+
+        # BeautifulSoup의 get_text(strip=True)와 같은 결과가 나오도록 텍스트 조각별로 공백 제거
+        row_data = []
+        for cell in cells:
+            text = ''.join(part.strip() for part in cell.itertext())
+            if text:
+                row_data.append(text)
+        rows.append(row_data)
+    return rows
+
+
+def soup_table_rows(table, min_cells=1):
+    """BeautifulSoup 테이블 요소에서 셀 텍스트 행 목록을 추출 (일반 테이블 검색용)"""
+    rows = []
+    for tr in table.find_all('tr'):
+        cells = tr.find_all(['td', 'th'])
+        if len(cells) < min_cells:
+            continue
+
+        row_data = []
+        for cell in cells:
+            text = cell.get_text(strip=True)
+            if text:
+                row_data.append(text)
+        rows.append(row_data)
+    return rows
+
+
+def find_table_rows(html, table_classes=('type_1',), min_cells=1):
+    """
+    table_classes 순서대로 테이블을 찾아 셀 텍스트 행 목록을 반환하는 함수
+
+    반환값: (찾은 클래스, 행 목록). 각 행은 비어 있지 않은 셀 텍스트 리스트이며,
+    셀(td/th)이 min_cells개 미만인 행은 제외합니다.
+    대상 테이블이 없으면 (None, None)을 반환하므로 호출하는 쪽에서
+    기존의 일반 테이블 검색으로 넘어가면 됩니다.
+    """
+    if HAS_LXML:
+        document = lxml.html.fromstring(html)
+        for table_class in table_classes:
+            tables = document.xpath(_class_xpath(table_class))
+            if tables:
+                return table_class, _rows_from_lxml(tables[0], min_cells)
+        return None, None
+
+    for table_class in table_classes:
+        strainer = SoupStrainer('table', class_=table_class)
+        soup = BeautifulSoup(html, 'html.parser', parse_only=strainer)
+        table = soup.find('table')
+        if table is not None:
+            return table_class, soup_table_rows(table, min_cells)
+    return None, None
+
+
+def is_header_row(row_data, keywords=HEADER_KEYWORDS):
+    """헤더 행(종목별, 현재가 등)인지 확인"""
+    joined = ' '.join(row_data)
+    return any(keyword in joined for keyword in keywords)
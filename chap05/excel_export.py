@@ -0,0 +1,93 @@
+"""
+엑셀(xlsx) 내보내기 모듈
+
+openpyxl의 write-only 모드로 행을 순서대로 흘려 쓰기 때문에 메모리 사용량이 행 수와 관계없이 일정합니다.
+컬럼 너비는 저장한 셀을 다시 읽지 않고 DataFrame에서 컬럼 단위(str.len().max())로 계산하고,
+헤더 스타일 객체는 한 번만 만들어서 모든 헤더 셀에 같이 씁니다.
+progress(완료 행 수, 전체 행 수) 콜백으로 진행 상황을 알려 줍니다.
+"""
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+# 한 번에 변환해서 쓰는 행 수 (진행 상황 알림 단위)
+CHUNK_ROWS = 5000
+
+HEADER_COLOR = '366092'
+
+
+def column_widths(df, max_width=50):
+    """컬럼별 (헤더와 값 중 가장 긴 글자 수 + 2)를 max_width 이하로 계산"""
+    widths = []
+    for column in df.columns:
+        values = df[column].dropna()
+        longest = int(values.astype(str).str.len().max()) if len(values) else 0
+        widths.append(min(max(longest, len(str(column))) + 2, max_width))
+    return widths
+
+
+def _header_styles():
+    return (
+        Font(bold=True, color='FFFFFF'),
+        PatternFill(start_color=HEADER_COLOR, end_color=HEADER_COLOR, fill_type='solid'),
+        Alignment(horizontal='center', vertical='center'),
+    )
+
+
+def write_sheet(workbook, title, df, max_width=50, progress=None, chunk_rows=CHUNK_ROWS):
+    """write-only 워크북에 DataFrame 한 장을 시트로 추가"""
+    worksheet = workbook.create_sheet(title)
+
+    # write-only 시트는 행을 쓰기 전에 컬럼 너비를 정해야 함
+    for i, width in enumerate(column_widths(df, max_width), start=1):
+        worksheet.column_dimensions[get_column_letter(i)].width = width
+
+    font, fill, alignment = _header_styles()
+    header = []
+    for column in df.columns:
+        cell = WriteOnlyCell(worksheet, value=str(column))
+        cell.font = font
+        cell.fill = fill
+        cell.alignment = alignment
+        header.append(cell)
+    worksheet.append(header)
+
+    total = len(df)
+    for start in range(0, total, chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        # numpy 숫자는 그대로 쓰고 결측값은 빈 셀로
+        values = chunk.astype(object).where(chunk.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            worksheet.append(row)
+        if progress is not None:
+            progress(min(start + chunk_rows, total), total)
+
+    return worksheet
+
+
+def export_excel(df, filename, sheet_name='Sheet1', summary=None, summary_sheet_name='요약정보', progress=None):
+    """
+    df를 xlsx 파일로 저장하는 함수
+
+    summary(DataFrame)를 넘기면 요약 시트를 하나 더 만듭니다.
+    """
+    workbook = Workbook(write_only=True)
+    write_sheet(workbook, sheet_name, df, max_width=50, progress=progress)
+    if summary is not None:
+        write_sheet(workbook, summary_sheet_name, summary, max_width=30)
+    workbook.save(filename)
+    return filename
+
+
+def make_summary(df, crawled_at):
+    """GUI 요약 시트 내용 (총 종목 수, 크롤링 시간, 데이터 수집일)"""
+    return pd.DataFrame({
+        '항목': ['총 종목 수', '크롤링 시간', '데이터 수집일'],
+        '값': [
+            len(df),
+            crawled_at.strftime('%Y-%m-%d %H:%M:%S'),
+            crawled_at.strftime('%Y-%m-%d'),
+        ],
+    })
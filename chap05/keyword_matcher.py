@@ -0,0 +1,75 @@
+"""
+여러 키워드를 한 번에 찾는 Aho-Corasick 매처
+
+키워드가 100개를 넘어도 제목 하나를 한 번만 훑어서 들어 있는 키워드를 모두 찾습니다.
+(키워드마다 `keyword in title`을 반복하면 키워드 수에 비례해 느려짐)
+키워드와 제목은 listing_dedup.normalize_title()로 같은 형태(NFKC, 공백 정리,
+대소문자 무시)로 바꾼 뒤 비교하므로 키워드 "iPhone 15"로 "IPHONE  15" 제목도 찾습니다.
+
+    matcher = KeywordMatcher(['아이폰', '맥북 에어', 'RTX'])
+    matcher.find('맥북 에어 M2 팝니다')   # {'맥북 에어'}
+"""
+from collections import deque
+
+from listing_dedup import normalize_title
+
+
+class KeywordMatcher:
+    """
+    키워드 목록으로 만든 Aho-Corasick 오토마톤
+
+    노드는 정수 번호이고 goto[node]는 {문자: 다음 노드}, fail[node]는 실패 링크,
+    outputs[node]는 그 노드에서 끝나는 (실패 링크로 이어진 것 포함) 원래 키워드 집합입니다.
+    """
+    def __init__(self, keywords):
+        self.keywords = []
+        self.goto = [{}]
+        self.fail = [0]
+
+        pending_outputs = [set()]
+        for keyword in keywords:
+            pattern = normalize_title(keyword)
+            if not pattern or keyword in self.keywords:
+                continue
+            self.keywords.append(keyword)
+
+            node = 0
+            for char in pattern:
+                next_node = self.goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self.goto)
+                    self.goto[node][char] = next_node
+                    self.goto.append({})
+                    self.fail.append(0)
+                    pending_outputs.append(set())
+                node = next_node
+            pending_outputs[node].add(keyword)
+
+        # 너비 우선으로 실패 링크를 연결하고 출력 집합을 합침
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                pending_outputs[child] |= pending_outputs[self.fail[child]]
+                queue.append(child)
+
+        self.outputs = [frozenset(output) for output in pending_outputs]
+
+    def find(self, text):
+        """text에 들어 있는 키워드의 set (없으면 빈 set)"""
+        found = set()
+        node = 0
+        for char in normalize_title(text):
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+            if self.outputs[node]:
+                found |= self.outputs[node]
+        return found
+
+    def __len__(self):
+        return len(self.keywords)
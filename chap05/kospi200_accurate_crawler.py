@@ -1,90 +1,31 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 from datetime import datetime
-import time
 
-def crawl_kospi200_entry_stocks():
+from crawler_cache import ResponseCache
+from kospi200_engine import SOURCES, CrawlerEngine, parse_page, save_result
+from snapshot_store import SnapshotStore
+
+# 코스피200 편입종목상위 페이지 설정 (URL, type_1 테이블, 컬럼 순서)
+ENTRY_SOURCE = SOURCES['entryJongmok']
+
+def crawl_kospi200_entry_stocks(cache=None, store=None):
     """
     네이버 금융에서 코스피200 편입종목상위 정보를 정확히 크롤링하는 함수
+
+    cache(ResponseCache)를 넘기면 바뀌지 않은 페이지는 다시 받지 않습니다.
+    store(SnapshotStore)를 넘기면 결과를 스냅샷 저장소에 이어서 저장합니다.
     """
-    # 코스피200 편입종목 페이지 URL
-    url = "https://finance.naver.com/sise/entryJongmok.naver?type=KPI200&page=1"
-    
-    # User-Agent 설정
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+    engine = CrawlerEngine(cache=cache)
     
     try:
         print("네이버 금융에서 코스피200 편입종목상위 정보를 가져오는 중...")
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        
-        # 한글 인코딩 설정
-        response.encoding = 'euc-kr'
-        
-        # BeautifulSoup으로 HTML 파싱
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        print("편입종목상위 테이블을 찾는 중...")
-        
-        # 'type_1' 클래스를 가진 테이블 찾기 (제공된 HTML 구조에 맞춤)
-        target_table = soup.find('table', {'class': 'type_1'})
-        
-        if not target_table:
-            print("'type_1' 클래스 테이블을 찾을 수 없습니다.")
-            return None
-        
-        print("테이블에서 데이터를 추출하는 중...")
-        
-        # 테이블의 모든 행 찾기
-        rows = target_table.find_all('tr')
-        
-        stock_data = []
+        # 공용 엔진으로 요청/파싱/정규화 (type_1 테이블, 최소 7개 컬럼이 있는 행만)
+        df = engine.crawl(ENTRY_SOURCE, max_pages=1)
+        if cache is not None:
+            print(f"[캐시] {cache.stats_text()}")
         
-        for row in rows:
-            # td와 th 셀 찾기
-            cells = row.find_all(['td', 'th'])
-            
-            # 최소 7개 컬럼이 있는 행만 처리 (제공된 HTML 구조에 맞춤)
-            if len(cells) >= 7:
-                row_data = []
-                
-                for cell in cells:
-                    # 셀 내의 텍스트 추출 (링크 텍스트 포함)
-                    cell_text = cell.get_text(strip=True)
-                    if cell_text:
-                        row_data.append(cell_text)
-                
-                # 헤더 행인지 확인 (종목별, 현재가, 전일비 등이 포함된 행)
-                if any(keyword in ' '.join(row_data) for keyword in ['종목별', '현재가', '전일비', '등락률']):
-                    print(f"헤더 행 발견: {row_data}")
-                    continue
-                
-                # 빈 행이나 구분선 행 건너뛰기
-                if len(row_data) < 7 or not row_data[0]:
-                    continue
-                
-                # 실제 종목 데이터인지 확인 (종목명이 있는 행)
-                if len(row_data) >= 7 and row_data[0]:
-                    # 종목명, 현재가, 전일비, 등락률, 거래량, 거래대금, 시가총액 순서
-                    stock_info = {
-                        '종목명': row_data[0],
-                        '현재가': row_data[1],
-                        '전일비': row_data[2],
-                        '등락률': row_data[3],
-                        '거래량': row_data[4],
-                        '거래대금': row_data[5],
-                        '시가총액': row_data[6]
-                    }
-                    
-                    stock_data.append(stock_info)
-                    print(f"종목 데이터 추가: {row_data[0]} - {row_data[1]}원 ({row_data[3]})")
-        
-        if stock_data:
-            # 데이터프레임 생성
-            df = pd.DataFrame(stock_data)
+        if df is not None:
+            df = df.drop(columns=['페이지'])
             
             # 결과 출력
             print(f"\n=== 코스피200 편입종목상위 (크롤링 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}) ===")
@@ -93,15 +34,19 @@ def crawl_kospi200_entry_stocks():
             print(df.to_string(index=False))
             
             # CSV 파일로 저장
-            filename = f"kospi200_entry_stocks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            df.to_csv(filename, index=False, encoding='utf-8-sig')
+            filename = save_result(df, 'kospi200_entry_stocks')
             print(f"\n데이터가 {filename} 파일로 저장되었습니다.")
             
+            if store is not None:
+                inserted, skipped = store.append(df)
+                print(f"[저장소] {inserted}개 종목 저장, {skipped}개 종목 변경 없음")
+            
             return df
         else:
             print("종목 데이터를 찾을 수 없습니다.")
+            print(f"[요청] {engine.report.summary_text()}")
             return None
-            
+    
     except requests.RequestException as e:
         print(f"네트워크 오류: {e}")
         return None
@@ -111,81 +56,67 @@ def crawl_kospi200_entry_stocks():
         traceback.print_exc()
         return None
 
-def crawl_multiple_pages(max_pages=5):
+def parse_entry_page(html, page):
+    """
+    편입종목 페이지 HTML에서 종목 데이터를 추출하는 함수
+    """
+    return parse_page(ENTRY_SOURCE, html, page)
+
+def fetch_entry_page(page, rate_limiter=None, cache=None, report=None):
+    """
+    편입종목 페이지 하나를 요청하고 파싱하는 함수
+
+    일시적인 오류는 crawler_http의 재시도 정책에 따라 다시 요청하며,
+    report(FetchReport)에 재시도/실패 내역이 기록됩니다.
+    """
+    engine = CrawlerEngine(cache=cache)
+    if rate_limiter is not None:
+        engine.rate_limiter = rate_limiter
+    if report is not None:
+        engine.report = report
+    
+    return engine.crawl_page(ENTRY_SOURCE, page)
+
+def report_page_result(page, page_stock_data, error=None):
+    """
+    페이지별 수집 결과를 출력하는 함수
+    """
+    if error is not None:
+        print(f"{page}페이지 크롤링 중 오류 발생: {error}")
+    elif page_stock_data is None:
+        print(f"{page}페이지에서 테이블을 찾을 수 없습니다.")
+    elif page_stock_data:
+        print(f"{page}페이지에서 {len(page_stock_data)}개 종목 데이터를 수집했습니다.")
+    else:
+        print(f"{page}페이지에서 종목 데이터를 찾을 수 없습니다.")
+
+def crawl_multiple_pages(max_pages=5, concurrency=1, rate_limit=1.0, burst=1, cache=None, store=None):
     """
     여러 페이지의 코스피200 편입종목 정보를 크롤링하는 함수
+
+    concurrency가 2 이상이면 스레드 풀로 여러 페이지를 동시에 요청합니다.
+    동시 요청 여부와 관계없이 rate_limit(초당 요청 수)와 burst로 서버 부하를 제한하며,
+    결과는 항상 페이지 순서대로 합쳐집니다.
+    cache(ResponseCache)를 넘기면 캐시 적중 페이지는 요청 없이 바로 파싱합니다.
+    store(SnapshotStore)를 넘기면 결과를 스냅샷 저장소에 이어서 저장합니다.
     """
-    all_stock_data = []
+    engine = CrawlerEngine(cache=cache, rate_limit=rate_limit, burst=burst, concurrency=concurrency)
     
-    for page in range(1, max_pages + 1):
-        print(f"\n=== {page}페이지 크롤링 중... ===")
-        
-        url = f"https://finance.naver.com/sise/entryJongmok.naver?type=KPI200&page={page}"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        try:
-            response = requests.get(url, headers=headers)
-            response.encoding = 'euc-kr'
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            target_table = soup.find('table', {'class': 'type_1'})
-            
-            if not target_table:
-                print(f"{page}페이지에서 테이블을 찾을 수 없습니다.")
-                continue
-            
-            rows = target_table.find_all('tr')
-            page_stock_data = []
-            
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                
-                if len(cells) >= 7:
-                    row_data = []
-                    for cell in cells:
-                        cell_text = cell.get_text(strip=True)
-                        if cell_text:
-                            row_data.append(cell_text)
-                    
-                    # 헤더 행 건너뛰기
-                    if any(keyword in ' '.join(row_data) for keyword in ['종목별', '현재가', '전일비', '등락률']):
-                        continue
-                    
-                    # 실제 종목 데이터
-                    if len(row_data) >= 7 and row_data[0]:
-                        stock_info = {
-                            '페이지': page,
-                            '종목명': row_data[0],
-                            '현재가': row_data[1],
-                            '전일비': row_data[2],
-                            '등락률': row_data[3],
-                            '거래량': row_data[4],
-                            '거래대금': row_data[5],
-                            '시가총액': row_data[6]
-                        }
-                        
-                        page_stock_data.append(stock_info)
-            
-            if page_stock_data:
-                all_stock_data.extend(page_stock_data)
-                print(f"{page}페이지에서 {len(page_stock_data)}개 종목 데이터를 수집했습니다.")
-            else:
-                print(f"{page}페이지에서 종목 데이터를 찾을 수 없습니다.")
-            
-            # 페이지 간 딜레이 (서버 부하 방지)
-            time.sleep(1)
-            
-        except Exception as e:
-            print(f"{page}페이지 크롤링 중 오류 발생: {e}")
-            continue
+    if concurrency <= 1:
+        print(f"\n=== {max_pages}페이지를 순서대로 크롤링 중... ===")
+    else:
+        print(f"\n=== {max_pages}페이지를 최대 {concurrency}개씩 동시에 크롤링 중... ===")
     
-    if all_stock_data:
-        # 데이터프레임 생성
-        df = pd.DataFrame(all_stock_data)
-        
+    df = engine.crawl(ENTRY_SOURCE, max_pages, on_page=report_page_result)
+    
+    if cache is not None:
+        print(f"\n[캐시] {cache.stats_text()}")
+    
+    print(f"[요청] {engine.report.summary_text()}")
+    if engine.failed_pages:
+        print(f"[요청] 수집하지 못한 페이지: {', '.join(map(str, engine.failed_pages))}")
+    
+    if df is not None:
         # 결과 출력
         print(f"\n=== 코스피200 편입종목상위 (전체 {max_pages}페이지) ===")
         print(f"총 {len(df)}개 종목 데이터를 수집했습니다.")
@@ -193,10 +124,13 @@ def crawl_multiple_pages(max_pages=5):
         print(df.head(20).to_string(index=False))
         
         # CSV 파일로 저장
-        filename = f"kospi200_all_pages_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
+        filename = save_result(df, 'kospi200_all_pages')
         print(f"\n전체 데이터가 {filename} 파일로 저장되었습니다.")
         
+        if store is not None:
+            inserted, skipped = store.append(df)
+            print(f"[저장소] {inserted}개 종목 저장, {skipped}개 종목 변경 없음")
+        
         return df
     else:
         print("수집된 데이터가 없습니다.")
@@ -216,15 +150,24 @@ def main():
     
     choice = input("\n선택 (1 또는 2): ").strip()
     
+    # 다시 실행해도 바뀌지 않은 페이지는 내려받지 않도록 디스크 캐시 사용
+    cache = ResponseCache()
+    # 실행 결과는 스냅샷 저장소에 누적 (python snapshot_store.py로 이력 확인)
+    store = SnapshotStore()
+    
     if choice == "2":
         try:
             max_pages = int(input("크롤링할 페이지 수 (기본값: 5): ") or "5")
-            result = crawl_multiple_pages(max_pages)
+            concurrency = int(input("동시 요청 수 (기본값: 1): ") or "1")
+            rate_limit = float(input("초당 최대 요청 수 (기본값: 1): ") or "1")
+            if max_pages < 1 or concurrency < 1 or rate_limit <= 0:
+                raise ValueError("페이지 수, 동시 요청 수, 초당 요청 수는 0보다 커야 합니다.")
         except ValueError:
             print("잘못된 입력입니다. 기본값 5페이지로 진행합니다.")
-            result = crawl_multiple_pages(5)
+            max_pages, concurrency, rate_limit = 5, 1, 1.0
+        result = crawl_multiple_pages(max_pages, concurrency=concurrency, rate_limit=rate_limit, burst=concurrency, cache=cache, store=store)
     else:
-        result = crawl_kospi200_entry_stocks()
+        result = crawl_kospi200_entry_stocks(cache=cache, store=store)
     
     if result is not None:
         print("\n크롤링이 성공적으로 완료되었습니다!")
@@ -232,4 +175,4 @@ def main():
         print("\n크롤링에 실패했습니다.")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+지수 편입종목 크롤러 명령줄 실행 (PyQt5 없이 cron/컨테이너에서 실행)
+
+GUI와 같은 crawl_pipeline.CrawlPipeline으로 크롤링하고 결과를 파일로 저장합니다.
+진행 메시지는 표준 에러로, 저장한 파일 경로는 표준 출력으로 내보냅니다.
+
+실행 예:
+    python kospi200_cli.py --pages 20
+    python kospi200_cli.py --indices KOSPI200 KOSDAQ150 KOSPI --concurrency 4 --format parquet --out market.parquet
+
+종료 코드: 0 성공, 1 수집된 데이터 없음, 2 일부 페이지 실패(받은 데이터는 저장)
+"""
+import argparse
+import sys
+from datetime import datetime
+
+from crawl_pipeline import DEFAULT_CONCURRENCY, DEFAULT_INDICES, DEFAULT_RATE_LIMIT, CrawlPipeline
+from crawler_cache import ResponseCache
+from kospi200_engine import INDEX_SOURCES
+from result_export import DEFAULT_EXTENSIONS, detect_format, save_frame
+
+
+def positive_int(text):
+    """0보다 큰 정수만 받는 argparse type"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {text}")
+    return value
+
+
+def positive_float(text):
+    """0보다 큰 실수만 받는 argparse type"""
+    value = float(text)
+    if not value > 0:
+        raise argparse.ArgumentTypeError(f"0보다 커야 합니다: {text}")
+    return value
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='네이버 금융 지수 편입종목 크롤러 (GUI 없이 실행)',
+        epilog='요청 속도는 --rate-limit(모든 지수를 합친 초당 요청 수)가 정합니다. '
+               '--concurrency는 응답을 기다리는 시간만 겹쳐 주므로 기본값(초당 1회)에서는 '
+               '순차 크롤링보다 크게 빨라지지 않습니다. 더 빠르게 받으려면 두 값을 함께 올리세요. '
+               '(예: --concurrency 4 --rate-limit 4, 사이트 부담이 그만큼 커짐)')
+    parser.add_argument('--indices', nargs='+', default=DEFAULT_INDICES, choices=list(INDEX_SOURCES),
+                        help=f"크롤링할 지수/시장 (기본: {' '.join(DEFAULT_INDICES)})")
+    parser.add_argument('--pages', type=positive_int, default=None,
+                        help='지수별 페이지 수 (기본: 지수 전체 페이지)')
+    parser.add_argument('--concurrency', type=positive_int, default=DEFAULT_CONCURRENCY,
+                        help=f'동시 요청 수, --rate-limit를 넘어서 빨라지지는 않음 (기본: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--rate-limit', type=positive_float, default=DEFAULT_RATE_LIMIT,
+                        help=f'전체 초당 요청 수, 처리량의 상한 (기본: {DEFAULT_RATE_LIMIT})')
+    parser.add_argument('--format', default='csv', choices=list(DEFAULT_EXTENSIONS),
+                        help='저장 형식 (--out에 확장자가 있으면 확장자를 따름, 기본: csv)')
+    parser.add_argument('--out', default=None,
+                        help='저장할 파일 경로 (기본: kospi200_data_날짜_시간.확장자)')
+    parser.add_argument('--no-cache', action='store_true', help='응답 캐시를 사용하지 않음')
+    parser.add_argument('--quiet', action='store_true', help='진행 메시지를 출력하지 않음')
+    parser.add_argument('--verbose', action='store_true', help='종목별 메시지까지 출력')
+    return parser.parse_args(argv)
+
+
+def output_filename(out, fmt):
+    """--out/--format으로 저장할 파일 이름 결정 (확장자가 없으면 형식의 확장자를 붙임)"""
+    if out is None:
+        return f"kospi200_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}{DEFAULT_EXTENSIONS[fmt]}"
+    try:
+        detect_format(out)
+        return out
+    except ValueError:
+        return out + DEFAULT_EXTENSIONS[fmt]
+
+
+def print_progress(pipeline, verbose=False):
+    """진행 채널에 쌓인 메시지를 표준 에러로 출력"""
+    messages, dropped, progress = pipeline.channel.drain()
+    if dropped:
+        print(f"(로그 {dropped}줄 생략)", file=sys.stderr)
+    for is_verbose, message in messages:
+        if verbose or not is_verbose:
+            print(message, file=sys.stderr)
+    return progress
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    filename = output_filename(args.out, args.format)
+
+    cache = None if args.no_cache else ResponseCache()
+    pipeline = CrawlPipeline(args.indices, args.pages, cache=cache,
+                             concurrency=args.concurrency, rate_limit=args.rate_limit)
+
+    try:
+        for _ in pipeline:
+            if not args.quiet:
+                print_progress(pipeline, args.verbose)
+    except KeyboardInterrupt:
+        print("중지: 지금까지 받은 데이터만 저장합니다.", file=sys.stderr)
+
+    progress = print_progress(pipeline, args.verbose) if not args.quiet else pipeline.channel.progress
+    df = pipeline.result()
+    if df is None:
+        print("수집된 데이터가 없습니다.", file=sys.stderr)
+        return 1
+
+    save_frame(df, filename, sheet_name='편입종목')
+    if not args.quiet:
+        print(f"{progress.summary_text()} · {progress.elapsed():.1f}초", file=sys.stderr)
+    print(filename)
+
+    return 2 if pipeline.engine.failed_pages else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,430 @@
+"""
+네이버 금융 시세 크롤러 공용 엔진
+
+요청 → 테이블 찾기 → 행 추출 → DataFrame 정규화 과정을 한 곳에서 처리하고,
+페이지마다 다른 부분(URL, 테이블 클래스, 컬럼 순서, 행 검사)은
+Source 설정으로 분리합니다. entryJongmok, sise_market_sum, sise_index_detail,
+sise_index 페이지가 모두 같은 파이프라인을 사용합니다.
+
+여러 지수(코스피200, 코스닥150, KRX100, 코스피/코스닥 시가총액 상위)를 한 번에 수집할 때는
+CrawlerEngine.crawl_many가 모든 페이지를 우선순위 순서로 하나의 스레드 풀에 넣고,
+엔진의 토큰 버킷 하나로 전체 요청 속도를 제한합니다.
+"""
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from datetime import datetime
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+
+from crawler_http import CircuitOpenError, FetchReport, TokenBucket, fetch_text
+from crawler_normalize import normalize_stock_frame
+from crawler_parse import HEADER_KEYWORDS, find_table_rows, is_header_row, soup_table_rows
+from result_export import DEFAULT_EXTENSIONS, save_frame
+
+# 편입종목상위(entryJongmok) 컬럼 순서
+ENTRY_COLUMNS = ['종목명', '현재가', '전일비', '등락률', '거래량', '거래대금', '시가총액']
+
+# 시가총액 상위(sise_market_sum) 컬럼 순서 (토론실 열은 텍스트가 없어 제외됨)
+MARKET_SUM_COLUMNS = ['순위', '종목명', '현재가', '전일비', '등락률', '액면가', '시가총액',
+                      '상장주식수', '외국인비율', '거래량', 'PER', 'ROE']
+
+# 순위로 시작하는 일반 종목 테이블 컬럼 순서
+RANKED_COLUMNS = ['순위', '종목명', '현재가', '전일비', '등락률', '거래량', '거래대금', '시가총액']
+
+RANKED_HEADER_KEYWORDS = ['순위', '종목명', '현재가', '전일비', '등락률']
+
+
+def has_stock_name(row_data, source):
+    """컬럼 수가 맞고 첫 셀(종목명)이 비어 있지 않은 행"""
+    return len(row_data) >= source.min_cells and bool(row_data[0])
+
+
+def is_ranked_row(row_data, source):
+    """첫 셀이 1 이상의 순위 숫자인 행"""
+    if len(row_data) < source.min_cells:
+        return False
+    try:
+        return int(row_data[0]) >= 1
+    except ValueError:
+        return False
+
+
+class Source:
+    """
+    크롤링 대상 페이지 설정
+
+    url_template: '{page}' 자리에 페이지 번호가 들어가는 URL
+    table_classes: 빠른 경로(crawler_parse.find_table_rows)로 찾을 테이블 클래스 순서
+    content_keywords: 클래스로 찾지 못했을 때 페이지 전체에서 고를 테이블의 포함 문자열
+                      (None이면 전체 검색을 하지 않음, 빈 튜플이면 모든 테이블 검사)
+    columns: 셀 순서대로 붙일 컬럼명
+    row_validator: row_validator(row_data, source)가 True인 행만 사용
+    index: 여러 지수를 합친 결과에서 '지수' 컬럼에 들어갈 이름
+    priority: 여러 지수를 같이 수집할 때의 순서 (작을수록 먼저 요청)
+    max_pages: 전체 종목을 받는 데 필요한 페이지 수
+    """
+    def __init__(self, name, title, url_template, table_classes, columns, min_cells,
+                 row_validator=has_stock_name, header_keywords=HEADER_KEYWORDS,
+                 content_keywords=None, paginated=False, encoding='euc-kr',
+                 index=None, priority=0, max_pages=1):
+        self.name = name
+        self.title = title
+        self.url_template = url_template
+        self.table_classes = tuple(table_classes)
+        self.columns = list(columns)
+        self.min_cells = min_cells
+        self.row_validator = row_validator
+        self.header_keywords = header_keywords
+        self.content_keywords = content_keywords
+        self.paginated = paginated
+        self.encoding = encoding
+        self.index = index or name
+        self.priority = priority
+        self.max_pages = max_pages if paginated else 1
+
+    def page_url(self, page=1):
+        return self.url_template.format(page=page)
+
+
+SOURCES = {
+    'entryJongmok': Source(
+        'entryJongmok', '코스피200 편입종목상위',
+        'https://finance.naver.com/sise/entryJongmok.naver?type=KPI200&page={page}',
+        table_classes=('type_1',), columns=ENTRY_COLUMNS, min_cells=7,
+        paginated=True, index='KOSPI200', priority=0, max_pages=20,
+    ),
+    'entryJongmok_KSQ150': Source(
+        'entryJongmok_KSQ150', '코스닥150 편입종목상위',
+        'https://finance.naver.com/sise/entryJongmok.naver?type=KSQ150&page={page}',
+        table_classes=('type_1',), columns=ENTRY_COLUMNS, min_cells=7,
+        paginated=True, index='KOSDAQ150', priority=1, max_pages=15,
+    ),
+    'entryJongmok_KRX100': Source(
+        'entryJongmok_KRX100', 'KRX100 편입종목상위',
+        'https://finance.naver.com/sise/entryJongmok.naver?type=KRX100&page={page}',
+        table_classes=('type_1',), columns=ENTRY_COLUMNS, min_cells=7,
+        paginated=True, index='KRX100', priority=1, max_pages=10,
+    ),
+    'sise_market_sum': Source(
+        'sise_market_sum', '코스피 시가총액 상위',
+        'https://finance.naver.com/sise/sise_market_sum.naver?page={page}&sosok=0',
+        table_classes=('type_2',), columns=MARKET_SUM_COLUMNS, min_cells=6,
+        row_validator=is_ranked_row, header_keywords=RANKED_HEADER_KEYWORDS,
+        content_keywords=('종목명', '현재가'), paginated=True,
+        index='KOSPI', priority=2, max_pages=20,
+    ),
+    'sise_market_sum_kosdaq': Source(
+        'sise_market_sum_kosdaq', '코스닥 시가총액 상위',
+        'https://finance.naver.com/sise/sise_market_sum.naver?page={page}&sosok=1',
+        table_classes=('type_2',), columns=MARKET_SUM_COLUMNS, min_cells=6,
+        row_validator=is_ranked_row, header_keywords=RANKED_HEADER_KEYWORDS,
+        content_keywords=('종목명', '현재가'), paginated=True,
+        index='KOSDAQ', priority=2, max_pages=35,
+    ),
+    'sise_index_detail': Source(
+        'sise_index_detail', '코스피200 상세 편입종목',
+        'https://finance.naver.com/sise/sise_index_detail.naver?code=KPI200',
+        table_classes=(), columns=RANKED_COLUMNS, min_cells=3,
+        row_validator=is_ranked_row, header_keywords=RANKED_HEADER_KEYWORDS,
+        content_keywords=('종목명',),
+    ),
+    'sise_index': Source(
+        'sise_index', '코스피200 지수 페이지',
+        'https://finance.naver.com/sise/sise_index.naver?code=KPI200',
+        table_classes=('type_1', 'type_2', 'type_3'), columns=RANKED_COLUMNS, min_cells=4,
+        row_validator=is_ranked_row, header_keywords=RANKED_HEADER_KEYWORDS,
+        content_keywords=(),
+    ),
+}
+
+
+# 지수 이름 → Source 이름 (crawl_many에 지수 이름으로 넘길 수 있음)
+INDEX_SOURCES = {source.index: name for name, source in SOURCES.items() if source.paginated}
+
+
+def get_source(source):
+    """Source, Source 이름, 지수 이름('KOSDAQ150' 등) 중 무엇이든 Source로 변환"""
+    if isinstance(source, Source):
+        return source
+    return SOURCES[INDEX_SOURCES.get(source, source)]
+
+
+def search_tables(html, source):
+    """
+    클래스로 테이블을 찾지 못했을 때 페이지 전체에서 종목 테이블을 고르는 함수
+
+    content_keywords를 모두 포함하고 유효한 종목 행이 하나 이상 있는 첫 테이블의 행을 반환합니다.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    for table in soup.find_all('table'):
+        table_text = table.get_text()
+        if not all(keyword in table_text for keyword in source.content_keywords):
+            continue
+        rows = soup_table_rows(table, min_cells=source.min_cells)
+        if any(source.row_validator(row_data, source) for row_data in rows):
+            return rows
+    return None
+
+
+def parse_page(source, html, page=1):
+    """
+    페이지 HTML에서 종목 행을 dict 목록으로 추출하는 함수
+
+    대상 테이블이 없으면 None, 테이블은 있지만 종목 행이 없으면 빈 리스트를 반환합니다.
+    """
+    rows = None
+    if source.table_classes:
+        _, rows = find_table_rows(html, source.table_classes, min_cells=source.min_cells)
+    if rows is None and source.content_keywords is not None:
+        rows = search_tables(html, source)
+    if rows is None:
+        return None
+
+    page_stock_data = []
+    for row_data in rows:
+        if is_header_row(row_data, source.header_keywords):
+            continue
+        if not source.row_validator(row_data, source):
+            continue
+
+        stock_info = {'페이지': page} if source.paginated else {}
+        stock_info.update(zip(source.columns, row_data))
+        page_stock_data.append(stock_info)
+
+    return page_stock_data
+
+
+def save_result(df, prefix, fmt='csv'):
+    """
+    결과를 타임스탬프가 붙은 파일로 저장하고 파일명을 반환
+
+    fmt: 'csv', 'csv.zst', 'parquet', 'feather', 'xlsx' (result_export 참고)
+    """
+    filename = f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}{DEFAULT_EXTENSIONS[fmt]}"
+    return save_frame(df, filename)
+
+
+class CrawlerEngine:
+    """
+    Source 설정으로 페이지를 요청/파싱해서 정규화된 DataFrame을 만드는 엔진
+
+    cache(ResponseCache), rate_limit/burst(초당 요청 수), concurrency(동시 요청 수)는
+    모든 Source에 공통으로 적용되며, report(FetchReport)에 재시도/실패가 기록됩니다.
+    """
+    def __init__(self, cache=None, rate_limit=1.0, burst=1, concurrency=1):
+        self.cache = cache
+        self.concurrency = concurrency
+        self.rate_limiter = TokenBucket(rate_limit, burst)
+        self.report = FetchReport()
+        self.failed_pages = []
+
+    def fetch_page(self, source, page=1):
+        """페이지 HTML을 요청 (공용 세션, 캐시, 재시도 적용)"""
+        return fetch_text(source.page_url(page), encoding=source.encoding, cache=self.cache,
+                          rate_limiter=self.rate_limiter, report=self.report)
+
+    def crawl_page(self, source, page=1):
+        """페이지 하나를 요청하고 파싱"""
+        return parse_page(source, self.fetch_page(source, page), page)
+
+    def crawl_pages(self, source, max_pages=1, on_page=None):
+        """
+        여러 페이지를 요청해서 {페이지: 행 목록}을 반환하는 함수
+
+        concurrency가 2 이상이면 스레드 풀로 동시에 요청합니다.
+        on_page(page, page_stock_data, error)가 페이지마다 호출되며,
+        요청이나 파싱에 실패한 페이지는 failed_pages에 남기고 나머지 페이지는 계속 크롤링합니다.
+        서킷 브레이커가 열리면 남은 페이지는 요청하지 않습니다.
+        """
+        page_results = {}
+        self.failed_pages = []
+        on_page = on_page or (lambda page, data, error: None)
+
+        if self.concurrency <= 1:
+            for page in range(1, max_pages + 1):
+                try:
+                    page_results[page] = self.crawl_page(source, page)
+                    on_page(page, page_results[page], None)
+                except CircuitOpenError as e:
+                    on_page(page, None, e)
+                    self.failed_pages.extend(range(page, max_pages + 1))
+                    break
+                except Exception as e:
+                    # 요청 실패뿐 아니라 형식이 깨진 페이지(파싱 오류)도 그 페이지만 실패로 기록하고 계속
+                    on_page(page, None, e)
+                    self.failed_pages.append(page)
+        else:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                futures = {
+                    executor.submit(self.crawl_page, source, page): page
+                    for page in range(1, max_pages + 1)
+                }
+
+                for future in as_completed(futures):
+                    page = futures[future]
+                    try:
+                        page_results[page] = future.result()
+                        on_page(page, page_results[page], None)
+                    except Exception as e:
+                        on_page(page, None, e)
+                        self.failed_pages.append(page)
+
+        self.failed_pages.sort()
+        return page_results
+
+    def crawl(self, source, max_pages=1, on_page=None):
+        """페이지들을 크롤링해서 페이지 순서대로 합친 정규화 DataFrame을 반환 (없으면 None)"""
+        source = get_source(source)
+
+        page_results = self.crawl_pages(source, max_pages if source.paginated else 1, on_page)
+
+        # 완료 순서와 관계없이 페이지 순서대로 병합
+        all_stock_data = []
+        for page in sorted(page_results):
+            if page_results[page]:
+                all_stock_data.extend(page_results[page])
+
+        if not all_stock_data:
+            return None
+        return normalize_stock_frame(pd.DataFrame(all_stock_data))
+
+    def crawl_first(self, sources, max_pages=1, on_page=None):
+        """
+        sources를 순서대로 시도해서 데이터를 얻은 첫 Source와 DataFrame을 반환
+
+        모두 실패하면 (None, None)을 반환합니다.
+        """
+        for source in sources:
+            source = get_source(source)
+            df = self.crawl(source, max_pages, on_page)
+            if df is not None:
+                return source, df
+        return None, None
+
+    def schedule(self, sources, max_pages=None):
+        """
+        여러 Source의 (source, page) 요청 목록을 우선순위 순서로 만드는 함수
+
+        max_pages: None이면 Source별 max_pages, 숫자면 모든 Source에 같은 값(각 Source의 max_pages 이하),
+                   dict면 {Source 이름 또는 지수 이름: 페이지 수}
+        우선순위가 같은 Source끼리는 페이지 번호 순서로 번갈아 요청합니다.
+        """
+        sources = [get_source(source) for source in sources]
+        jobs = []
+        for order, source in enumerate(sources):
+            if isinstance(max_pages, dict):
+                pages = max_pages.get(source.index, max_pages.get(source.name, source.max_pages))
+            elif max_pages is None:
+                pages = source.max_pages
+            else:
+                pages = min(max_pages, source.max_pages)
+
+            for page in range(1, (pages if source.paginated else 1) + 1):
+                jobs.append((source.priority, page, order, source))
+
+        jobs.sort(key=lambda job: job[:3])
+        return [(source, page) for _, page, _, source in jobs]
+
+    def iter_pages(self, jobs):
+        """
+        (source, page) 목록을 공용 스레드 풀(concurrency개)에서 요청하고,
+        끝나는 순서대로 (source, page, html, error)를 내보내는 제너레이터
+
+        요청은 jobs 순서대로 시작되고, 전체 속도는 엔진의 토큰 버킷 하나로 제한됩니다.
+        반복을 중간에 멈추면(break/close) 아직 시작하지 않은 요청은 보내지 않습니다.
+        서킷 브레이커가 열리면 남은 요청을 취소하고 self.failed_pages에 기록합니다.
+        """
+        self.failed_pages = []
+        pending_jobs = deque(jobs)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, self.concurrency)) as executor:
+                futures = {}
+
+                def submit_next():
+                    # 한꺼번에 제출하지 않아야 멈출 때 남은 요청을 바로 버릴 수 있음
+                    while pending_jobs and len(futures) < max(1, self.concurrency):
+                        source, page = pending_jobs.popleft()
+                        futures[executor.submit(self.fetch_page, source, page)] = (source, page)
+
+                submit_next()
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        source, page = futures.pop(future)
+                        try:
+                            html, error = future.result(), None
+                        except requests.RequestException as e:
+                            html, error = None, e
+                            self.failed_pages.append((source.name, page))
+                            if isinstance(error, CircuitOpenError):
+                                self.failed_pages.extend((s.name, p) for s, p in pending_jobs)
+                                pending_jobs.clear()
+
+                        yield source, page, html, error
+
+                    submit_next()
+        finally:
+            self.failed_pages.sort()
+
+    def fetch_pages(self, jobs, handle):
+        """
+        iter_pages의 콜백 버전
+
+        handle(source, page, html, error)는 요청이 끝나는 순서대로 호출한 스레드에서 실행되며,
+        False를 반환하면 아직 시작하지 않은 요청은 취소합니다.
+        """
+        pages = self.iter_pages(jobs)
+        for source, page, html, error in pages:
+            if handle(source, page, html, error) is False:
+                pages.close()
+                break
+
+    def crawl_many(self, sources, max_pages=None, on_page=None):
+        """
+        여러 지수/시장을 한 번에 크롤링해서 '지수' 컬럼으로 구분한 하나의 DataFrame을 반환 (없으면 None)
+
+        sources: Source, Source 이름, 지수 이름('KOSPI200', 'KOSDAQ150', 'KRX100', 'KOSPI', 'KOSDAQ') 목록
+        on_page(source, page, page_stock_data, error)가 페이지마다 호출됩니다.
+        행 순서는 sources 순서, 그 안에서는 페이지 순서입니다.
+        """
+        sources = [get_source(source) for source in sources]
+        jobs = self.schedule(sources, max_pages)
+        page_frames = {}
+
+        def handle(source, page, html, error):
+            page_stock_data = None if error else parse_page(source, html, page)
+            if page_stock_data:
+                page_frames[(source.name, page)] = page_frame(source, page_stock_data)
+            if on_page is not None:
+                return on_page(source, page, page_stock_data, error)
+
+        self.fetch_pages(jobs, handle)
+        return combine_frames(sources, page_frames)
+
+
+def page_frame(source, page_stock_data):
+    """페이지 하나의 행 목록을 맨 앞에 '지수' 컬럼이 붙은 정규화 DataFrame으로 변환"""
+    frame = normalize_stock_frame(pd.DataFrame(page_stock_data))
+    frame.insert(0, '지수', source.index)
+    return frame
+
+
+def combine_frames(sources, page_frames):
+    """
+    {(Source 이름, 페이지): DataFrame}을 sources 순서, 페이지 순서로 합친 하나의 DataFrame (없으면 None)
+
+    Source마다 컬럼이 다르면 없는 컬럼은 결측값이 되고, '지수'는 sources 순서의 category입니다.
+    """
+    sources = [get_source(source) for source in sources]
+    order = {source.name: i for i, source in enumerate(sources)}
+    keys = sorted((key for key in page_frames if key[0] in order), key=lambda key: (order[key[0]], key[1]))
+    if not keys:
+        return None
+
+    # 페이지마다 종목명 category가 달라서 합친 뒤 한 번 더 정규화
+    df = normalize_stock_frame(pd.concat([page_frames[key] for key in keys], ignore_index=True))
+    df['지수'] = pd.Categorical(df['지수'], categories=[source.index for source in sources])
+    return df
\ No newline at end of file
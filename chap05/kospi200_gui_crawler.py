@@ -1,113 +1,188 @@
 import sys
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 from datetime import datetime
 import time
 import os
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-                             QTextEdit, QTableWidget, QTableWidgetItem, 
+                             QPlainTextEdit, QTableView, 
                              QHeaderView, QMessageBox, QProgressBar, QSpinBox,
-                             QGroupBox, QGridLayout, QFileDialog, QSplitter)
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
+                             QGroupBox, QGridLayout, QFileDialog, QSplitter, QCheckBox,
+                             QDialog)
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal, Qt
 from PyQt5.QtGui import QFont, QIcon
 
+from crawl_pipeline import DEFAULT_INDICES, CrawlPipeline
+from crawler_cache import ResponseCache
+from crawler_normalize import normalize_stock_frame
+from excel_export import export_excel, make_summary
+from kospi200_engine import INDEX_SOURCES, SOURCES, get_source
+from kospi200_monitor import Kospi200Monitor
+from result_export import DEFAULT_EXTENSIONS, detect_format, load_frame, save_frame
+from session_store import SessionStore
+from snapshot_analytics import SnapshotAnalytics
+from snapshot_store import SnapshotStore
+from stock_search import StockSearchIndex
+from stock_table_model import DataFrameTableModel, sample_column_widths
+
+# 진행 상황을 화면에 반영하는 주기 (ms, 약 10fps)
+PROGRESS_REFRESH_MS = 100
+
+# 파일 저장/열기 다이얼로그 필터 → 저장 형식
+FILE_FILTERS = {
+    "CSV Files (*.csv)": 'csv',
+    "압축 CSV (*.csv.zst)": 'csv.zst',
+    "Parquet (*.parquet)": 'parquet',
+    "Feather/Arrow (*.feather *.arrow)": 'feather',
+}
+
+# 크롤링할 수 있는 지수/시장 (체크박스 순서, 처음에는 crawl_pipeline.DEFAULT_INDICES만 선택)
+INDEX_CHOICES = {
+    'KOSPI200': '코스피200',
+    'KOSDAQ150': '코스닥150',
+    'KRX100': 'KRX100',
+    'KOSPI': '코스피 전체',
+    'KOSDAQ': '코스닥 전체',
+}
+
+# 실시간 모니터링(Kospi200Monitor)이 조회하는 지수
+MONITOR_INDEX = 'KOSPI200'
+
+# 시작할 때 저장된 세션을 복원한 뒤 바로 백그라운드에서 새로고침할지 여부
+REFRESH_ON_START = True
+
+# 로그 창에 남겨 둘 최대 줄 수
+PROGRESS_LOG_LINES = 200
+DETAIL_LOG_LINES = 5000
+
+class LogView(QPlainTextEdit):
+    """
+    최근 max_lines줄만 보관하는 읽기 전용 로그 창
+    """
+    def __init__(self, max_lines):
+        super().__init__()
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(max_lines)
+    
+    def append(self, text):
+        self.appendPlainText(text)
+
 class CrawlerThread(QThread):
     """
     크롤링 작업을 별도 스레드에서 실행하는 클래스
+
+    요청/파싱은 Qt와 관계없는 crawl_pipeline.CrawlPipeline이 처리하고,
+    이 스레드는 결과를 시그널로 GUI에 전달하기만 합니다.
+    진행 메시지와 수치는 시그널 대신 self.channel(ProgressChannel)에 쌓이고,
+    GUI가 타이머로 주기적으로 가져갑니다.
+    페이지를 파싱할 때마다 page_signal로 그 페이지의 행을 바로 보내고,
+    끝나면(중지한 경우 포함) 지금까지 모은 전체 데이터를 finished_signal로 보냅니다.
     """
-    progress_signal = pyqtSignal(str)
+    page_signal = pyqtSignal(pd.DataFrame)
     finished_signal = pyqtSignal(pd.DataFrame)
     error_signal = pyqtSignal(str)
     
-    def __init__(self, max_pages=1):
+    def __init__(self, max_pages=1, cache=None, known_hashes=None, previous=None, sources=None):
         super().__init__()
-        self.max_pages = max_pages
+        self.pipeline = CrawlPipeline(sources or DEFAULT_INDICES, max_pages, cache=cache,
+                                      known_hashes=known_hashes, previous=previous)
+        self.jobs = self.pipeline.jobs
+        self.channel = self.pipeline.channel
+        self.page_hashes = self.pipeline.page_hashes
+        self.unchanged_pages = self.pipeline.unchanged_pages
         self.is_running = True
     
     def run(self):
         try:
-            all_stock_data = []
-            
-            for page in range(1, self.max_pages + 1):
-                if not self.is_running:
-                    break
-                    
-                self.progress_signal.emit(f"{page}페이지 크롤링 중...")
-                
-                url = f"https://finance.naver.com/sise/entryJongmok.naver?type=KPI200&page={page}"
-                
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                
-                response = requests.get(url, headers=headers)
-                response.encoding = 'euc-kr'
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                target_table = soup.find('table', {'class': 'type_1'})
-                
-                if not target_table:
-                    self.progress_signal.emit(f"{page}페이지에서 테이블을 찾을 수 없습니다.")
-                    continue
-                
-                rows = target_table.find_all('tr')
-                page_stock_data = []
-                
-                for row in rows:
-                    if not self.is_running:
-                        break
-                        
-                    cells = row.find_all(['td', 'th'])
-                    
-                    if len(cells) >= 7:
-                        row_data = []
-                        for cell in cells:
-                            cell_text = cell.get_text(strip=True)
-                            if cell_text:
-                                row_data.append(cell_text)
-                        
-                        # 헤더 행 건너뛰기
-                        if any(keyword in ' '.join(row_data) for keyword in ['종목별', '현재가', '전일비', '등락률']):
-                            continue
-                        
-                        # 실제 종목 데이터
-                        if len(row_data) >= 7 and row_data[0]:
-                            stock_info = {
-                                '페이지': page,
-                                '종목명': row_data[0],
-                                '현재가': row_data[1],
-                                '전일비': row_data[2],
-                                '등락률': row_data[3],
-                                '거래량': row_data[4],
-                                '거래대금': row_data[5],
-                                '시가총액': row_data[6]
-                            }
-                            
-                            page_stock_data.append(stock_info)
-                            self.progress_signal.emit(f"종목 추가: {row_data[0]} - {row_data[1]}원")
-                
-                if page_stock_data:
-                    all_stock_data.extend(page_stock_data)
-                    self.progress_signal.emit(f"{page}페이지에서 {len(page_stock_data)}개 종목 데이터를 수집했습니다.")
-                else:
-                    self.progress_signal.emit(f"{page}페이지에서 종목 데이터를 찾을 수 없습니다.")
-                
-                # 페이지 간 딜레이
-                time.sleep(1)
+            for result in self.pipeline:
+                if result.frame is not None:
+                    self.page_signal.emit(result.frame)
             
-            if all_stock_data:
-                df = pd.DataFrame(all_stock_data)
+            df = self.pipeline.result()
+            if df is not None:
                 self.finished_signal.emit(df)
             else:
                 self.error_signal.emit("수집된 데이터가 없습니다.")
-                
+        
         except Exception as e:
             self.error_signal.emit(f"크롤링 중 오류 발생: {str(e)}")
     
     def stop(self):
         self.is_running = False
+        self.pipeline.stop()
+
+class ExcelExportThread(QThread):
+    """
+    엑셀 파일 저장을 별도 스레드에서 실행하는 클래스
+    """
+    progress_signal = pyqtSignal(int, int)
+    finished_signal = pyqtSignal(str)
+    error_signal = pyqtSignal(str)
+    
+    def __init__(self, df, filename):
+        super().__init__()
+        self.df = df
+        self.filename = filename
+    
+    def run(self):
+        try:
+            export_excel(self.df, self.filename, sheet_name='코스피200_편입종목',
+                         summary=make_summary(self.df, datetime.now()),
+                         progress=self.progress_signal.emit)
+            self.finished_signal.emit(self.filename)
+        except Exception as e:
+            self.error_signal.emit(str(e))
+
+class MonitorThread(QThread):
+    """
+    장중에 주기적으로 다시 조회해서 바뀐 종목만 전달하는 모니터링 스레드
+    """
+    changes_signal = pyqtSignal(list)
+    progress_signal = pyqtSignal(str)
+    
+    def __init__(self, max_pages=1, interval=60, store=None):
+        super().__init__()
+        self.monitor = Kospi200Monitor(max_pages, interval, callbacks=[self.emit_changes], store=store,
+                                       log=self.progress_signal.emit)
+    
+    def emit_changes(self, changes, polled_at):
+        self.progress_signal.emit(f"[{polled_at.strftime('%H:%M:%S')}] 모니터링: 변경 {len(changes)}건")
+        if changes:
+            self.changes_signal.emit(changes)
+    
+    def run(self):
+        self.monitor.run()
+    
+    def stop(self):
+        self.monitor.stop()
+
+class AnalyticsDialog(QDialog):
+    """
+    저장된 스냅샷으로 계산한 종목별 분석 결과 창 (헤더를 클릭하면 정렬)
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle('코스피200 스냅샷 분석')
+        self.resize(900, 600)
+        
+        layout = QVBoxLayout(self)
+        self.movers_label = QLabel("")
+        self.movers_label.setWordWrap(True)
+        self.model = DataFrameTableModel()
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.setSortingEnabled(True)
+        self.view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        layout.addWidget(self.movers_label)
+        layout.addWidget(self.view)
+    
+    def show_analytics(self, analytics):
+        summary = analytics.summary().round(2).reset_index()
+        self.model.set_frame(summary)
+        self.view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        for i, width in enumerate(sample_column_widths(self.model, self.view.fontMetrics())):
+            self.view.horizontalHeader().resizeSection(i, width)
+        self.movers_label.setText(f"누적수익률 {analytics.movers_text()}")
 
 class Kospi200CrawlerGUI(QMainWindow):
     """
@@ -116,8 +191,23 @@ class Kospi200CrawlerGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.crawler_thread = None
+        self.monitor_thread = None
+        self.excel_thread = None
         self.current_data = None
+        self.search_index = StockSearchIndex()
+        self.response_cache = ResponseCache()
+        self.snapshot_store = SnapshotStore()
+        # 스냅샷 분석 (새로 저장된 행만 이어서 계산)
+        self.analytics = SnapshotAnalytics(self.snapshot_store)
+        self.analytics_dialog = None
+        # 마지막 결과를 닫을 때 저장하고 다음 실행 때 바로 불러오는 세션 저장소
+        self.session = SessionStore()
+        self.session_hashes = {}
+        self.session_crawled_at = None
+        self.session_dirty = False
+        self.refreshing = False
         self.init_ui()
+        self.restore_session()
     
     def init_ui(self):
         """UI 초기화"""
@@ -157,10 +247,17 @@ class Kospi200CrawlerGUI(QMainWindow):
         
         # 검색 입력창
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("검색할 종목명을 입력하세요 (예: 삼성전자)")
+        self.search_input.setPlaceholderText("검색할 종목명을 입력하세요 (예: 삼성전자, 초성 ㅅㅅㅈㅈ)")
         self.search_input.setFont(QFont("Arial", 10))
         self.search_input.returnPressed.connect(self.search_stock)
         
+        # 입력이 멈추고 150ms 뒤에 한 번만 필터 적용 (입력할 때마다 검색하지 않음)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.apply_search_filter)
+        self.search_input.textChanged.connect(lambda _: self.search_timer.start())
+        
         # 검색 버튼
         self.search_button = QPushButton("검색")
         self.search_button.setFont(QFont("Arial", 10))
@@ -183,14 +280,30 @@ class Kospi200CrawlerGUI(QMainWindow):
     def create_crawler_settings(self, parent_layout):
         """크롤러 설정 영역 생성"""
         settings_group = QGroupBox("크롤링 설정")
+        group_layout = QVBoxLayout()
         settings_layout = QHBoxLayout()
         
-        # 페이지 수 설정
-        page_label = QLabel("크롤링할 페이지 수:")
+        # 지수/시장 선택 (선택한 지수의 모든 페이지를 한 번에 크롤링)
+        index_layout = QHBoxLayout()
+        index_label = QLabel("크롤링할 지수:")
+        index_label.setFont(QFont("Arial", 10))
+        index_layout.addWidget(index_label)
+        
+        self.index_checkboxes = {}
+        for index, title in INDEX_CHOICES.items():
+            checkbox = QCheckBox(title)
+            checkbox.setFont(QFont("Arial", 10))
+            checkbox.setChecked(index in DEFAULT_INDICES)
+            self.index_checkboxes[index] = checkbox
+            index_layout.addWidget(checkbox)
+        index_layout.addStretch()
+        
+        # 페이지 수 설정 (지수마다 실제 페이지 수보다 많이 요청하지 않음)
+        page_label = QLabel("지수별 페이지 수:")
         page_label.setFont(QFont("Arial", 10))
         
         self.page_spinbox = QSpinBox()
-        self.page_spinbox.setRange(1, 20)
+        self.page_spinbox.setRange(1, max(source.max_pages for source in map(get_source, INDEX_CHOICES)))
         self.page_spinbox.setValue(1)
         self.page_spinbox.setFont(QFont("Arial", 10))
         
@@ -205,13 +318,32 @@ class Kospi200CrawlerGUI(QMainWindow):
         self.stop_button.clicked.connect(self.stop_crawling)
         self.stop_button.setEnabled(False)
         
+        # 모니터링 간격 설정
+        interval_label = QLabel("모니터링 간격(초):")
+        interval_label.setFont(QFont("Arial", 10))
+        
+        self.interval_spinbox = QSpinBox()
+        self.interval_spinbox.setRange(10, 3600)
+        self.interval_spinbox.setValue(60)
+        self.interval_spinbox.setFont(QFont("Arial", 10))
+        
+        # 실시간 모니터링 버튼 (장중에만 조회, 바뀐 종목만 테이블에 반영)
+        self.monitor_button = QPushButton("실시간 모니터링 시작")
+        self.monitor_button.setFont(QFont("Arial", 10))
+        self.monitor_button.clicked.connect(self.toggle_monitoring)
+        
         settings_layout.addWidget(page_label)
         settings_layout.addWidget(self.page_spinbox)
+        settings_layout.addWidget(interval_label)
+        settings_layout.addWidget(self.interval_spinbox)
         settings_layout.addStretch()
         settings_layout.addWidget(self.crawl_button)
         settings_layout.addWidget(self.stop_button)
+        settings_layout.addWidget(self.monitor_button)
         
-        settings_group.setLayout(settings_layout)
+        group_layout.addLayout(index_layout)
+        group_layout.addLayout(settings_layout)
+        settings_group.setLayout(group_layout)
         parent_layout.addWidget(settings_group)
     
     def create_progress_area(self, parent_layout):
@@ -220,15 +352,19 @@ class Kospi200CrawlerGUI(QMainWindow):
         progress_layout = QVBoxLayout()
         
         # 진행 상황 텍스트
-        self.progress_text = QTextEdit()
+        self.progress_text = LogView(PROGRESS_LOG_LINES)
         self.progress_text.setMaximumHeight(100)
         self.progress_text.setFont(QFont("Consolas", 9))
-        self.progress_text.setReadOnly(True)
         
-        # 진행률 바
+        # 진행률 바 (완료 페이지 / 전체 페이지, 행 수, 받은 용량, 남은 시간)
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         
+        # 크롤링 스레드의 진행 채널을 주기적으로 비워서 한 번에 화면에 반영
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(PROGRESS_REFRESH_MS)
+        self.progress_timer.timeout.connect(self.flush_progress)
+        
         progress_layout.addWidget(self.progress_text)
         progress_layout.addWidget(self.progress_bar)
         
@@ -240,23 +376,33 @@ class Kospi200CrawlerGUI(QMainWindow):
         # 분할 위젯 생성
         splitter = QSplitter(Qt.Horizontal)
         
-        # 테이블 위젯
-        self.table_widget = QTableWidget()
-        self.table_widget.setFont(QFont("Arial", 9))
-        self.table_widget.setAlternatingRowColors(True)
+        # 테이블 뷰 (DataFrame 모델에서 보이는 셀만 그때그때 읽어 옴)
+        self.table_model = DataFrameTableModel()
+        self.table_view = QTableView()
+        self.table_view.setModel(self.table_model)
+        self.table_view.setFont(QFont("Arial", 9))
+        self.table_view.setAlternatingRowColors(True)
+        
+        # 행 높이를 고정해서 행 수와 관계없이 스크롤/그리기 비용이 일정하도록 설정
+        vertical_header = self.table_view.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(self.table_view.fontMetrics().height() + 8)
+        
+        # 헤더를 클릭하면 정렬 (처음에는 크롤링 순서 그대로)
+        self.table_view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.table_view.setSortingEnabled(True)
         
         # 로그 위젯
         log_group = QGroupBox("크롤링 로그")
         log_layout = QVBoxLayout()
         
-        self.log_text = QTextEdit()
+        self.log_text = LogView(DETAIL_LOG_LINES)
         self.log_text.setFont(QFont("Consolas", 9))
-        self.log_text.setReadOnly(True)
         
         log_layout.addWidget(self.log_text)
         log_group.setLayout(log_layout)
         
-        splitter.addWidget(self.table_widget)
+        splitter.addWidget(self.table_view)
         splitter.addWidget(log_group)
         splitter.setSizes([800, 400])  # 초기 크기 설정
         
@@ -267,17 +413,27 @@ class Kospi200CrawlerGUI(QMainWindow):
         button_layout = QHBoxLayout()
         
         # CSV 저장 버튼
-        self.save_button = QPushButton("CSV 저장")
+        self.save_button = QPushButton("파일 저장")
         self.save_button.setFont(QFont("Arial", 10))
-        self.save_button.clicked.connect(self.save_to_csv)
+        self.save_button.clicked.connect(self.save_to_file)
         self.save_button.setEnabled(False)
         
+        # 저장한 결과 파일 열기 버튼 (Arrow 파일은 메모리 맵으로 바로 열림)
+        self.open_button = QPushButton("파일 열기")
+        self.open_button.setFont(QFont("Arial", 10))
+        self.open_button.clicked.connect(self.open_file)
+        
         # 엑셀 저장 버튼
         self.excel_button = QPushButton("엑셀에 저장")
         self.excel_button.setFont(QFont("Arial", 10))
         self.excel_button.clicked.connect(self.save_to_excel)
         self.excel_button.setEnabled(False)
         
+        # 스냅샷 분석 버튼 (수익률, 회전율, 시가총액 비중, 변동성)
+        self.analytics_button = QPushButton("분석 보기")
+        self.analytics_button.setFont(QFont("Arial", 10))
+        self.analytics_button.clicked.connect(self.show_analytics)
+        
         # 테이블 새로고침 버튼
         self.refresh_button = QPushButton("테이블 새로고침")
         self.refresh_button.setFont(QFont("Arial", 10))
@@ -289,16 +445,40 @@ class Kospi200CrawlerGUI(QMainWindow):
         self.quit_button.setFont(QFont("Arial", 10))
         self.quit_button.clicked.connect(self.close)
         
+        button_layout.addWidget(self.open_button)
         button_layout.addWidget(self.save_button)
         button_layout.addWidget(self.excel_button)
+        button_layout.addWidget(self.analytics_button)
         button_layout.addWidget(self.refresh_button)
         button_layout.addStretch()
         button_layout.addWidget(self.quit_button)
         
         parent_layout.addLayout(button_layout)
     
+    def apply_search_filter(self):
+        """검색 인덱스로 찾은 종목만 테이블에 보이도록 필터 적용 (데이터는 그대로)"""
+        search_term = self.search_input.text().strip()
+        if self.current_data is None:
+            return 0
+        
+        if not search_term:
+            self.table_model.set_filter(None)
+            self.search_result_label.setText("")
+            return len(self.current_data)
+        
+        mask = self.search_index.mask(self.current_data['종목명'], search_term)
+        match_count = int(mask.sum())
+        self.table_model.set_filter(mask)
+        
+        if match_count > 0:
+            self.search_result_label.setText(f"'{search_term}' 검색 결과: {match_count}개 종목")
+        else:
+            self.search_result_label.setText(f"'{search_term}' 검색 결과: 없음")
+        return match_count
+    
     def search_stock(self):
-        """종목 검색 기능"""
+        """종목 검색 기능 (엔터/검색 버튼: 기다리지 않고 바로 검색)"""
+        self.search_timer.stop()
         search_term = self.search_input.text().strip()
         if not search_term:
             QMessageBox.warning(self, "경고", "검색할 종목명을 입력하세요.")
@@ -308,44 +488,93 @@ class Kospi200CrawlerGUI(QMainWindow):
             QMessageBox.warning(self, "경고", "먼저 데이터를 크롤링해주세요.")
             return
         
-        # 데이터에서 검색
-        filtered_data = self.current_data[self.current_data['종목명'].str.contains(search_term, case=False, na=False)]
-        
-        if len(filtered_data) > 0:
-            self.display_data(filtered_data)
-            self.search_result_label.setText(f"'{search_term}' 검색 결과: {len(filtered_data)}개 종목")
-        else:
-            self.search_result_label.setText(f"'{search_term}' 검색 결과: 없음")
+        if self.apply_search_filter() == 0:
             QMessageBox.information(self, "검색 결과", f"'{search_term}'에 해당하는 종목을 찾을 수 없습니다.")
     
+    def restore_session(self):
+        """지난번 종료할 때 저장한 결과를 불러와서 바로 표시하고 백그라운드 새로고침 시작"""
+        started = time.perf_counter()
+        df, meta = self.session.load()
+        if df is None or df.empty:
+            return
+        
+        self.current_data = df
+        self.display_data(df)
+        self.session_hashes = meta['page_hashes']
+        self.session_crawled_at = datetime.strptime(meta['crawled_at'], '%Y-%m-%d %H:%M:%S')
+        if meta.get('pages'):
+            self.page_spinbox.setValue(meta['pages'])
+        if '지수' in df.columns:
+            restored_indices = set(df['지수'].astype(str).unique())
+            for index, checkbox in self.index_checkboxes.items():
+                checkbox.setChecked(index in restored_indices)
+        
+        self.save_button.setEnabled(True)
+        self.excel_button.setEnabled(True)
+        self.refresh_button.setEnabled(True)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.log_text.append(f"[세션] {meta['crawled_at']}에 수집한 {len(df):,}개 종목 복원 ({elapsed_ms:.0f}ms)")
+        
+        if REFRESH_ON_START:
+            # 창이 먼저 뜨도록 이벤트 루프가 돌기 시작한 뒤에 새로고침
+            QTimer.singleShot(0, self.refresh_session)
+    
+    def refresh_session(self):
+        """복원한 결과를 백그라운드에서 다시 크롤링 (바뀐 페이지만 다시 파싱, 테이블은 그대로 유지)"""
+        if self.crawler_thread and self.crawler_thread.isRunning():
+            return
+        self.refreshing = True
+        self.log_text.append("[세션] 백그라운드 새로고침 시작")
+        self.start_crawling()
+    
+    def selected_indices(self):
+        """체크된 지수 이름 목록 (체크박스 순서)"""
+        return [index for index, checkbox in self.index_checkboxes.items() if checkbox.isChecked()]
+    
     def start_crawling(self):
-        """크롤링 시작"""
+        """크롤링 시작 (선택한 지수를 모두 한 번에 크롤링)"""
         max_pages = self.page_spinbox.value()
+        indices = self.selected_indices()
+        if not indices:
+            self.refreshing = False
+            QMessageBox.warning(self, "경고", "크롤링할 지수를 하나 이상 선택하세요.")
+            return
+        
+        # 크롤링 스레드 생성 (이전 결과와 HTML이 같은 페이지는 다시 파싱하지 않음)
+        self.crawler_thread = CrawlerThread(max_pages, cache=self.response_cache,
+                                            known_hashes=self.session_hashes, previous=self.current_data,
+                                            sources=indices)
+        total_pages = len(self.crawler_thread.jobs)
         
         # UI 상태 변경
         self.crawl_button.setEnabled(False)
         self.stop_button.setEnabled(True)
         self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, max_pages)
+        self.progress_bar.setRange(0, total_pages)
         self.progress_bar.setValue(0)
+        self.progress_bar.setFormat(f"0/{total_pages} 페이지")
         
-        # 로그 초기화
-        self.log_text.clear()
+        # 로그 초기화 (세션 새로고침은 복원 로그를 남겨 둠)
+        if not self.refreshing:
+            self.log_text.clear()
         self.progress_text.clear()
         self.log_text.append(f"크롤링 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        # 크롤링 스레드 시작
-        self.crawler_thread = CrawlerThread(max_pages)
-        self.crawler_thread.progress_signal.connect(self.update_progress)
+        # 크롤링 스레드 시작 (첫 페이지가 도착하면 이전 결과를 바꿔서 표시)
+        self.streamed_rows = 0
+        self.crawler_thread.page_signal.connect(self.page_received)
         self.crawler_thread.finished_signal.connect(self.crawling_finished)
         self.crawler_thread.error_signal.connect(self.crawling_error)
         self.crawler_thread.start()
+        self.progress_timer.start()
     
     def stop_crawling(self):
         """크롤링 중지"""
         if self.crawler_thread and self.crawler_thread.isRunning():
             self.crawler_thread.stop()
             self.crawler_thread.wait()
+            self.stop_progress_updates()
+            self.refreshing = False
             self.log_text.append("크롤링이 중지되었습니다.")
         
         # UI 상태 복원
@@ -353,6 +582,83 @@ class Kospi200CrawlerGUI(QMainWindow):
         self.stop_button.setEnabled(False)
         self.progress_bar.setVisible(False)
     
+    def toggle_monitoring(self):
+        """실시간 모니터링 시작/중지"""
+        if self.monitor_thread and self.monitor_thread.isRunning():
+            self.monitor_thread.stop()
+            self.monitor_thread.wait()
+            self.monitor_button.setText("실시간 모니터링 시작")
+            self.crawl_button.setEnabled(True)
+            self.log_text.append("모니터링이 중지되었습니다.")
+            return
+        
+        # 모니터링은 코스피200 편입종목(entryJongmok)만 조회하므로 그 페이지 수까지만 사용
+        monitor_pages = min(self.page_spinbox.value(), SOURCES['entryJongmok'].max_pages)
+        if monitor_pages < self.page_spinbox.value():
+            self.log_text.append(f"모니터링은 {MONITOR_INDEX} {monitor_pages}페이지까지만 조회합니다.")
+        self.monitor_thread = MonitorThread(monitor_pages, self.interval_spinbox.value(),
+                                            store=self.snapshot_store)
+        self.monitor_thread.progress_signal.connect(self.update_progress)
+        self.monitor_thread.changes_signal.connect(self.apply_monitor_changes)
+        self.monitor_thread.start()
+        
+        self.monitor_button.setText("실시간 모니터링 중지")
+        self.crawl_button.setEnabled(False)
+        self.log_text.append(f"모니터링 시작: {self.interval_spinbox.value()}초 간격 (정규장 시간에만 조회)")
+    
+    def apply_monitor_changes(self, changes):
+        """
+        모니터링에서 받은 변경분만 현재 데이터와 테이블에 반영
+
+        모니터링은 코스피200만 조회하므로 여러 지수를 크롤링한 결과에서는 KOSPI200 행만 고칩니다.
+        """
+        df = self.current_data
+        if df is None or df.empty:
+            df = pd.DataFrame([change for change in changes if change['상태'] == '신규'])
+            df = normalize_stock_frame(df.drop(columns=['상태'], errors='ignore'))
+            df.insert(0, '지수', pd.Categorical([MONITOR_INDEX] * len(df)))
+            self.current_data = df
+            self.session_dirty = True
+            self.display_data(self.current_data)
+            self.save_button.setEnabled(True)
+            self.excel_button.setEnabled(True)
+            self.refresh_button.setEnabled(True)
+            return
+        
+        rows_changed = False
+        updated_positions = []
+        
+        for change in changes:
+            in_index = df['지수'] == MONITOR_INDEX if '지수' in df.columns else True
+            matches = df.index[(df['종목명'].astype(str) == change['종목명']) & in_index]
+            if change['상태'] == '제외':
+                df = df.drop(index=matches)
+                rows_changed = True
+                continue
+            
+            values = {column: value for column, value in change.items() if column in df.columns}
+            if len(matches) == 0:
+                if '지수' in df.columns:
+                    values['지수'] = MONITOR_INDEX
+                df = pd.concat([df, pd.DataFrame([values])], ignore_index=True)
+                df = normalize_stock_frame(df)
+                if '지수' in df.columns:
+                    df['지수'] = df['지수'].astype('category')
+                rows_changed = True
+                continue
+            
+            for column, value in values.items():
+                df.loc[matches, column] = value
+            updated_positions.extend(matches)
+        
+        self.current_data = df.reset_index(drop=True)
+        self.session_dirty = True
+        if rows_changed:
+            self.display_data(self.current_data)
+        else:
+            # 행 구성이 같으면 바뀐 종목의 행만 다시 그림
+            self.table_model.update_frame(self.current_data, updated_positions)
+    
     def update_progress(self, message):
         """진행 상황 업데이트"""
         self.progress_text.append(message)
@@ -366,12 +672,85 @@ class Kospi200CrawlerGUI(QMainWindow):
             self.log_text.verticalScrollBar().maximum()
         )
     
+    def flush_progress(self):
+        """크롤링 스레드가 쌓아 둔 메시지와 진행 수치를 한 번에 반영 (타이머에서 호출)"""
+        if self.crawler_thread is None:
+            return
+        
+        messages, dropped, progress = self.crawler_thread.channel.drain()
+        
+        if messages:
+            summary = [message for verbose, message in messages if not verbose]
+            if dropped:
+                summary.insert(0, f"(로그 {dropped}줄 생략)")
+            if summary:
+                self.progress_text.append('\n'.join(summary))
+            self.log_text.append('\n'.join(message for _, message in messages))
+        
+        self.progress_bar.setValue(progress.pages_done)
+        self.progress_bar.setFormat(progress.summary_text())
+    
+    def stop_progress_updates(self):
+        """진행 타이머를 멈추고 남은 메시지를 마저 반영"""
+        self.progress_timer.stop()
+        self.flush_progress()
+    
+    def page_received(self, page_df):
+        """페이지 하나의 결과를 테이블 뒤에 이어 붙이기 (전체를 다시 만들지 않음)"""
+        if self.refreshing:
+            # 세션 새로고침 중에는 복원한 테이블을 그대로 두고 끝날 때 한 번에 교체
+            self.streamed_rows += len(page_df)
+            return
+        
+        if self.streamed_rows == 0:
+            self.current_data = page_df
+            self.display_data(page_df)
+        else:
+            self.table_model.append_frame(page_df)
+            self.current_data = self.table_model.frame()
+            for name in page_df['종목명'].unique():
+                self.search_index.add(name)
+            if self.search_input.text().strip():
+                self.apply_search_filter()
+        
+        self.streamed_rows += len(page_df)
+    
     def crawling_finished(self, df):
         """크롤링 완료 처리"""
+        self.stop_progress_updates()
+        stopped = not self.crawler_thread.is_running
+        refreshing, self.refreshing = self.refreshing, False
+        
+        # 페이지별로 이미 표시한 행은 그대로 두고, 전체를 정규화한 DataFrame으로만 교체
+        # (행 수가 같으면 컬럼 너비와 정렬 컬럼을 유지하고, 행 순서가 바뀌었으므로 정렬/검색 필터는 다시 적용)
+        shown_rows = len(self.current_data) if refreshing and self.current_data is not None else self.streamed_rows
         self.current_data = df
-        self.display_data(df)
+        if shown_rows == len(df):
+            self.table_model.update_frame(df)
+            if refreshing:
+                self.search_index = StockSearchIndex(df['종목명'].unique())
+            if self.search_input.text().strip():
+                self.apply_search_filter()
+        else:
+            self.display_data(df)
+        
+        self.session_hashes = self.crawler_thread.page_hashes
+        self.session_crawled_at = datetime.now()
+        self.session_dirty = True
         
-        self.log_text.append(f"크롤링 완료: {len(df)}개 종목 데이터 수집")
+        if stopped:
+            self.log_text.append(f"크롤링 중지: 중지 전까지 {len(df)}개 종목 데이터 수집")
+        else:
+            self.log_text.append(f"크롤링 완료: {len(df)}개 종목 데이터 수집")
+        
+        # 저장소에는 지수별로 (예전 코스피200 이력과 같은 source 이름으로) 저장
+        inserted = skipped = 0
+        for index, index_df in df.groupby('지수', observed=True, sort=False):
+            counts = self.snapshot_store.append(index_df.drop(columns='지수'), source=INDEX_SOURCES[index])
+            inserted, skipped = inserted + counts[0], skipped + counts[1]
+        self.log_text.append(f"[저장소] {inserted}개 종목 저장, {skipped}개 종목 변경 없음")
+        if self.analytics.update():
+            self.log_text.append(f"[분석] 누적수익률 {self.analytics.movers_text()}")
         self.log_text.append(f"완료 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         # UI 상태 복원
@@ -384,17 +763,29 @@ class Kospi200CrawlerGUI(QMainWindow):
         self.excel_button.setEnabled(True)
         self.refresh_button.setEnabled(True)
         
-        QMessageBox.information(self, "완료", f"크롤링이 완료되었습니다.\n총 {len(df)}개 종목 데이터를 수집했습니다.")
+        if refreshing:
+            # 백그라운드 새로고침은 팝업 없이 로그만 남김
+            return
+        if stopped:
+            QMessageBox.information(self, "중지", f"크롤링이 중지되었습니다.\n중지 전까지 {len(df)}개 종목 데이터를 수집했습니다.")
+        else:
+            QMessageBox.information(self, "완료", f"크롤링이 완료되었습니다.\n총 {len(df)}개 종목 데이터를 수집했습니다.")
     
     def crawling_error(self, error_message):
         """크롤링 오류 처리"""
+        self.stop_progress_updates()
         self.log_text.append(f"오류: {error_message}")
+        refreshing, self.refreshing = self.refreshing, False
         
         # UI 상태 복원
         self.crawl_button.setEnabled(True)
         self.stop_button.setEnabled(False)
         self.progress_bar.setVisible(False)
         
+        if refreshing:
+            # 새로고침에 실패해도 복원한 결과는 그대로 사용
+            self.log_text.append("[세션] 새로고침 실패: 복원한 결과를 그대로 표시합니다.")
+            return
         QMessageBox.critical(self, "오류", f"크롤링 중 오류가 발생했습니다:\n{error_message}")
     
     def display_data(self, df):
@@ -402,47 +793,92 @@ class Kospi200CrawlerGUI(QMainWindow):
         if df is None or df.empty:
             return
         
-        # 테이블 설정
-        self.table_widget.setRowCount(len(df))
-        self.table_widget.setColumnCount(len(df.columns))
-        self.table_widget.setHorizontalHeaderLabels(df.columns)
-        
-        # 데이터 채우기
-        for i, row in df.iterrows():
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value))
-                item.setTextAlignment(Qt.AlignCenter)
-                self.table_widget.setItem(i, j, item)
-        
-        # 컬럼 크기 자동 조정
-        header = self.table_widget.horizontalHeader()
-        for i in range(len(df.columns)):
-            header.setSectionResizeMode(i, QHeaderView.ResizeToContents)
-    
-    def save_to_csv(self):
-        """CSV 파일로 저장"""
+        # 모델 데이터 교체 (셀 객체를 만들지 않고 보이는 셀만 그림)
+        self.table_model.set_frame(df)
+        self.table_view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        
+        # 일부 행만 측정해서 컬럼 크기 조정
+        header = self.table_view.horizontalHeader()
+        widths = sample_column_widths(self.table_model, self.table_view.fontMetrics())
+        for i, width in enumerate(widths):
+            header.setSectionResizeMode(i, QHeaderView.Interactive)
+            header.resizeSection(i, width)
+        
+        # 종목명 검색 인덱스를 새 데이터로 다시 만들고, 입력된 검색어가 있으면 필터 유지
+        self.search_index = StockSearchIndex(df['종목명'].unique())
+        if self.search_input.text().strip():
+            self.apply_search_filter()
+    
+    def show_analytics(self):
+        """저장된 스냅샷으로 계산한 분석 결과 창 표시 (모니터링으로 추가된 스냅샷도 반영)"""
+        self.analytics.update()
+        if self.analytics.summary().empty:
+            QMessageBox.warning(self, "경고", "분석할 스냅샷이 없습니다. 먼저 데이터를 크롤링해주세요.")
+            return
+        
+        if self.analytics_dialog is None:
+            self.analytics_dialog = AnalyticsDialog(self)
+        self.analytics_dialog.show_analytics(self.analytics)
+        self.analytics_dialog.show()
+        self.analytics_dialog.raise_()
+    
+    def save_to_file(self):
+        """CSV/압축 CSV/Parquet/Feather 파일로 저장 (형식은 확장자로 결정)"""
         if self.current_data is None:
             QMessageBox.warning(self, "경고", "저장할 데이터가 없습니다.")
             return
         
         # 파일 저장 다이얼로그
-        filename, _ = QFileDialog.getSaveFileName(
+        filename, selected_filter = QFileDialog.getSaveFileName(
             self, 
-            "CSV 파일 저장", 
+            "파일 저장", 
             f"kospi200_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            "CSV Files (*.csv)"
+            ";;".join(FILE_FILTERS)
         )
         
         if filename:
             try:
-                self.current_data.to_csv(filename, index=False, encoding='utf-8-sig')
+                # 확장자 없이 입력한 경우 선택한 필터의 확장자를 붙임
+                try:
+                    detect_format(filename)
+                except ValueError:
+                    filename += DEFAULT_EXTENSIONS[FILE_FILTERS.get(selected_filter, 'csv')]
+                
+                save_frame(self.current_data, filename)
                 QMessageBox.information(self, "저장 완료", f"데이터가 {filename}에 저장되었습니다.")
-                self.log_text.append(f"CSV 파일 저장: {filename}")
+                self.log_text.append(f"파일 저장: {filename}")
             except Exception as e:
                 QMessageBox.critical(self, "저장 오류", f"파일 저장 중 오류가 발생했습니다:\n{str(e)}")
     
+    def open_file(self):
+        """저장해 둔 결과 파일을 열어서 테이블에 표시"""
+        filename, _ = QFileDialog.getOpenFileName(
+            self,
+            "결과 파일 열기",
+            "",
+            "결과 파일 (*.csv *.csv.zst *.parquet *.feather *.arrow);;" + ";;".join(FILE_FILTERS)
+        )
+        
+        if filename:
+            try:
+                df = load_frame(filename)
+            except Exception as e:
+                QMessageBox.critical(self, "열기 오류", f"파일을 여는 중 오류가 발생했습니다:\n{str(e)}")
+                return
+            
+            self.current_data = df
+            # 연 파일은 크롤링 결과가 아니므로 페이지 해시를 비교하지 않음
+            self.session_hashes = {}
+            self.session_crawled_at = None
+            self.session_dirty = True
+            self.display_data(df)
+            self.save_button.setEnabled(True)
+            self.excel_button.setEnabled(True)
+            self.refresh_button.setEnabled(True)
+            self.log_text.append(f"파일 열기: {filename} ({len(df):,}행)")
+    
     def save_to_excel(self):
-        """엑셀 파일로 저장"""
+        """엑셀 파일로 저장 (백그라운드 스레드에서 스트리밍 저장)"""
         if self.current_data is None:
             QMessageBox.warning(self, "경고", "저장할 데이터가 없습니다.")
             return
@@ -456,87 +892,64 @@ class Kospi200CrawlerGUI(QMainWindow):
         )
         
         if filename:
+            # 저장 중에 모니터링이 데이터를 바꿔도 영향이 없도록 복사본을 넘김
+            self.excel_thread = ExcelExportThread(self.current_data.copy(), filename)
+            self.excel_thread.progress_signal.connect(self.update_export_progress)
+            self.excel_thread.finished_signal.connect(self.excel_export_finished)
+            self.excel_thread.error_signal.connect(self.excel_export_error)
+            
+            self.excel_button.setEnabled(False)
+            self.progress_bar.setVisible(True)
+            self.progress_bar.setRange(0, len(self.current_data))
+            self.progress_bar.setValue(0)
+            self.progress_bar.setFormat("엑셀 저장 중... %p%")
+            self.log_text.append(f"엑셀 파일 저장 시작: {filename}")
+            self.excel_thread.start()
+    
+    def update_export_progress(self, done, total):
+        """엑셀 저장 진행률 표시"""
+        self.progress_bar.setValue(done)
+    
+    def excel_export_finished(self, filename):
+        """엑셀 저장 완료 처리"""
+        self.excel_button.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        QMessageBox.information(self, "저장 완료", f"데이터가 {filename}에 저장되었습니다.\n\n엑셀 파일에는 다음이 포함됩니다:\n- 코스피200_편입종목 시트: 상세 데이터\n- 요약정보 시트: 데이터 요약")
+        self.log_text.append(f"엑셀 파일 저장: {filename}")
+    
+    def excel_export_error(self, error_message):
+        """엑셀 저장 오류 처리"""
+        self.excel_button.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        QMessageBox.critical(self, "저장 오류", f"엑셀 파일 저장 중 오류가 발생했습니다:\n{error_message}")
+        self.log_text.append(f"엑셀 저장 오류: {error_message}")
+    
+    def closeEvent(self, event):
+        """
+        창을 닫을 때 스레드 정리 (저장 중인 엑셀 파일은 끝까지 저장)
+
+        마지막 결과가 바뀌었으면 세션 저장소에 저장해서 다음 실행 때 바로 표시합니다.
+        """
+        if self.crawler_thread and self.crawler_thread.isRunning():
+            self.crawler_thread.stop()
+            self.crawler_thread.wait()
+        if self.monitor_thread and self.monitor_thread.isRunning():
+            self.monitor_thread.stop()
+            self.monitor_thread.wait()
+        if self.excel_thread and self.excel_thread.isRunning():
+            self.excel_thread.wait()
+        
+        if self.session_dirty and self.current_data is not None and not self.current_data.empty:
             try:
-                # 엑셀 파일로 저장
-                with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                    # 메인 데이터 시트
-                    self.current_data.to_excel(writer, sheet_name='코스피200_편입종목', index=False)
-                    
-                    # 워크시트 가져오기
-                    worksheet = writer.sheets['코스피200_편입종목']
-                    
-                    # 컬럼 너비 자동 조정
-                    for column in worksheet.columns:
-                        max_length = 0
-                        column_letter = column[0].column_letter
-                        
-                        for cell in column:
-                            try:
-                                if len(str(cell.value)) > max_length:
-                                    max_length = len(str(cell.value))
-                            except:
-                                pass
-                        
-                        adjusted_width = min(max_length + 2, 50)  # 최대 50자로 제한
-                        worksheet.column_dimensions[column_letter].width = adjusted_width
-                    
-                    # 헤더 스타일링
-                    from openpyxl.styles import Font, PatternFill, Alignment
-                    
-                    header_font = Font(bold=True, color="FFFFFF")
-                    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                    header_alignment = Alignment(horizontal="center", vertical="center")
-                    
-                    for cell in worksheet[1]:
-                        cell.font = header_font
-                        cell.fill = header_fill
-                        cell.alignment = header_alignment
-                    
-                    # 요약 정보 시트 추가
-                    summary_data = {
-                        '항목': ['총 종목 수', '크롤링 시간', '데이터 수집일'],
-                        '값': [
-                            len(self.current_data),
-                            datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            datetime.now().strftime('%Y-%m-%d')
-                        ]
-                    }
-                    
-                    summary_df = pd.DataFrame(summary_data)
-                    summary_df.to_excel(writer, sheet_name='요약정보', index=False)
-                    
-                    # 요약 시트 스타일링
-                    summary_worksheet = writer.sheets['요약정보']
-                    for column in summary_worksheet.columns:
-                        max_length = 0
-                        column_letter = column[0].column_letter
-                        
-                        for cell in column:
-                            try:
-                                if len(str(cell.value)) > max_length:
-                                    max_length = len(str(cell.value))
-                            except:
-                                pass
-                        
-                        adjusted_width = min(max_length + 2, 30)
-                        summary_worksheet.column_dimensions[column_letter].width = adjusted_width
-                    
-                    # 요약 시트 헤더 스타일링
-                    for cell in summary_worksheet[1]:
-                        cell.font = header_font
-                        cell.fill = header_fill
-                        cell.alignment = header_alignment
-                
-                QMessageBox.information(self, "저장 완료", f"데이터가 {filename}에 저장되었습니다.\n\n엑셀 파일에는 다음이 포함됩니다:\n- 코스피200_편입종목 시트: 상세 데이터\n- 요약정보 시트: 데이터 요약")
-                self.log_text.append(f"엑셀 파일 저장: {filename}")
-                
+                self.session.save(self.current_data, self.session_hashes, self.session_crawled_at)
             except Exception as e:
-                QMessageBox.critical(self, "저장 오류", f"엑셀 파일 저장 중 오류가 발생했습니다:\n{str(e)}")
-                self.log_text.append(f"엑셀 저장 오류: {str(e)}")
+                print(f"세션 저장 실패: {e}")
+        event.accept()
     
     def refresh_table(self):
         """테이블 새로고침"""
         if self.current_data is not None:
+            self.search_input.clear()
             self.display_data(self.current_data)
             self.log_text.append("테이블이 새로고침되었습니다.")
 
@@ -0,0 +1,233 @@
+"""
+코스피200 편입종목 실시간 모니터링
+
+장중에 정해진 간격으로 편입종목 페이지를 다시 조회하고, 직전 스냅샷과
+비교해서 값이 바뀐 종목만 콜백/JSONL 파일/GUI 테이블로 내보냅니다.
+직전 스냅샷 하나만 메모리에 유지하므로 하루 종일 실행해도 메모리가 늘지 않습니다.
+
+실행: python kospi200_monitor.py
+"""
+import json
+import threading
+from datetime import datetime
+
+import pandas as pd
+import requests
+
+from crawler_cache import is_krx_market_open
+from crawler_normalize import normalize_stock_frame
+from kospi200_engine import SOURCES, CrawlerEngine
+
+# 변경 여부를 비교할 컬럼
+WATCH_FIELDS = ['현재가', '전일비', '등락률', '거래량', '거래대금', '시가총액']
+
+# 변화량(_변화)을 함께 내보낼 컬럼
+DELTA_FIELDS = ['현재가', '거래량', '거래대금']
+
+
+def _json_value(value):
+    """numpy 값을 JSON으로 저장할 수 있는 파이썬 값으로 변환"""
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _index_by_name(df, fields):
+    """종목명(문자열)을 인덱스로 하는 비교용 DataFrame (category 인덱스끼리는 정렬이 어긋날 수 있음)"""
+    df = df.drop_duplicates('종목명')
+    return df[fields].set_axis(pd.Index(df['종목명'].astype(str), name='종목명'), axis=0)
+
+
+def diff_snapshots(previous, current, fields=WATCH_FIELDS):
+    """
+    두 스냅샷(정규화된 DataFrame)을 종목명 기준으로 비교하는 함수
+
+    반환값: 변경 목록. 각 항목은 종목명, 상태('신규', '변경', '제외'),
+    현재 값, 그리고 DELTA_FIELDS의 변화량('현재가_변화' 등)을 담은 dict입니다.
+    previous가 None이면 모든 종목이 '신규'로 반환됩니다.
+    """
+    fields = [field for field in fields if field in current.columns]
+    current = _index_by_name(current, fields)
+
+    if previous is None or previous.empty:
+        previous = current.iloc[0:0]
+    else:
+        previous = _index_by_name(previous, fields)
+
+    changes = []
+
+    added = current.index.difference(previous.index, sort=False)
+    for name in added:
+        change = {'종목명': str(name), '상태': '신규'}
+        change.update({field: _json_value(current.at[name, field]) for field in fields})
+        changes.append(change)
+
+    common = current.index.intersection(previous.index, sort=False)
+    now, before = current.loc[common], previous.loc[common]
+    differs = (now.ne(before) & ~(now.isna() & before.isna())).any(axis=1)
+
+    for name in common[differs.to_numpy()]:
+        change = {'종목명': str(name), '상태': '변경'}
+        change.update({field: _json_value(now.at[name, field]) for field in fields})
+        for field in DELTA_FIELDS:
+            if field in fields:
+                delta = now.at[name, field] - before.at[name, field]
+                change[f'{field}_변화'] = _json_value(delta)
+        changes.append(change)
+
+    for name in previous.index.difference(current.index, sort=False):
+        changes.append({'종목명': str(name), '상태': '제외'})
+
+    return changes
+
+
+class JsonlSink:
+    """변경 내역을 한 줄에 하나씩 JSON으로 이어 쓰는 콜백"""
+    def __init__(self, path):
+        self.path = path
+
+    def __call__(self, changes, polled_at):
+        if not changes:
+            return
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for change in changes:
+                record = {'수집시각': polled_at.strftime('%Y-%m-%d %H:%M:%S'), **change}
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+def print_changes(changes, polled_at):
+    """변경 내역을 콘솔에 출력하는 콜백"""
+    print(f"\n[{polled_at.strftime('%H:%M:%S')}] 변경 {len(changes)}건")
+    for change in changes:
+        if change['상태'] == '변경':
+            print(f"  {change['종목명']}: {change.get('현재가')}원 "
+                  f"({change.get('현재가_변화', 0):+}), 거래량 {change.get('거래량_변화', 0):+}")
+        else:
+            print(f"  {change['종목명']}: {change['상태']}")
+
+
+class Kospi200Monitor:
+    """
+    편입종목 페이지를 주기적으로 조회해서 변경분만 콜백으로 전달하는 클래스
+
+    callbacks: callback(changes, polled_at) 형태의 함수 목록
+    market_hours_only: True이면 정규장 시간에만 조회
+    store(SnapshotStore)를 넘기면 매 조회 결과를 저장소에도 이어서 저장합니다.
+    log(message)로 진행/오류 메시지를 내보냅니다. (기본: print, GUI는 진행 시그널)
+    """
+    def __init__(self, max_pages=1, interval=60, callbacks=None, market_hours_only=True,
+                 rate_limit=1.0, store=None, log=print):
+        self.interval = interval
+        self.callbacks = list(callbacks or [])
+        self.market_hours_only = market_hours_only
+        self.engine = CrawlerEngine(rate_limit=rate_limit, burst=1)
+        self.source = SOURCES['entryJongmok']
+        # 편입종목 페이지 수를 넘는 페이지는 비어 있어 매 조회가 불완전 스냅샷으로 건너뛰어지므로 잘라 냄
+        self.max_pages = max(1, min(max_pages, self.source.max_pages))
+        self.store = store
+        self.log = log
+        self.previous = None
+        self.poll_count = 0
+        self.stop_event = threading.Event()
+
+    def add_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def fetch_snapshot(self):
+        """
+        모든 페이지를 조회해서 정규화된 스냅샷 DataFrame을 반환
+
+        중간에 stop()이 호출되었거나 종목이 없는 페이지가 있으면 None을 반환합니다.
+        (일부 페이지만으로 비교하면 빠진 종목이 모두 '제외'로 잡히기 때문)
+        """
+        all_stock_data = []
+        for page in range(1, self.max_pages + 1):
+            if self.stop_event.is_set():
+                return None
+            page_stock_data = self.engine.crawl_page(self.source, page)
+            if not page_stock_data:
+                self.log(f"{page}페이지에 종목이 없어 이번 조회는 건너뜁니다.")
+                return None
+            all_stock_data.extend(page_stock_data)
+        return normalize_stock_frame(pd.DataFrame(all_stock_data))
+
+    def poll_once(self):
+        """
+        한 번 조회해서 직전 스냅샷과 비교하고 변경분을 콜백으로 전달
+
+        스냅샷이 불완전하면 비교/저장/콜백 없이 빈 목록을 반환하고 직전 스냅샷을 그대로 둡니다.
+        """
+        polled_at = datetime.now()
+        current = self.fetch_snapshot()
+        if current is None or current.empty:
+            return []
+
+        changes = diff_snapshots(self.previous, current)
+        # 직전 스냅샷만 유지 (메모리 사용량 일정)
+        self.previous = current
+        self.poll_count += 1
+
+        if self.store is not None:
+            self.store.append(current, captured_at=polled_at)
+
+        for callback in self.callbacks:
+            callback(changes, polled_at)
+        return changes
+
+    def run(self, max_polls=None):
+        """stop()이 호출되거나 max_polls번 조회할 때까지 반복"""
+        self.stop_event.clear()
+        waiting_logged = False
+
+        while not self.stop_event.is_set():
+            if self.market_hours_only and not is_krx_market_open():
+                if not waiting_logged:
+                    self.log("정규장 시간이 아니므로 장 시작까지 대기합니다.")
+                    waiting_logged = True
+                self.stop_event.wait(self.interval)
+                continue
+            waiting_logged = False
+
+            try:
+                self.poll_once()
+            except requests.RequestException as e:
+                self.log(f"네트워크 오류 (다음 주기에 다시 시도): {e}")
+            except Exception as e:
+                # 파싱/저장소/콜백의 예상 못 한 오류로 모니터링(과 GUI 스레드)이 멈추지 않도록 기록만 하고 계속
+                self.log(f"조회 중 오류 (다음 주기에 다시 시도): {type(e).__name__}: {e}")
+
+            if max_polls is not None and self.poll_count >= max_polls:
+                break
+            self.stop_event.wait(self.interval)
+
+    def stop(self):
+        self.stop_event.set()
+
+
+def main():
+    """
+    메인 함수
+    """
+    print("코스피200 편입종목 실시간 모니터링")
+    print("=" * 60)
+
+    try:
+        max_pages = int(input("조회할 페이지 수 (기본값: 1): ") or "1")
+        interval = int(input("조회 간격(초) (기본값: 60): ") or "60")
+    except ValueError:
+        print("잘못된 입력입니다. 기본값(1페이지, 60초)으로 진행합니다.")
+        max_pages, interval = 1, 60
+
+    filename = f"kospi200_changes_{datetime.now().strftime('%Y%m%d')}.jsonl"
+    monitor = Kospi200Monitor(max_pages, interval, callbacks=[print_changes, JsonlSink(filename)])
+
+    print(f"\n변경 내역은 {filename} 파일에 이어서 저장됩니다. (종료: Ctrl+C)")
+    try:
+        monitor.run()
+    except KeyboardInterrupt:
+        monitor.stop()
+        print("\n모니터링을 종료합니다.")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+게시판 매물 목록 중복 제거 모듈
+
+페이지를 넘기는 사이에 새 글이 올라오면 이전 페이지의 글이 다음 페이지에 다시 나타납니다.
+지금까지 모은 제목 목록을 매번 다시 만들어 비교하면 매물 수의 제곱에 비례해 느려지므로,
+정규화한 키를 set에 보관해서 매물 하나를 O(1)로 확인합니다.
+
+키는 기본적으로 정규화한 제목(유니코드 NFKC, 공백 정리, 대소문자 무시)이고,
+by_post_id=True이면 링크(href)의 게시글 번호를 키로 사용합니다.
+(같은 제목으로 다시 올린 다른 글은 남기고, 같은 글이 두 페이지에 나온 경우만 제거)
+"""
+import re
+import unicodedata
+
+# /service/board/sold/18949997?od=... 형태 링크의 게시글 번호
+POST_ID_PATTERN = re.compile(r'/board/[^/?#]+/(\d+)')
+
+_SPACES = re.compile(r'\s+')
+
+
+def normalize_title(title):
+    """비교용 제목 (전각/반각 통일, 연속 공백 하나로, 대소문자 무시)"""
+    return _SPACES.sub(' ', unicodedata.normalize('NFKC', title)).strip().casefold()
+
+
+def post_id_from_href(href):
+    """게시글 링크에서 게시글 번호(문자열)를 추출 (없으면 None)"""
+    if not href:
+        return None
+    match = POST_ID_PATTERN.search(href)
+    return match.group(1) if match else None
+
+
+def listing_href(element):
+    """제목 요소(BeautifulSoup 태그)의 링크 (요소 자신이나 감싸는 a 태그의 href, 없으면 None)"""
+    href = element.get('href')
+    if href:
+        return href
+    parent = element.find_parent('a')
+    return parent.get('href') if parent is not None else None
+
+
+class ListingDeduper:
+    """
+    이미 본 매물인지 확인하는 중복 제거기
+
+    add(title, href)는 처음 보는 매물이면 기록하고 True, 이미 본 매물이면 False를 반환합니다.
+    """
+    def __init__(self, by_post_id=False):
+        self.by_post_id = by_post_id
+        self.seen = set()
+
+    def key(self, title, href=None):
+        if self.by_post_id:
+            post_id = post_id_from_href(href)
+            if post_id is not None:
+                return 'id:' + post_id
+        return 'title:' + normalize_title(title)
+
+    def add(self, title, href=None):
+        key = self.key(title, href)
+        if key in self.seen:
+            return False
+        self.seen.add(key)
+        return True
+
+    def __contains__(self, title):
+        return self.key(title) in self.seen
+
+    def __len__(self):
+        return len(self.seen)
@@ -0,0 +1,172 @@
+"""
+클리앙 중고장터 매물 목록 파싱 모듈
+
+목록 페이지를 한 번 훑으면서 매물 행(div.list_item)마다 게시글 번호, 링크, 분류,
+작성자, 작성일시, 조회수를 함께 추출합니다. 제목에 적힌 가격("45만원", "₩120,000",
+"1,370,000원")은 listings_frame()에서 컬럼 단위(vectorized)로 원 단위 정수로 바꿉니다.
+
+listings_frame()은 매물 dict 목록을 타입이 정해진 DataFrame으로 만듭니다.
+(번호/가격/조회수는 nullable 정수, 분류/작성자는 category, 작성일시는 datetime64)
+가격 범위나 키워드 조건은 filter_listings()로 문자열 반복 없이 한 번에 거릅니다.
+"""
+import re
+from urllib.parse import urljoin, urlsplit
+
+import pandas as pd
+from bs4 import BeautifulSoup, SoupStrainer
+
+from listing_dedup import listing_href, post_id_from_href
+
+BASE_URL = 'https://www.clien.net'
+
+# 매물 행 구조가 없는 페이지에서 제목 요소를 찾는 순서 (기존 크롤러의 선택자)
+FALLBACK_SELECTORS = ['span.subject_fixed', 'a.list_subject', 'td.post_subject a', 'a[href*="/service/board/sold/"]']
+
+# 제목의 마지막 가격 표기 (앞의 .*가 탐욕적이라 여러 개면 마지막 것을 잡음)
+#   ₩120,000 / 120,000원 / 1370000원 / 45만원 / 45만 / 1.5만 / 12만5천원
+PRICE_PATTERN = re.compile(
+    r'.*(?:'
+    r'₩\s*(?P<won_sign>\d{1,3}(?:,\d{3})+|\d+)'
+    r'|(?<![\d.,])(?P<man>\d+(?:\.\d+)?)\s*만\s*(?:(?P<chun>\d)\s*천)?\s*원?'
+    r'|(?<![\d.,])(?P<won>\d{1,3}(?:,\d{3})+|\d{4,})\s*원'
+    r')'
+)
+
+# 매물 행 (class="list_item symph_row"처럼 여러 클래스가 붙어 있어 정규식으로 비교)
+LIST_ITEM_STRAINER = SoupStrainer('div', class_=re.compile(r'(^|\s)list_item(\s|$)'))
+
+# listings_frame()의 컬럼 순서
+LISTING_COLUMNS = ['post_id', 'title', 'price', 'category', 'author', 'posted_at', 'views', 'url', 'page']
+
+
+def _text(element):
+    return element.get_text(strip=True) if element is not None else None
+
+
+def canonical_url(href, base_url=BASE_URL):
+    """목록 위치(od/po 등) 쿼리를 뺀 게시글 절대 링크 (href가 없으면 None)"""
+    if not href:
+        return None
+    parts = urlsplit(urljoin(base_url, href))
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def _row_from_item(item, page, base_url):
+    """div.list_item 하나를 매물 dict로 변환 (제목이 없으면 None)"""
+    title_element = item.select_one('span.subject_fixed') or item.select_one('a.list_subject')
+    title = _text(title_element)
+    if not title:
+        return None
+
+    href = listing_href(title_element)
+    post_id = item.get('data-board-sn') or post_id_from_href(href)
+    nickname = item.select_one('span.nickname')
+    # 이미지 닉네임은 텍스트 대신 img의 alt에 있음
+    author = _text(nickname) or (nickname.img.get('alt') if nickname is not None and nickname.img else None)
+
+    return {
+        'title': title,
+        'page': page,
+        'post_id': post_id,
+        'url': canonical_url(href, base_url),
+        'category': _text(item.select_one('span.category')),
+        'author': author or None,
+        'posted_at': _text(item.select_one('span.timestamp')),
+        'views': _text(item.select_one('span.hit')),
+    }
+
+
+def parse_listings(html, page, base_url=BASE_URL):
+    """
+    목록 페이지 HTML에서 매물 dict 목록을 추출하는 함수 (목록 순서 유지)
+
+    각 dict: title, page, post_id, url, category, author, posted_at, views
+    (posted_at/views는 페이지의 텍스트 그대로이고 listings_frame()에서 타입을 바꿈)
+    매물 행 구조가 없으면 기존 선택자로 제목과 링크만 추출합니다.
+    """
+    soup = BeautifulSoup(html, 'html.parser', parse_only=LIST_ITEM_STRAINER)
+    rows = []
+    for item in soup.find_all('div', class_='list_item'):
+        row = _row_from_item(item, page, base_url)
+        if row is not None:
+            rows.append(row)
+    if rows:
+        return rows
+
+    soup = BeautifulSoup(html, 'html.parser')
+    for selector in FALLBACK_SELECTORS:
+        titles = soup.select(selector)
+        if titles:
+            break
+
+    for title in titles:
+        title_text = title.get_text(strip=True)
+        if not title_text:
+            continue
+        href = listing_href(title)
+        rows.append({'title': title_text, 'page': page, 'post_id': post_id_from_href(href),
+                     'url': canonical_url(href, base_url)})
+    return rows
+
+
+def parse_price(titles):
+    """제목 Series에서 마지막 가격 표기를 원 단위 정수(Int64, 없으면 <NA>)로 변환"""
+    parts = titles.astype('string').str.extract(PRICE_PATTERN)
+
+    won = parts['won_sign'].fillna(parts['won']).str.replace(',', '', regex=False)
+    price = pd.to_numeric(won, errors='coerce')
+
+    man = pd.to_numeric(parts['man'], errors='coerce') * 10_000
+    man = man + pd.to_numeric(parts['chun'], errors='coerce').fillna(0) * 1_000
+    price = price.fillna(man)
+
+    return price.round().astype('Int64')
+
+
+def parse_views(series):
+    """'405', '1,234', '1.2k' 형태의 조회수를 Int64로 변환"""
+    text = series.astype('string').str.strip().str.replace(',', '', regex=False).str.lower()
+    thousands = text.str.endswith('k').fillna(False)
+    values = pd.to_numeric(text.str.rstrip('k').str.strip(), errors='coerce')
+    values = values.where(~thousands, values * 1000)
+    return values.round().astype('Int64')
+
+
+def listings_frame(listings):
+    """
+    매물 dict 목록을 타입이 정해진 DataFrame으로 변환하는 함수
+
+    price는 제목에서 추출한 가격(원), posted_at은 datetime64, views/post_id는 Int64,
+    category/author는 category dtype입니다. 페이지에 없던 값은 결측으로 남습니다.
+    """
+    df = pd.DataFrame(list(listings), columns=[column for column in LISTING_COLUMNS if column != 'price'])
+
+    df['title'] = df['title'].astype('string')
+    df['url'] = df['url'].astype('string')
+    df['price'] = parse_price(df['title'])
+    df['post_id'] = pd.to_numeric(df['post_id'], errors='coerce').astype('Int64')
+    df['views'] = parse_views(df['views'])
+    df['posted_at'] = pd.to_datetime(df['posted_at'], errors='coerce', format='mixed')
+    df['category'] = df['category'].astype('category')
+    df['author'] = df['author'].astype('category')
+    df['page'] = pd.to_numeric(df['page'], errors='coerce').astype('Int16')
+
+    return df[LISTING_COLUMNS]
+
+
+def filter_listings(df, keyword=None, min_price=None, max_price=None, category=None):
+    """
+    가격 범위/제목 키워드/분류로 매물 DataFrame을 거르는 함수
+
+    조건은 모두 컬럼 단위 비교로 계산하며, 가격 조건을 주면 가격이 없는 매물은 제외됩니다.
+    """
+    mask = pd.Series(True, index=df.index)
+    if keyword:
+        mask &= df['title'].str.contains(keyword, case=False, regex=False).fillna(False)
+    if min_price is not None:
+        mask &= (df['price'] >= min_price).fillna(False)
+    if max_price is not None:
+        mask &= (df['price'] <= max_price).fillna(False)
+    if category is not None:
+        mask &= (df['category'] == category).fillna(False)
+    return df[mask]
@@ -0,0 +1,112 @@
+"""
+크롤링 결과 저장/불러오기 모듈
+
+파일 확장자로 형식을 정해서 하나의 함수로 저장합니다.
+  .csv                 UTF-8(BOM) CSV (엑셀에서 바로 열림)
+  .csv.zst             zstd로 압축한 CSV
+  .parquet             Parquet (컬럼 압축, 종목명 category 유지)
+  .feather / .arrow    Arrow IPC 파일 (압축하지 않아 메모리 맵으로 바로 열림)
+  .xlsx                엑셀 (excel_export 모듈)
+CSV 이외의 형식은 pyarrow가 설치되어 있어야 합니다.
+"""
+import pandas as pd
+
+from crawler_normalize import normalize_stock_frame
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# 확장자 → 형식 이름 (긴 확장자부터 확인)
+FORMAT_EXTENSIONS = [
+    ('.csv.zst', 'csv.zst'),
+    ('.csv.zstd', 'csv.zst'),
+    ('.parquet', 'parquet'),
+    ('.feather', 'feather'),
+    ('.arrow', 'feather'),
+    ('.ipc', 'feather'),
+    ('.xlsx', 'xlsx'),
+    ('.csv', 'csv'),
+]
+
+# 형식 이름 → 새 파일에 붙일 확장자
+DEFAULT_EXTENSIONS = {
+    'csv': '.csv',
+    'csv.zst': '.csv.zst',
+    'parquet': '.parquet',
+    'feather': '.feather',
+    'xlsx': '.xlsx',
+}
+
+# 압축 CSV를 나눠서 쓰는 행 수
+CSV_CHUNK_ROWS = 50000
+
+
+def detect_format(filename):
+    """파일 이름의 확장자로 저장 형식 판단 (모르는 확장자는 ValueError)"""
+    lower = filename.lower()
+    for extension, fmt in FORMAT_EXTENSIONS:
+        if lower.endswith(extension):
+            return fmt
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {filename} "
+                     f"(지원: {', '.join(sorted(set(DEFAULT_EXTENSIONS.values())))})")
+
+
+def _require_pyarrow(fmt):
+    if not HAS_PYARROW:
+        raise ImportError(f"{fmt} 형식을 사용하려면 pyarrow를 설치하세요: pip install pyarrow")
+
+
+def save_frame(df, filename, sheet_name='Sheet1'):
+    """df를 확장자에 맞는 형식으로 저장하고 파일 이름을 반환"""
+    fmt = detect_format(filename)
+
+    if fmt == 'csv':
+        df.to_csv(filename, index=False, encoding='utf-8-sig')
+    elif fmt == 'xlsx':
+        from excel_export import export_excel
+        export_excel(df, filename, sheet_name=sheet_name)
+    else:
+        _require_pyarrow(fmt)
+        if fmt == 'parquet':
+            df.to_parquet(filename, index=False, compression='zstd')
+        elif fmt == 'feather':
+            # 압축하지 않아야 읽을 때 메모리 맵으로 복사 없이 열 수 있음
+            feather.write_feather(df.reset_index(drop=True), filename, compression='uncompressed')
+        else:
+            with pa.CompressedOutputStream(filename, 'zstd') as stream:
+                for start in range(0, max(len(df), 1), CSV_CHUNK_ROWS):
+                    chunk = df.iloc[start:start + CSV_CHUNK_ROWS]
+                    stream.write(chunk.to_csv(index=False, header=start == 0).encode('utf-8'))
+
+    return filename
+
+
+def load_frame(filename, memory_map=True):
+    """
+    save_frame으로 저장한 파일을 DataFrame으로 읽는 함수
+
+    Arrow IPC(feather) 파일은 memory_map=True이면 메모리 맵으로 열어서
+    파일 크기와 관계없이 바로 열립니다. CSV/엑셀은 숫자 컬럼을 다시 정규화하므로
+예전에 저장한 '+0.60%', '상승400' 형태의 파일도 같은 dtype으로 읽힙니다.
+    """
+    fmt = detect_format(filename)
+
+    if fmt == 'csv':
+        return normalize_stock_frame(pd.read_csv(filename, encoding='utf-8-sig'))
+    if fmt == 'xlsx':
+        return normalize_stock_frame(pd.read_excel(filename))
+
+    _require_pyarrow(fmt)
+    if fmt == 'parquet':
+        return pd.read_parquet(filename)
+    if fmt == 'feather':
+        # split_blocks: 컬럼을 하나의 블록으로 합치지 않아 복사를 줄임
+        return feather.read_table(filename, memory_map=memory_map).to_pandas(split_blocks=True)
+
+    with pa.CompressedInputStream(pa.OSFile(filename), 'zstd') as stream:
+        return normalize_stock_frame(pd.read_csv(stream))
+
@@ -0,0 +1,138 @@
+"""
+이미 본 게시글 번호 인덱스 (증분 크롤링용)
+
+게시판 목록은 최신 글이 먼저 나오므로, 지난번 크롤링에서 본 글이 나오는 페이지까지만
+읽으면 그 뒤 페이지는 모두 이미 본 글입니다. 본 게시글 번호를 SQLite 파일에 보관해 두고
+다음 크롤링에서는 새 글만 돌려주고, 이미 본 글에 닿은 페이지에서 페이지 넘기기를 멈춥니다.
+(평소에는 10페이지 크롤링이 1페이지 요청으로 끝남)
+
+게시글 번호는 범위(scope)별로 저장합니다. 검색어가 다르면 목록이 다르므로
+listing_scope('sold', '아이폰')처럼 게시판과 검색어를 합친 범위를 사용합니다.
+
+    index = SeenPostIndex()
+    crawl = IncrementalCrawl(index, listing_scope('sold'))
+    new_ids, reached_seen = crawl.check_page(page_post_ids)   # 페이지마다
+    crawl.commit()                                            # 끝까지 크롤링한 경우에만
+"""
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+DEFAULT_SEEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.crawler_cache', 'seen_posts.sqlite3')
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 한 번의 IN (...) 조회에 넣는 게시글 번호 수 (SQLite 변수 개수 제한 이하)
+QUERY_CHUNK = 500
+
+
+def listing_scope(board, search_keyword=""):
+    """게시판과 검색어로 만든 범위 이름 (검색어가 없으면 게시판 이름만)"""
+    keyword = (search_keyword or "").strip()
+    return f"{board}?sv={keyword}" if keyword else board
+
+
+class SeenPostIndex:
+    """
+    SQLite 기반 본 게시글 번호 인덱스
+
+    seen_posts: (scope, post_id) 기본 키와 처음 본 시각
+    """
+    def __init__(self, path=DEFAULT_SEEN_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_posts (
+                scope TEXT NOT NULL,
+                post_id TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                PRIMARY KEY (scope, post_id)
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+    def unseen(self, scope, post_ids):
+        """post_ids 중 아직 본 적 없는 게시글 번호의 set"""
+        post_ids = {str(post_id) for post_id in post_ids if post_id is not None}
+        if not post_ids:
+            return set()
+
+        seen = set()
+        ids = list(post_ids)
+        with self.lock:
+            for start in range(0, len(ids), QUERY_CHUNK):
+                chunk = ids[start:start + QUERY_CHUNK]
+                rows = self.conn.execute(
+                    f"SELECT post_id FROM seen_posts WHERE scope = ? AND post_id IN ({', '.join('?' * len(chunk))})",
+                    [scope] + chunk
+                ).fetchall()
+                seen.update(row[0] for row in rows)
+        return post_ids - seen
+
+    def add(self, scope, post_ids, seen_at=None):
+        """게시글 번호를 본 것으로 기록하고 새로 기록한 개수를 반환"""
+        seen_at = (seen_at or datetime.now()).strftime(TIME_FORMAT)
+        rows = [(scope, str(post_id), seen_at) for post_id in set(post_ids) if post_id is not None]
+        with self.lock:
+            before = self.conn.total_changes
+            self.conn.executemany("INSERT OR IGNORE INTO seen_posts VALUES (?, ?, ?)", rows)
+            self.conn.commit()
+            return self.conn.total_changes - before
+
+    def count(self, scope):
+        """범위에 기록된 게시글 수"""
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM seen_posts WHERE scope = ?", (scope,)).fetchone()[0]
+
+    def clear(self, scope=None):
+        """범위의 기록 삭제 (scope가 None이면 전체 삭제, 다음 크롤링은 처음부터)"""
+        with self.lock:
+            if scope is None:
+                self.conn.execute("DELETE FROM seen_posts")
+            else:
+                self.conn.execute("DELETE FROM seen_posts WHERE scope = ?", (scope,))
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+class IncrementalCrawl:
+    """
+    크롤링 한 번의 증분 판단
+
+    check_page(page_post_ids)는 페이지의 게시글 번호(목록 순서, 번호가 없는 항목은 None)를 받아
+    (새 게시글 번호 set, 이미 본 글에 닿았는지)를 반환합니다.
+    페이지 맨 위의 고정 공지는 오래전에 본 글이므로, 맨 아래(번호가 있는 마지막) 글이
+    이미 본 글일 때 그 뒤 페이지도 모두 본 글로 판단합니다.
+
+    새 번호는 commit()을 호출해야 인덱스에 기록됩니다. 중간에 멈추거나 실패한 페이지가 있으면
+    commit()하지 않아야 다음 크롤링에서 빠진 구간을 다시 읽습니다.
+    """
+    def __init__(self, index, scope):
+        self.index = index
+        self.scope = scope
+        self.pending = set()
+        self.reached_seen = False
+
+    def check_page(self, page_post_ids):
+        page_post_ids = [str(post_id) for post_id in page_post_ids if post_id is not None]
+        new_ids = self.index.unseen(self.scope, page_post_ids) - self.pending
+        self.pending.update(new_ids)
+        if page_post_ids and page_post_ids[-1] not in self.pending:
+            self.reached_seen = True
+        return new_ids, self.reached_seen
+
+    def commit(self):
+        """이번 크롤링에서 새로 본 게시글 번호를 인덱스에 기록하고 개수를 반환"""
+        added = self.index.add(self.scope, self.pending)
+        self.pending.clear()
+        return added
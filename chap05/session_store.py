@@ -0,0 +1,98 @@
+"""
+GUI 세션 저장소
+
+창을 닫을 때 마지막 크롤링 결과를 Arrow IPC(feather) 파일로 저장해 두고,
+다음에 실행하면 메모리 맵으로 바로 열어서 크롤링 없이 테이블을 채웁니다.
+페이지별 HTML 해시도 같이 저장해서, 백그라운드 새로고침 때 내용이 같은 페이지는
+다시 파싱하지 않고 저장된 행을 그대로 씁니다.
+최근 keep_snapshots개의 결과는 snapshots 폴더에 따로 보관합니다.
+(pyarrow가 없으면 CSV로 저장)
+"""
+import glob
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from result_export import DEFAULT_EXTENSIONS, HAS_PYARROW, load_frame, save_frame
+
+DEFAULT_SESSION_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.kospi200_session')
+
+SESSION_FORMAT = 'feather' if HAS_PYARROW else 'csv'
+
+# 보관할 최근 결과 수
+DEFAULT_KEEP_SNAPSHOTS = 5
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def page_hash(html):
+    """페이지 HTML 내용 해시 (내용이 바뀌었는지 비교용)"""
+    return hashlib.blake2b(html.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class SessionStore:
+    """
+    마지막 크롤링 결과와 최근 결과 몇 개를 보관하는 세션 저장소
+
+    last_crawl.<확장자>: 마지막 결과 DataFrame
+    last_crawl.json: 수집 시각, 행 수, 페이지 수, 페이지별 HTML 해시 ('지수:페이지' → 해시)
+    snapshots/: 최근 keep_snapshots개 결과
+    """
+    def __init__(self, directory=DEFAULT_SESSION_DIR, keep_snapshots=DEFAULT_KEEP_SNAPSHOTS):
+        self.directory = directory
+        self.keep_snapshots = keep_snapshots
+        self.extension = DEFAULT_EXTENSIONS[SESSION_FORMAT]
+        self.data_path = os.path.join(directory, 'last_crawl' + self.extension)
+        self.meta_path = os.path.join(directory, 'last_crawl.json')
+        self.snapshot_dir = os.path.join(directory, 'snapshots')
+
+    def save(self, df, page_hashes=None, crawled_at=None):
+        """결과를 저장 (임시 파일에 쓴 뒤 교체해서 저장 도중 종료돼도 이전 세션이 남음)"""
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        crawled_at = crawled_at or datetime.now()
+
+        temp_path = os.path.join(self.directory, 'last_crawl.tmp' + self.extension)
+        save_frame(df, temp_path)
+        os.replace(temp_path, self.data_path)
+
+        meta = {
+            'crawled_at': crawled_at.strftime(TIME_FORMAT),
+            'rows': len(df),
+            'pages': int(df['페이지'].max()) if '페이지' in df.columns and len(df) else 0,
+            'page_hashes': {str(page): digest for page, digest in (page_hashes or {}).items()},
+        }
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+        snapshot_name = f"snapshot_{crawled_at.strftime('%Y%m%d_%H%M%S')}{self.extension}"
+        # 같은 크롤링 결과를 모니터링으로 고친 경우에도 같은 이름으로 덮어씀
+        save_frame(df, os.path.join(self.snapshot_dir, snapshot_name))
+        self._prune()
+        return meta
+
+    def load(self):
+        """(DataFrame, 메타 정보)를 반환 (저장된 세션이 없거나 읽을 수 없으면 (None, None))"""
+        if not os.path.exists(self.data_path) or not os.path.exists(self.meta_path):
+            return None, None
+        try:
+            with open(self.meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            df = load_frame(self.data_path)
+        except (OSError, ValueError) as e:
+            print(f"세션을 불러오지 못했습니다: {e}")
+            return None, None
+
+        meta.setdefault('page_hashes', {})
+        return df, meta
+
+    def snapshots(self):
+        """보관 중인 최근 결과 파일 목록 (오래된 것부터)"""
+        return sorted(glob.glob(os.path.join(self.snapshot_dir, 'snapshot_*' + self.extension)))
+
+    def load_snapshot(self, path):
+        return load_frame(path)
+
+    def _prune(self):
+        for path in self.snapshots()[:-self.keep_snapshots or None]:
+            os.remove(path)
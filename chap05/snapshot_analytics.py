@@ -0,0 +1,148 @@
+"""
+코스피200 스냅샷 분석 모듈
+
+스냅샷 저장소(snapshot_store)에 쌓인 시세로 종목별 수익률, 회전율(거래대금/시가총액),
+지수 내 시가총액 비중, 이동 변동성, 상승/하락 상위 종목을 계산합니다.
+
+새 스냅샷이 저장되면 그 뒤에 저장된 행(id 기준)만 읽어서 수집시각 × 종목 행렬 조각으로 만들고,
+수익률은 새 행만, 변동성은 최근 window개 수익률만 다시 계산합니다.
+전체 이력 행렬은 조각 목록으로 보관했다가 prices/returns를 조회할 때만 합치므로
+이력이 길어져도 업데이트 시간은 거의 일정합니다.
+
+저장소는 값이 바뀐 종목만 저장하므로, 저장되지 않은 종목은 직전 값이 그대로 유지된 것으로 봅니다.
+"""
+import numpy as np
+import pandas as pd
+
+# 변동성을 계산할 최근 수익률 개수
+DEFAULT_WINDOW = 20
+
+# 네이버 금융 표시 단위 (거래대금: 백만원, 시가총액: 억원)
+TRADE_VALUE_UNIT = 1_000_000
+MARKET_CAP_UNIT = 100_000_000
+
+SUMMARY_COLUMNS = ['현재가', '수익률(%)', '누적수익률(%)', '회전율(%)', '비중(%)', '변동성(%)']
+
+
+class SnapshotAnalytics:
+    """
+    스냅샷 저장소의 한 source(기본: 코스피200 편입종목)에 대한 분석 결과를 보관하는 클래스
+
+    update()를 호출하면 지난번 이후 저장된 행만 반영하고, summary()는 다음 update()까지 캐시됩니다.
+
+    prices: 수집시각 × 종목 현재가 (저장되지 않은 시점은 직전 값으로 채움)
+    returns: 수집시각 × 종목 직전 스냅샷 대비 수익률(%)
+    """
+    def __init__(self, store, source='entryJongmok', window=DEFAULT_WINDOW):
+        self.store = store
+        self.source = source
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        """계산 결과를 모두 지우기 (다음 update()에서 전체 이력을 다시 읽음)"""
+        self._price_blocks = []
+        self._return_blocks = []
+        self.last_prices = pd.DataFrame(dtype='float64')
+        self.recent_returns = pd.DataFrame(dtype='float64')
+        self.first_prices = pd.Series(dtype='float64')
+        self.latest = pd.DataFrame(columns=['거래대금', '시가총액'], dtype='float64')
+        self.volatility = pd.Series(dtype='float64')
+        self._last_id = 0
+        self._summary = None
+
+    @property
+    def prices(self):
+        return self._merge_blocks(self._price_blocks)
+
+    @property
+    def returns(self):
+        return self._merge_blocks(self._return_blocks)
+
+    @staticmethod
+    def _merge_blocks(blocks):
+        """조각을 하나로 합쳐서 다음 조회 때는 다시 합치지 않도록 보관"""
+        if not blocks:
+            return pd.DataFrame(dtype='float64')
+        if len(blocks) > 1:
+            blocks[:] = [pd.concat(blocks)]
+        return blocks[0]
+
+    def update(self):
+        """
+        지난번 update() 이후 저장된 행을 반영하고 반영한 행 수를 반환
+
+        예전 CSV를 가져와서 마지막 수집시각보다 이른 행이 들어온 경우에는 전체를 다시 계산합니다.
+        """
+        changes = self.store.changes_since(self._last_id, self.source)
+        if changes.empty:
+            return 0
+
+        if len(self.last_prices) and changes['수집시각'].min() <= self.last_prices.index[-1]:
+            self.reset()
+            changes = self.store.changes_since(0, self.source)
+
+        changes = changes.sort_values(['수집시각', 'id'], kind='stable')
+        self._last_id = int(changes['id'].max())
+        self._summary = None
+
+        # 새 행을 수집시각 × 종목 행렬로 바꾸고 직전 가격 행에 이어서 빈 칸을 채움
+        new_prices = changes.pivot_table(index='수집시각', columns='종목명', values='현재가',
+                                         aggfunc='last').astype('float64')
+        previous = self.last_prices
+        block = pd.concat([previous, new_prices]).ffill()
+        new_returns = block.pct_change(fill_method=None).iloc[len(previous):] * 100
+
+        self._price_blocks.append(block.iloc[len(previous):])
+        self._return_blocks.append(new_returns)
+        self.last_prices = block.tail(1)
+        self.first_prices = self.first_prices.combine_first(new_prices.bfill().iloc[0])
+
+        # 변동성은 최근 window개 수익률만으로 다시 계산
+        self.recent_returns = pd.concat([self.recent_returns, new_returns]).tail(self.window)
+        self.volatility = self.recent_returns.std(ddof=1)
+
+        last_values = changes.drop_duplicates('종목명', keep='last').set_index('종목명')[['거래대금', '시가총액']]
+        self.latest = last_values.astype('float64').combine_first(self.latest)
+        return len(changes)
+
+    def summary(self):
+        """종목별 현재가, 수익률, 누적수익률, 회전율, 비중, 변동성 (종목명 인덱스, 캐시됨)"""
+        if self._summary is not None:
+            return self._summary
+        if self.last_prices.empty:
+            return pd.DataFrame(columns=SUMMARY_COLUMNS)
+
+        last_prices = self.last_prices.iloc[-1]
+        latest = self.latest.reindex(last_prices.index)
+        market_caps = latest['시가총액']
+
+        summary = pd.DataFrame({
+            '현재가': last_prices,
+            '수익률(%)': self.recent_returns.iloc[-1],
+            '누적수익률(%)': (last_prices / self.first_prices.reindex(last_prices.index) - 1) * 100,
+            '회전율(%)': latest['거래대금'] * TRADE_VALUE_UNIT / (market_caps * MARKET_CAP_UNIT) * 100,
+            '비중(%)': market_caps / market_caps.sum() * 100,
+            '변동성(%)': self.volatility.reindex(last_prices.index),
+        })
+        summary = summary.replace([np.inf, -np.inf], np.nan)
+        summary.index.name = '종목명'
+        self._summary = summary
+        return summary
+
+    def top_movers(self, n=5, column='누적수익률(%)'):
+        """column 기준 상승 상위 n개와 하락 상위 n개 종목 (상승, 하락) DataFrame"""
+        summary = self.summary().dropna(subset=[column])
+        return summary.nlargest(n, column), summary.nsmallest(n, column)
+
+    def rolling_volatility(self, window=None):
+        """수집시각 × 종목 이동 변동성(%) (최근 window개 수익률의 표준편차)"""
+        return self.returns.rolling(window or self.window, min_periods=2).std()
+
+    def movers_text(self, n=3, column='누적수익률(%)'):
+        """'상승: A +3.10%, B +2.00% / 하락: C -1.20%' 형태의 요약"""
+        gainers, losers = self.top_movers(n, column)
+
+        def describe(frame):
+            return ', '.join(f"{name} {value:+.2f}%" for name, value in frame[column].items()) or '없음'
+        return f"상승: {describe(gainers)} / 하락: {describe(losers)}"
@@ -0,0 +1,256 @@
+"""
+코스피200 스냅샷 저장소
+
+크롤링할 때마다 새 CSV 파일을 만드는 대신 SQLite 파일 하나에 시세를
+이어서 저장(append-only)합니다. 같은 종목의 값이 직전 저장분과 같으면
+다시 저장하지 않고, 종목명/수집시각 인덱스로 "종목 X의 기간별 가격 이력"을
+바로 조회할 수 있습니다.
+
+실행: python snapshot_store.py  (chap05의 기존 CSV 파일을 저장소로 가져오기)
+"""
+import glob
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+from crawler_normalize import normalize_stock_frame
+
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kospi200_snapshots.sqlite3')
+
+# DataFrame 컬럼 -> 저장소 컬럼
+FIELD_COLUMNS = {
+    '현재가': 'price',
+    '전일비': 'change',
+    '등락률': 'change_rate',
+    '거래량': 'volume',
+    '거래대금': 'trade_value',
+    '시가총액': 'market_cap',
+}
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+FILENAME_TIME_PATTERN = re.compile(r'(\d{8}_\d{6})')
+
+
+def _plain(value):
+    """numpy 값을 SQLite에 넣을 수 있는 파이썬 값으로 변환"""
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _to_time_text(value, end_of_day=False):
+    """datetime 또는 'YYYY-MM-DD[ HH:MM:SS]' 문자열을 저장 형식으로 변환"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.strftime(TIME_FORMAT)
+
+    text = str(value).strip()
+    if len(text) == 10:
+        text += ' 23:59:59' if end_of_day else ' 00:00:00'
+    return text
+
+
+class SnapshotStore:
+    """
+    SQLite 기반 시세 스냅샷 저장소
+
+    snapshots: 수집된 행 (source, 종목명, 수집시각, 시세 컬럼)
+    latest_rows: source/종목별 마지막 저장 행의 해시 (변경 없는 행 건너뛰기용)
+    """
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL,
+                captured_at TEXT NOT NULL,
+                stock_name TEXT NOT NULL,
+                price NUMERIC,
+                change NUMERIC,
+                change_rate NUMERIC,
+                volume NUMERIC,
+                trade_value NUMERIC,
+                market_cap NUMERIC
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS latest_rows (
+                source TEXT NOT NULL,
+                stock_name TEXT NOT NULL,
+                row_hash TEXT NOT NULL,
+                PRIMARY KEY (source, stock_name)
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_stock_time ON snapshots (stock_name, captured_at)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_snapshots_time ON snapshots (captured_at)")
+        self.conn.commit()
+
+    def append(self, df, source='entryJongmok', captured_at=None):
+        """
+        DataFrame의 행을 저장소에 추가하는 함수
+
+        직전에 저장된 같은 종목의 값과 같은 행은 건너뜁니다.
+        반환값: (저장한 행 수, 건너뛴 행 수)
+        """
+        if df is None or df.empty or '종목명' not in df.columns:
+            return 0, 0
+
+        df = normalize_stock_frame(df)
+        captured_at = _to_time_text(captured_at or datetime.now())
+        fields = [column for column in FIELD_COLUMNS if column in df.columns]
+        db_columns = [FIELD_COLUMNS[column] for column in fields]
+
+        rows = []
+        for name, *values in df[['종목명'] + fields].itertuples(index=False, name=None):
+            values = [_plain(value) for value in values]
+            # 문자열로 남은 값(숫자로 변환 실패)은 저장하지 않음
+            values = [value if not isinstance(value, str) else None for value in values]
+            row_hash = hashlib.sha1(repr((db_columns, values)).encode('utf-8')).hexdigest()
+            rows.append((str(name), values, row_hash))
+
+        inserted = 0
+        with self.lock:
+            latest = dict(self.conn.execute(
+                "SELECT stock_name, row_hash FROM latest_rows WHERE source = ?", (source,)
+            ).fetchall())
+
+            placeholders = ', '.join('?' * (len(db_columns) + 3))
+            insert_sql = (f"INSERT INTO snapshots (source, captured_at, stock_name{''.join(', ' + c for c in db_columns)}) "
+                          f"VALUES ({placeholders})")
+
+            for name, values, row_hash in rows:
+                if latest.get(name) == row_hash:
+                    continue
+                self.conn.execute(insert_sql, [source, captured_at, name] + values)
+                self.conn.execute("INSERT OR REPLACE INTO latest_rows VALUES (?, ?, ?)", (source, name, row_hash))
+                latest[name] = row_hash
+                inserted += 1
+            self.conn.commit()
+
+        return inserted, len(rows) - inserted
+
+    def price_history(self, stock_name, start=None, end=None, source=None):
+        """
+        종목의 기간별 시세 이력을 DataFrame으로 반환하는 함수
+
+        start/end는 datetime 또는 'YYYY-MM-DD[ HH:MM:SS]' 문자열이며,
+        날짜만 주면 end는 그날 23:59:59까지 포함합니다.
+        값이 바뀐 시점의 행만 저장되므로 각 행은 다음 행 전까지 유지된 값입니다.
+        """
+        sql = "SELECT captured_at, source, stock_name, " + ', '.join(FIELD_COLUMNS.values()) + \
+              " FROM snapshots WHERE stock_name = ?"
+        params = [stock_name]
+
+        if start is not None:
+            sql += " AND captured_at >= ?"
+            params.append(_to_time_text(start))
+        if end is not None:
+            sql += " AND captured_at <= ?"
+            params.append(_to_time_text(end, end_of_day=True))
+        if source is not None:
+            sql += " AND source = ?"
+            params.append(source)
+        sql += " ORDER BY captured_at, id"
+
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+
+        columns = ['수집시각', '소스', '종목명'] + list(FIELD_COLUMNS)
+        df = pd.DataFrame(rows, columns=columns)
+        df['수집시각'] = pd.to_datetime(df['수집시각'])
+        return df
+
+    def changes_since(self, last_id=0, source=None):
+        """
+        id가 last_id보다 큰 (그 뒤에 저장된) 행을 저장 순서대로 반환하는 함수
+
+        분석 모듈이 새로 들어온 행만 읽어서 계산을 이어 갈 때 사용합니다.
+        반환 DataFrame의 id 컬럼 최댓값을 다음 호출의 last_id로 넘깁니다.
+        """
+        sql = "SELECT id, captured_at, source, stock_name, " + ', '.join(FIELD_COLUMNS.values()) + \
+              " FROM snapshots WHERE id > ?"
+        params = [last_id]
+        if source is not None:
+            sql += " AND source = ?"
+            params.append(source)
+        sql += " ORDER BY id"
+
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+
+        columns = ['id', '수집시각', '소스', '종목명'] + list(FIELD_COLUMNS)
+        df = pd.DataFrame(rows, columns=columns)
+        df['수집시각'] = pd.to_datetime(df['수집시각'])
+        return df
+
+    def stock_names(self):
+        """저장된 종목명 목록"""
+        with self.lock:
+            rows = self.conn.execute("SELECT DISTINCT stock_name FROM snapshots ORDER BY stock_name").fetchall()
+        return [row[0] for row in rows]
+
+    def count(self):
+        """저장된 전체 행 수"""
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    def import_csv(self, path, source='entryJongmok'):
+        """
+        기존 크롤러가 저장한 CSV 파일을 저장소로 가져오는 함수
+
+        파일명의 YYYYMMDD_HHMMSS를 수집시각으로 사용합니다.
+        반환값: (저장한 행 수, 건너뛴 행 수). 종목 시세 형식이 아니면 (0, 0)
+        """
+        match = FILENAME_TIME_PATTERN.search(os.path.basename(path))
+        if match:
+            captured_at = datetime.strptime(match.group(1), '%Y%m%d_%H%M%S')
+        else:
+            captured_at = datetime.fromtimestamp(os.path.getmtime(path))
+
+        df = normalize_stock_frame(pd.read_csv(path, dtype=str, encoding='utf-8-sig'))
+        if '종목명' not in df.columns or '현재가' not in df.columns \
+                or not pd.api.types.is_numeric_dtype(df['현재가']):
+            return 0, 0
+
+        return self.append(df, source=source, captured_at=captured_at)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+def main():
+    """chap05 폴더의 kospi200_*.csv 파일을 저장소로 가져오기"""
+    store = SnapshotStore()
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+
+    for path in sorted(glob.glob(os.path.join(base_dir, 'kospi200_*.csv'))):
+        inserted, skipped = store.import_csv(path)
+        print(f"{os.path.basename(path)}: {inserted}행 저장, {skipped}행 변경 없음")
+
+    print(f"\n저장소: {store.path}")
+    print(f"총 {store.count()}행, {len(store.stock_names())}개 종목")
+
+    names = store.stock_names()
+    if names:
+        print(f"\n[{names[0]} 가격 이력]")
+        print(store.price_history(names[0]).to_string(index=False))
+
+    store.close()
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
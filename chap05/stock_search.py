@@ -0,0 +1,152 @@
+"""
+종목명 검색 인덱스
+
+종목명을 한 번만 색인해 두고 입력할 때마다 인덱스에서 바로 찾습니다.
+  - 접두어 트라이: '삼성' → 삼성전자, 삼성SDI ... (앞부분이 맞는 종목을 먼저 보여 줌)
+  - 2-gram 역색인: '전자' → 삼성전자, LG전자 ... (중간에 들어간 검색어)
+  - 초성 검색: 'ㅅㅅㅈㅈ' → 삼성전자
+검색 결과는 DataFrame 행 필터(bool 배열)로 바꿔서 테이블 모델에 넘깁니다.
+"""
+import numpy as np
+import pandas as pd
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+
+HANGUL_START = 0xAC00
+HANGUL_END = 0xD7A3
+# 초성 하나에 해당하는 음절 수 (중성 21 × 종성 28)
+SYLLABLES_PER_CHOSEONG = 588
+
+
+def to_choseong(text):
+    """한글 음절은 초성으로 바꾸고 나머지 글자는 그대로 둔 문자열"""
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_START <= code <= HANGUL_END:
+            chars.append(CHOSEONG[(code - HANGUL_START) // SYLLABLES_PER_CHOSEONG])
+        else:
+            chars.append(char)
+    return ''.join(chars)
+
+
+def is_choseong_query(query):
+    """검색어에 초성(자음)이 하나라도 있으면 초성 검색으로 처리"""
+    return any(char in CHOSEONG for char in query)
+
+
+def normalize_query(text):
+    """대소문자와 공백 차이를 무시하도록 정리"""
+    return ''.join(str(text).lower().split())
+
+
+def ngrams(text, n=2):
+    """text의 n-gram 집합 (n보다 짧으면 text 자체)"""
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class StockSearchIndex:
+    """
+    종목명 목록에 대한 접두어 트라이 + 2-gram 역색인
+
+    종목명마다 정리된 이름과 초성 문자열 두 가지 키를 색인합니다.
+    search()는 앞부분이 맞는 종목을 먼저, 중간이 맞는 종목을 나중에 반환하고,
+    직전 검색어에 글자를 덧붙인 검색어는 직전 결과 안에서만 찾습니다.
+    """
+    def __init__(self, names=()):
+        self.names = []
+        self._ids = {}
+        self._keys = ([], [])
+        self._tries = ({}, {})
+        self._grams = ({}, {})
+        self._last_query = None
+        self._last_ids = None
+        for name in names:
+            if pd.notna(name):
+                self.add(name)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, name):
+        """종목명 하나를 색인에 추가 (이미 있는 종목명은 무시)"""
+        name = str(name)
+        if name in self._ids:
+            return
+        name_id = len(self.names)
+        self.names.append(name)
+        self._ids[name] = name_id
+        key = normalize_query(name)
+
+        for kind, text in enumerate((key, to_choseong(key))):
+            self._keys[kind].append(text)
+
+            node = self._tries[kind]
+            for char in text:
+                node = node.setdefault(char, {'': []})
+                node[''].append(name_id)
+
+            for gram in ngrams(text) | set(text):
+                self._grams[kind].setdefault(gram, []).append(name_id)
+
+        self._last_query = None
+
+    def search(self, query):
+        """검색어에 맞는 종목명 목록 (앞부분 일치 → 부분 일치 순서)"""
+        query = normalize_query(query)
+        if not query:
+            return list(self.names)
+
+        kind = 1 if is_choseong_query(query) else 0
+        if kind == 1:
+            query = to_choseong(query)
+
+        last_kind, last_query = self._last_query or (None, None)
+        if last_kind == kind and query.startswith(last_query):
+            # 입력 중인 검색어: 직전 결과 안에서만 확인
+            candidates = self._last_ids
+        else:
+            candidates = self._candidates(kind, query)
+
+        keys = self._keys[kind]
+        matched = [name_id for name_id in candidates if query in keys[name_id]]
+        self._last_query = (kind, query)
+        self._last_ids = matched
+
+        prefix = set(self._prefix_ids(kind, query))
+        ordered = [name_id for name_id in matched if name_id in prefix]
+        ordered.extend(name_id for name_id in matched if name_id not in prefix)
+        return [self.names[name_id] for name_id in ordered]
+
+    def mask(self, series, query):
+        """series(종목명 컬럼)에서 검색어에 맞는 행을 True로 표시한 bool 배열"""
+        matched = self.search(query)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # 카테고리별로 한 번만 비교하고 코드로 행 전체에 펼침
+            hits = np.asarray(series.cat.categories.astype(str).isin(matched))
+            codes = series.cat.codes.to_numpy()
+            return np.where(codes >= 0, hits[codes], False)
+        return series.astype(str).isin(matched).to_numpy()
+
+    def _prefix_ids(self, kind, query):
+        node = self._tries[kind]
+        for char in query:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node['']
+
+    def _candidates(self, kind, query):
+        # 검색어의 모든 2-gram을 포함하는 종목 (가장 짧은 목록부터 교집합)
+        postings = [self._grams[kind].get(gram) for gram in ngrams(query)]
+        if not postings or any(posting is None for posting in postings):
+            return []
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result.intersection_update(posting)
+            if not result:
+                break
+        return sorted(result)
@@ -0,0 +1,202 @@
+"""
+pandas DataFrame을 그대로 보여 주는 Qt 테이블 모델
+
+QTableWidget처럼 셀마다 QTableWidgetItem을 만들지 않고,
+QTableView가 화면에 보이는 셀을 그릴 때만 data()로 값을 꺼내 문자열로 바꿉니다.
+정렬과 필터는 원본 행 위치 배열(numpy)을 한 번에 계산해서 바꾸기 때문에
+100만 행 스냅샷 이력도 이벤트 루프를 멈추지 않고 표시할 수 있습니다.
+"""
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from crawler_normalize import format_stock_value
+
+# 컬럼 너비를 계산할 때 살펴볼 최대 행 수
+WIDTH_SAMPLE_ROWS = 200
+
+# 컬럼 너비 상한 (픽셀)
+MAX_COLUMN_WIDTH = 300
+
+
+class DataFrameTableModel(QAbstractTableModel):
+    """
+    DataFrame 기반 읽기 전용 테이블 모델
+
+    화면 행 → 원본 행 위치는 self._rows(정렬 후 필터를 통과한 위치 배열)로 바꿉니다.
+    sort()는 QTableView 헤더 클릭으로 호출되며 column이 -1이면 원래 순서로 돌아갑니다.
+    """
+    def __init__(self, df=None, parent=None):
+        super().__init__(parent)
+        self._df = pd.DataFrame()
+        self._arrays = []
+        self._order = np.arange(0)
+        self._mask = None
+        self._rows = self._order
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        if df is not None:
+            self.set_frame(df)
+
+    def frame(self):
+        """현재 모델이 가진 DataFrame (필터/정렬 전 원본)"""
+        return self._df
+
+    def set_frame(self, df):
+        """표시할 DataFrame 교체 (정렬과 필터는 초기화)"""
+        self.beginResetModel()
+        self._load(df)
+        self._order = np.arange(len(df))
+        self._mask = None
+        self._sort_column = -1
+        self._rows = self._order
+        self.endResetModel()
+
+    def update_frame(self, df, positions=None):
+        """
+        행 수가 같은 DataFrame으로 바꾸고 positions(원본 행 위치)의 셀만 다시 그리기
+
+        모니터링처럼 일부 종목 값만 바뀐 경우 전체를 다시 만들지 않습니다.
+        (행 구성이 같으므로 필터는 유지하고, 정렬 중이면 바뀐 값으로 다시 정렬)
+        positions가 None이면 행 순서/값이 모두 바뀐 것으로 보고 현재 정렬 컬럼으로 다시 정렬합니다.
+        이때 예전 행 기준인 필터는 해제되므로 호출한 쪽에서 새 데이터로 set_filter()를 다시 적용해야 합니다.
+        """
+        if len(df) != len(self._df):
+            self.set_frame(df)
+            return
+
+        if positions is None or self._sort_column >= 0:
+            self.layoutAboutToBeChanged.emit()
+            self._load(df)
+            if positions is None:
+                self._mask = None
+            self._apply_sort()
+            self.layoutChanged.emit()
+            if self.rowCount() > 0:
+                self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1))
+            return
+
+        self._load(df)
+        view_rows = np.flatnonzero(np.isin(self._rows, np.asarray(positions, dtype=np.int64)))
+        last_column = self.columnCount() - 1
+        for row in view_rows:
+            self.dataChanged.emit(self.index(int(row), 0), self.index(int(row), last_column))
+
+    def append_frame(self, df):
+        """df의 행을 원본 뒤에 이어 붙이기 (정렬/필터가 없을 때는 새 행만 추가 알림)"""
+        if df is None or df.empty:
+            return
+        if self._df.empty:
+            self.set_frame(df)
+            return
+
+        combined = pd.concat([self._df, df], ignore_index=True)
+        if self._sort_column >= 0 or self._mask is not None:
+            self.layoutAboutToBeChanged.emit()
+            self._load(combined)
+            self._order = np.arange(len(combined))
+            self._mask = None
+            self._apply_sort()
+            self.layoutChanged.emit()
+            return
+
+        start = len(self._df)
+        self.beginInsertRows(QModelIndex(), start, start + len(df) - 1)
+        self._load(combined)
+        self._order = np.arange(len(combined))
+        self._rows = self._order
+        self.endInsertRows()
+
+    def set_filter(self, mask=None):
+        """
+        mask(원본 행 순서의 bool 배열)가 True인 행만 표시 (None이면 전체 표시)
+
+        데이터는 그대로 두고 화면 행 목록만 바꿉니다.
+        """
+        self.beginResetModel()
+        self._mask = None if mask is None else np.asarray(mask, dtype=bool)
+        self._update_rows()
+        self.endResetModel()
+
+    def visible_count(self):
+        """필터를 통과해서 화면에 보이는 행 수"""
+        return len(self._rows)
+
+    def source_row(self, view_row):
+        """화면 행 번호 → 원본 DataFrame 행 위치"""
+        return int(self._rows[view_row])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._arrays)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            value = self._arrays[index.column()][self._rows[index.row()]]
+            return format_stock_value(self._df.columns[index.column()], value)
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """컬럼 값으로 정렬 (결측값은 항상 마지막, 같은 값은 원래 순서 유지)"""
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column
+        self._sort_order = order
+        self._apply_sort()
+        self.layoutChanged.emit()
+
+    def _load(self, df):
+        self._df = df
+        # 셀 조회가 빠르도록 컬럼별 배열을 미리 꺼내 둠 (숫자 컬럼은 복사 없음)
+        self._arrays = [df[column].array for column in df.columns]
+
+    def _apply_sort(self):
+        if self._sort_column < 0 or self._sort_column >= len(self._df.columns):
+            self._order = np.arange(len(self._df))
+        else:
+            values = self._df.iloc[:, self._sort_column].reset_index(drop=True)
+            ascending = self._sort_order == Qt.AscendingOrder
+            self._order = values.sort_values(ascending=ascending, kind='stable',
+                                             na_position='last').index.to_numpy()
+        self._update_rows()
+
+    def _update_rows(self):
+        if self._mask is None or len(self._mask) != len(self._order):
+            self._rows = self._order
+        else:
+            self._rows = self._order[self._mask[self._order]]
+
+
+def sample_column_widths(model, font_metrics, sample_rows=WIDTH_SAMPLE_ROWS, max_width=MAX_COLUMN_WIDTH):
+    """
+    앞부분과 임의로 고른 일부 행만 보고 컬럼 너비(픽셀)를 계산하는 함수
+
+    ResizeToContents처럼 모든 행을 측정하지 않으므로 행 수와 관계없이 일정한 시간이 걸립니다.
+    """
+    row_count = model.rowCount()
+    if row_count <= sample_rows:
+        rows = range(row_count)
+    else:
+        head = sample_rows // 2
+        rng = np.random.default_rng(0)
+        rows = list(range(head)) + sorted(rng.choice(np.arange(head, row_count), sample_rows - head, replace=False))
+
+    widths = []
+    for column in range(model.columnCount()):
+        texts = [model.headerData(column, Qt.Horizontal)]
+        texts.extend(model.data(model.index(int(row), column)) for row in rows)
+        longest = max(font_metrics.horizontalAdvance(text) for text in texts)
+        widths.append(min(longest + 24, max_width))
+    return widths
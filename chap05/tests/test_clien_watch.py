@@ -0,0 +1,129 @@
+"""
+ClienWatcher 첫 실행/보충 테스트 (benchmarks/fixtures의 기록된 응답 재생)
+
+처음 실행하면 피드를 기록만 하고 알림은 보내지 않는지, 오래 멈췄던 경우
+보충이 키워드 수와 관계없이 backfill_pages 안에서 끝나는지 확인합니다.
+
+실행: python -m pytest -q tests
+"""
+import os
+import sys
+
+import pytest
+
+CHAP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CHAP_DIR)
+sys.path.insert(0, os.path.join(CHAP_DIR, 'benchmarks'))
+import crawler_http
+import replay
+from clien_watch import FEED_SCOPE, ClienWatcher, feed_url
+from listing_parse import parse_listings
+from seen_index import SeenPostIndex
+
+KEYWORDS = ['아이폰', '맥북', 'RTX', '에어팟'] + [f"모델{i:04d}" for i in range(100)]
+
+
+class ListSink:
+    def __init__(self):
+        self.alerts = []
+
+    def emit(self, alert):
+        self.alerts.append(alert)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope='module', autouse=True)
+def replay_server():
+    server = replay.start_replay_server()
+    crawler_http.configure(url_rewriter=replay.replay_rewriter(server.base_url))
+    yield server
+    crawler_http.configure(url_rewriter=lambda url: url)
+    server.shutdown()
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SeenPostIndex(str(tmp_path / 'seen.sqlite3'))
+    yield index
+    index.close()
+
+
+def make_watcher(index, sink, messages, **options):
+    return ClienWatcher(KEYWORDS, [sink], seen_index=index, rate_limit=1000, log=messages.append, **options)
+
+
+def feed_post_ids(page):
+    return [listing['post_id'] for listing in parse_listings(crawler_http.fetch_text(feed_url(page)), page)]
+
+
+def test_first_run_seeds_without_alerts(index):
+    sink, messages = ListSink(), []
+    watcher = make_watcher(index, sink, messages)
+
+    assert watcher.poll() == []
+    assert sink.alerts == []
+    assert watcher.last_poll['feed_pages'] == 1
+    assert index.count(FEED_SCOPE) == len(feed_post_ids(1))
+
+    # 다음 주기는 기록한 글에 바로 닿으므로 알림 없이 1페이지만 읽음
+    assert watcher.poll() == []
+    assert watcher.last_poll['feed_pages'] == 1
+    watcher.close()
+
+
+def test_gap_backfills_feed_pages(index):
+    old_ids = feed_post_ids(3)
+    index.add(FEED_SCOPE, old_ids)
+    sink, messages = ListSink(), []
+    watcher = make_watcher(index, sink, messages, feed_pages=1, backfill_pages=4, concurrency=2)
+
+    alerts = watcher.poll()
+    assert watcher.last_poll == {'feed_pages': 3, 'failed_pages': 0}
+    assert alerts and alerts == sink.alerts
+    assert not {alert['post_id'] for alert in alerts} & set(old_ids)
+    assert index.count(FEED_SCOPE) == len(set(feed_post_ids(1) + feed_post_ids(2) + old_ids))
+    watcher.close()
+
+
+def test_gap_backfill_is_capped(index):
+    index.add(FEED_SCOPE, feed_post_ids(5))
+    sink, messages = ListSink(), []
+    watcher = make_watcher(index, sink, messages, feed_pages=1, backfill_pages=1)
+
+    watcher.poll()
+    assert watcher.last_poll == {'feed_pages': 2, 'failed_pages': 0}
+    assert any('닿지 못했습니다' in message for message in messages)
+    watcher.close()
+
+
+def test_run_continues_after_poll_error(index):
+    sink, messages = ListSink(), []
+    watcher = make_watcher(index, sink, messages)
+    polls = []
+
+    def failing_poll():
+        polls.append(1)
+        if len(polls) == 1:
+            raise ValueError('깨진 페이지')
+        return []
+
+    watcher.poll = failing_poll
+    watcher.run(interval=0, cycles=2)
+    assert len(polls) == 2
+    assert any('ValueError: 깨진 페이지' in message for message in messages)
+    watcher.close()
+
+
+def test_listing_without_post_id_alerts_once(index):
+    sink, messages = ListSink(), []
+    watcher = make_watcher(index, sink, messages)
+    listings = [{'title': '아이폰 15 팝니다 90만원', 'page': 1, 'post_id': None, 'url': None},
+                {'title': '맥북 에어 M2', 'page': 1, 'post_id': None, 'url': 'https://www.clien.net/service/board/sold/x'}]
+    candidates = [(listing, watcher.matcher.find(listing['title'])) for listing in listings]
+
+    assert len(watcher.emit_alerts(candidates)) == 2
+    assert watcher.emit_alerts(candidates) == []
+    assert len(sink.alerts) == 2
+    watcher.close()
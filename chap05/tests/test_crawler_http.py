@@ -0,0 +1,114 @@
+"""
+crawler_http 취소/서킷 브레이커 테스트
+
+half-open 상태의 시험 요청을 취소해도 브레이커가 영구히 막히지 않고
+다음 요청이 다시 시험 요청으로 나갈 수 있는지 확인합니다.
+
+실행: python -m pytest -q tests
+"""
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import crawler_http
+from crawler_http import CancelToken, RequestCancelled, TokenBucket
+
+
+class StallHandler(BaseHTTPRequestHandler):
+    """/stall은 본문 일부만 보내고 멈추고, 나머지 경로는 바로 응답"""
+    protocol_version = 'HTTP/1.1'
+    stalled = threading.Event()
+
+    def do_GET(self):
+        body = b'<html>ok</html>'
+        if self.path.startswith('/stall'):
+            self.send_response(200)
+            self.send_header('Content-Length', '100000')
+            self.end_headers()
+            self.wfile.write(body)
+            self.wfile.flush()
+            StallHandler.stalled.set()
+            time.sleep(5)
+            return
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StallHandler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    crawler_http.reset_breakers()
+    StallHandler.stalled.clear()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    crawler_http.close_session()
+    crawler_http.reset_breakers()
+
+
+def open_breaker(base_url):
+    """브레이커를 열고 reset_timeout이 지난 상태(다음 요청이 시험 요청)로 만듦"""
+    breaker = crawler_http.get_breaker(base_url.split('://', 1)[1])
+    breaker.failures = breaker.failure_threshold
+    breaker.opened_at = time.monotonic() - breaker.reset_timeout - 1
+    return breaker
+
+
+def test_cancel_during_half_open_trial_releases_trial(server):
+    breaker = open_breaker(server)
+    cancel = CancelToken()
+    errors = []
+
+    def run():
+        try:
+            crawler_http.fetch(server + '/stall', cancel=cancel)
+        except Exception as e:
+            errors.append(e)
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    assert StallHandler.stalled.wait(3)
+    cancel.cancel()
+    worker.join(3)
+
+    assert not worker.is_alive()
+    assert isinstance(errors[0], RequestCancelled)
+    # 취소는 성공/실패로 세지 않음: 브레이커는 열린 채로, 시험 상태만 풀림
+    assert breaker.is_open
+    assert not breaker.trial_in_progress
+
+    response = crawler_http.fetch(server + '/ok')
+    assert response.status_code == 200
+    assert not breaker.is_open
+
+
+def test_cancel_while_waiting_for_rate_limit_releases_trial(server):
+    breaker = open_breaker(server)
+    rate_limiter = TokenBucket(rate=0.1)
+    rate_limiter.acquire()  # 다음 토큰까지 10초 대기하도록 토큰을 써 둠
+    cancel = CancelToken()
+    threading.Timer(0.2, cancel.cancel).start()
+
+    with pytest.raises(RequestCancelled):
+        crawler_http.fetch(server + '/ok', rate_limiter=rate_limiter, cancel=cancel)
+
+    assert not breaker.trial_in_progress
+    assert crawler_http.fetch(server + '/ok').status_code == 200
+    assert not breaker.is_open
+
+
+@pytest.mark.parametrize('rate', [0, -1.0])
+def test_token_bucket_rejects_non_positive_rate(rate):
+    with pytest.raises(ValueError):
+        TokenBucket(rate=rate)
@@ -0,0 +1,24 @@
+"""
+kospi200_cli 인자 검사 테스트
+
+실행: python -m pytest -q tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from kospi200_cli import parse_args
+
+
+@pytest.mark.parametrize('argv', [['--rate-limit', '0'], ['--rate-limit', '-1'],
+                                  ['--concurrency', '0'], ['--concurrency', '-2'], ['--pages', '0']])
+def test_rejects_non_positive_values(argv):
+    with pytest.raises(SystemExit):
+        parse_args(argv)
+
+
+def test_accepts_positive_values():
+    args = parse_args(['--rate-limit', '2.5', '--concurrency', '3', '--pages', '2'])
+    assert (args.rate_limit, args.concurrency, args.pages) == (2.5, 3, 2)
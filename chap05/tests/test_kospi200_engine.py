@@ -0,0 +1,34 @@
+"""
+CrawlerEngine.crawl_pages 페이지별 실패 처리 테스트
+
+형식이 깨진 페이지(파싱 오류)가 있어도 그 페이지만 실패로 남기고
+나머지 페이지는 계속 크롤링하는지 확인합니다. (네트워크 없이 crawl_page를 바꿔 끼움)
+
+실행: python -m pytest -q tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from kospi200_engine import SOURCES, CrawlerEngine
+
+
+@pytest.mark.parametrize('concurrency', [1, 3])
+def test_parse_error_fails_only_that_page(concurrency):
+    engine = CrawlerEngine(rate_limit=1000, concurrency=concurrency)
+
+    def crawl_page(source, page):
+        if page == 2:
+            raise IndexError('list index out of range')
+        return [{'종목명': f"종목{page}"}]
+
+    engine.crawl_page = crawl_page
+    errors = {}
+    results = engine.crawl_pages(SOURCES['entryJongmok'], 4,
+                                 on_page=lambda page, data, error: errors.__setitem__(page, error))
+
+    assert sorted(results) == [1, 3, 4]
+    assert engine.failed_pages == [2]
+    assert isinstance(errors[2], IndexError)
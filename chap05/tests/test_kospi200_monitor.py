@@ -0,0 +1,78 @@
+"""
+Kospi200Monitor 불완전 스냅샷 처리 테스트
+
+중지되었거나 빠진 페이지가 있는 조회는 비교/콜백 없이 건너뛰고
+직전 스냅샷을 그대로 유지하는지 확인합니다. (네트워크 없이 crawl_page를 바꿔 끼움)
+
+실행: python -m pytest -q tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from kospi200_monitor import Kospi200Monitor
+
+
+def make_page(page, price=1000):
+    return [{'종목명': f"종목{page}-{i}", '현재가': str(price + i), '전일비': '0', '등락률': '0.00%',
+             '거래량': '100', '거래대금': '10', '시가총액': '1,000'} for i in range(10)]
+
+
+def make_monitor(pages):
+    calls = []
+    monitor = Kospi200Monitor(max_pages=2, market_hours_only=False,
+                              callbacks=[lambda changes, polled_at: calls.append(changes)])
+    monitor.engine.crawl_page = lambda source, page: pages.get(page, [])
+    return monitor, calls
+
+
+def test_missing_page_skips_poll():
+    pages = {1: make_page(1), 2: make_page(2)}
+    monitor, calls = make_monitor(pages)
+    assert len(monitor.poll_once()) == 20
+    baseline = monitor.previous
+
+    del pages[2]
+    assert monitor.poll_once() == []
+    assert len(calls) == 1
+    assert monitor.previous is baseline
+    assert monitor.poll_count == 1
+
+
+def test_stop_during_fetch_skips_poll():
+    pages = {1: make_page(1), 2: make_page(2)}
+    monitor, calls = make_monitor(pages)
+    monitor.poll_once()
+    baseline = monitor.previous
+
+    def crawl_then_stop(source, page):
+        monitor.stop()
+        return pages[page]
+
+    monitor.engine.crawl_page = crawl_then_stop
+    assert monitor.poll_once() == []
+    assert len(calls) == 1
+    assert monitor.previous is baseline
+
+
+def test_max_pages_clamped_to_source():
+    monitor = Kospi200Monitor(max_pages=35, market_hours_only=False)
+    assert monitor.max_pages == monitor.source.max_pages == 20
+
+
+def test_run_continues_after_poll_error():
+    messages = []
+    monitor = Kospi200Monitor(max_pages=1, interval=0, market_hours_only=False, log=messages.append)
+    polls = []
+
+    def failing_poll():
+        polls.append(1)
+        if len(polls) == 1:
+            raise KeyError('현재가')
+        monitor.poll_count += 1
+        return []
+
+    monitor.poll_once = failing_poll
+    monitor.run(max_polls=1)
+    assert len(polls) == 2
+    assert any('KeyError' in message for message in messages)
@@ -0,0 +1,67 @@
+"""
+DataFrameTableModel.update_frame 정렬/필터 테스트
+
+스트리밍/세션 새로고침이 끝나면 순서가 다른 전체 DataFrame으로 교체되므로
+정렬은 새 데이터로 다시 계산되고, 예전 행 기준 필터는 남지 않는지 확인합니다.
+
+실행: python -m pytest -q tests
+"""
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+from stock_table_model import DataFrameTableModel
+
+
+@pytest.fixture(scope='module', autouse=True)
+def app():
+    yield QApplication.instance() or QApplication([])
+
+
+def view_names(model):
+    return [model.data(model.index(row, 0)) for row in range(model.rowCount())]
+
+
+def frame(names, prices):
+    return pd.DataFrame({'종목명': names, '현재가': prices})
+
+
+def test_update_frame_resorts_reordered_rows():
+    model = DataFrameTableModel(frame(['C', 'B', 'A'], [3, 2, 1]))
+    model.sort(1, Qt.AscendingOrder)
+    assert view_names(model) == ['A', 'B', 'C']
+
+    model.update_frame(frame(['A', 'B', 'C'], [30, 20, 10]))
+    assert view_names(model) == ['C', 'B', 'A']
+
+
+def test_update_frame_drops_stale_filter():
+    model = DataFrameTableModel(frame(['A', 'B', 'C'], [1, 2, 3]))
+    model.set_filter([True, False, False])
+    assert view_names(model) == ['A']
+
+    reordered = frame(['B', 'A', 'C'], [2, 1, 3])
+    model.update_frame(reordered)
+    assert model.visible_count() == 3
+
+    model.set_filter((reordered['종목명'] == 'A').to_numpy())
+    assert view_names(model) == ['A']
+
+
+def test_update_positions_keeps_sort_by_new_values():
+    df = frame(['A', 'B', 'C'], [1, 2, 3])
+    model = DataFrameTableModel(df)
+    model.sort(1, Qt.DescendingOrder)
+    assert view_names(model) == ['C', 'B', 'A']
+
+    df = df.copy()
+    df.loc[0, '현재가'] = 10
+    model.update_frame(df, [0])
+    assert view_names(model) == ['A', 'C', 'B']